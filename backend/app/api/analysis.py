@@ -1,11 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import time
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.api.dependencies import get_current_user
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from app.core.database import get_db, SessionLocal
+from app.api.dependencies import get_current_user, get_current_user_id
+from app.core.pagination import PageParams, set_next_cursor
 from app.models.user import User
-from app.schemas.match_result import MatchAnalysisRequest, MatchResultResponse
+from app.schemas.match_result import (
+    AnalysisJobResponse,
+    MatchAnalysisRequest,
+    MatchResultResponse,
+    RankJobDescriptionsRequest,
+    RankedJobDescriptionResponse,
+    RankedResumeResponse
+)
 from app.services.analysis_service import AnalysisService
+from app.services.analysis_job_service import AnalysisJobService, FINISHED_STATUSES
+from app.services.resume_index_service import ResumeIndexService
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
 
@@ -28,14 +41,116 @@ def analyze_resume_jd(
             detail=str(e)
         )
 
+@router.post("/jobs", response_model=AnalysisJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_analysis_job(
+    request: MatchAnalysisRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Queue an analysis and return immediately; poll the job for its result."""
+    try:
+        return AnalysisJobService.submit(
+            db, current_user.id, request.resume_id, request.job_description_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+def _load_job(job_id: int, user_id: int) -> Optional[AnalysisJobResponse]:
+    # Own short-lived session per poll; with get_current_user_id the request holds no other
+    # session, so no connection stays checked out between polls
+    db = SessionLocal()
+    try:
+        job = AnalysisJobService.get_job(db, job_id, user_id)
+        return AnalysisJobResponse.model_validate(job) if job else None
+    finally:
+        db.close()
+
+@router.get("/jobs/{job_id}", response_model=AnalysisJobResponse)
+async def get_analysis_job(
+    job_id: int,
+    wait: float = Query(0, ge=0, le=30),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Get an analysis job's status.
+    
+    With wait > 0 the request is held (up to that many seconds) until the job
+    finishes, so clients do not need to poll in a tight loop.
+    """
+    deadline = time.monotonic() + wait
+    
+    while True:
+        job = await run_in_threadpool(_load_job, job_id, user_id)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Analysis job not found"
+            )
+        if job.status in FINISHED_STATUSES or time.monotonic() >= deadline:
+            return job
+        await asyncio.sleep(min(0.5, max(deadline - time.monotonic(), 0)))
+
+@router.post("/rank", response_model=List[RankedJobDescriptionResponse])
+def rank_job_descriptions(
+    request: RankJobDescriptionsRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Rank job descriptions for one resume, best match first."""
+    try:
+        service = AnalysisService()
+        return service.rank_job_descriptions(
+            db,
+            request.resume_id,
+            current_user.id,
+            job_description_ids=request.job_description_ids,
+            persist=request.persist
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/job-descriptions/{jd_id}/top-resumes", response_model=List[RankedResumeResponse])
+def get_top_resumes(
+    jd_id: int,
+    k: int = Query(10, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the k stored resumes that best match a job description."""
+    try:
+        service = ResumeIndexService()
+        return service.top_resumes_for_job_description(db, jd_id, current_user.id, k)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @router.get("/results", response_model=List[MatchResultResponse])
 def get_match_results(
+    response: Response,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all match results for the current user."""
+    """
+    Get the current user's match results: all of them, or one page when
+    cursor/limit is passed (see PageParams).
+    
+    When more results remain, the X-Next-Cursor response header holds the
+    cursor for the next page. summary=true omits suggestions and child lists.
+    """
     service = AnalysisService()
-    results = service.get_match_results(db, current_user.id)
+    results = service.get_match_results(
+        db, current_user.id, cursor=page.cursor, limit=page.limit, summary=page.summary
+    )
+    set_next_cursor(response, results, page)
     return results
 
 @router.get("/results/{result_id}", response_model=MatchResultResponse)
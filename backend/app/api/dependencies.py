@@ -1,22 +1,50 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from typing import Dict, Hashable, Optional, Tuple
+from app.core.config import settings
+from app.core.database import get_db, get_async_db, SessionLocal
 from app.core.security import decode_access_token
+from app.core.user_cache import UserCache
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
+# Resolved users by token subject, so most requests skip the user lookup entirely
+user_cache = UserCache(ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
+
+# session.info key for the users changed in the session's current transaction
+CHANGED_USER_IDS = "changed_user_ids"
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _record_changed_user(mapper, connection, target: User):
+    # Flushed changes are not visible to other requests yet; invalidating now
+    # would let one of them re-cache the old row before this transaction commits
+    object_session(target).info.setdefault(CHANGED_USER_IDS, set()).add(target.id)
+
+# Both events also fire for savepoints, which leave the outer transaction open
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session):
+    if session.get_nested_transaction() is None:
+        for user_id in session.info.pop(CHANGED_USER_IDS, ()):
+            user_cache.invalidate(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session):
+    if session.get_nested_transaction() is None:
+        session.info.pop(CHANGED_USER_IDS, None)
+
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+def _subject_from_token(token: str) -> Tuple[str, Optional[int]]:
+    """Return the token's email and, for tokens that carry it, the user id."""
     payload = decode_access_token(token)
     if payload is None:
         raise credentials_exception
@@ -25,9 +53,92 @@ def get_current_user(
     if email is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
-    if user is None:
+    user_id = payload.get("uid")
+    return email, user_id if isinstance(user_id, int) else None
+
+def _cache_key(email: str, user_id: Optional[int]) -> Hashable:
+    return ("uid", user_id) if user_id is not None else ("sub", email)
+
+def _snapshot(user: User) -> Dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+def _from_snapshot(values: Dict) -> User:
+    """A detached User with a persistent identity, ready to merge without a SELECT."""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+def _check_user(user: Optional[User], email: str) -> User:
+    # A token issued before an email change must not resolve to the renamed account
+    if user is None or user.email != email:
         raise credentials_exception
+    return user
+
+def _load_user(db: Session, email: str, user_id: Optional[int], key: Hashable) -> User:
+    if user_id is not None:
+        user = db.get(User, user_id)
+    else:
+        user = db.query(User).filter(User.email == email).first()
+    user = _check_user(user, email)
+    
+    user_cache.put(key, _snapshot(user))
+    return user
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> User:
+    email, user_id = _subject_from_token(token)
+    key = _cache_key(email, user_id)
+    
+    cached = user_cache.get(key)
+    if cached is not None:
+        return _check_user(db.merge(_from_snapshot(cached), load=False), email)
+    
+    return _load_user(db, email, user_id, key)
+
+def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """
+    Resolve the current user's id without a request-scoped session.
+    
+    For long-running requests (e.g. long polls): a cache miss is looked up
+    in a session that is closed before the dependency returns, so no
+    connection stays checked out while the request waits.
+    """
+    email, user_id = _subject_from_token(token)
+    key = _cache_key(email, user_id)
+    
+    cached = user_cache.get(key)
+    if cached is not None:
+        if cached.get("email") != email:
+            raise credentials_exception
+        return cached["id"]
+    
+    db = SessionLocal()
+    try:
+        return _load_user(db, email, user_id, key).id
+    finally:
+        db.close()
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """get_current_user for async routes, using the async session."""
+    email, user_id = _subject_from_token(token)
+    key = _cache_key(email, user_id)
+    
+    cached = user_cache.get(key)
+    if cached is not None:
+        return _check_user(await db.merge(_from_snapshot(cached), load=False), email)
+    
+    if user_id is not None:
+        user = await db.get(User, user_id)
+    else:
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalars().first()
+    user = _check_user(user, email)
     
+    user_cache.put(key, _snapshot(user))
     return user
 
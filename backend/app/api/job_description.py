@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from app.core.database import get_db
-from app.api.dependencies import get_current_user
+from app.core.database import get_db, get_async_db
+from app.api.dependencies import get_current_user, get_current_user_async
+from app.core.pagination import PageParams, keyset_page, set_next_cursor
 from app.models.user import User
 from app.models.job_description import JobDescription
 from app.schemas.job_description import JobDescriptionCreate, JobDescriptionResponse
+from app.services.document_feature_service import DocumentFeatureService
+from app.services.analysis_pool import run_cpu_bound, extract_document_features
 
 router = APIRouter(prefix="/api/job-descriptions", tags=["job-descriptions"])
 
@@ -23,30 +28,51 @@ def create_job_description(
         description=jd_data.description
     )
     db.add(jd)
+    
+    # Compute skills and vector once (on the process pool) so later matches skip text processing
+    computed = run_cpu_bound(extract_document_features, jd.description)
+    DocumentFeatureService().get_job_description_features(db, jd, computed)
+    
     db.commit()
     db.refresh(jd)
     return jd
 
 @router.get("/", response_model=List[JobDescriptionResponse])
-def get_job_descriptions(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_job_descriptions(
+    response: Response,
+    page: PageParams = Depends(),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all job descriptions for the current user."""
-    jds = db.query(JobDescription).filter(JobDescription.user_id == current_user.id).all()
+    """Get the current user's job descriptions, all or one page (summary=true omits descriptions)."""
+    if page.summary:
+        query = select(
+            JobDescription.id,
+            JobDescription.user_id,
+            JobDescription.title,
+            JobDescription.company,
+            JobDescription.created_at
+        )
+    else:
+        query = select(JobDescription)
+    query = query.where(JobDescription.user_id == current_user.id)
+    result = await db.execute(keyset_page(query, JobDescription.id, page.cursor, page.limit))
+    jds = result.all() if page.summary else result.scalars().all()
+    set_next_cursor(response, jds, page)
     return jds
 
 @router.get("/{jd_id}", response_model=JobDescriptionResponse)
-def get_job_description(
+async def get_job_description(
     jd_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific job description by ID."""
-    jd = db.query(JobDescription).filter(
+    result = await db.execute(select(JobDescription).where(
         JobDescription.id == jd_id,
         JobDescription.user_id == current_user.id
-    ).first()
+    ))
+    jd = result.scalars().first()
     if not jd:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -55,22 +81,23 @@ def get_job_description(
     return jd
 
 @router.delete("/{jd_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_job_description(
+async def delete_job_description(
     jd_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a job description."""
-    jd = db.query(JobDescription).filter(
+    result = await db.execute(select(JobDescription).where(
         JobDescription.id == jd_id,
         JobDescription.user_id == current_user.id
-    ).first()
+    ))
+    jd = result.scalars().first()
     if not jd:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job description not found"
         )
-    db.delete(jd)
-    db.commit()
+    await db.delete(jd)
+    await db.commit()
     return None
 
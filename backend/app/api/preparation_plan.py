@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
 from app.api.dependencies import get_current_user
+from app.core.pagination import PageParams, set_next_cursor
 from app.models.user import User
 from app.models.job_description import JobDescription
 from app.models.match_result import MatchResult
@@ -76,11 +77,16 @@ def create_preparation_plan(
 
 @router.get("/", response_model=List[PreparationPlanResponse])
 def get_preparation_plans(
+    response: Response,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all preparation plans for the current user."""
-    plans = PreparationPlanService.get_user_plans(db, current_user.id)
+    """Get the current user's preparation plans, all or one page (summary=true omits phases)."""
+    plans = PreparationPlanService.get_user_plans(
+        db, current_user.id, cursor=page.cursor, limit=page.limit, summary=page.summary
+    )
+    set_next_cursor(response, plans, page)
     return plans
 
 @router.get("/{plan_id}", response_model=PreparationPlanResponse)
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
+from app.core.config import settings
 from app.core.database import get_db
 from app.api.dependencies import get_current_user
+from app.core.pagination import PageParams, set_next_cursor
 from app.models.user import User
 from app.models.resume import Resume
 from app.schemas.resume import ResumeResponse
@@ -24,23 +26,39 @@ async def upload_resume(
             detail="Only PDF and DOCX files are supported"
         )
     
-    # Read file content
-    file_content = await file.read()
+    # Read file content, but never more than one byte past the limit
+    file_content = await file.read(settings.MAX_UPLOAD_BYTES + 1)
+    if len(file_content) > settings.MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File is too large. Maximum size is {settings.MAX_UPLOAD_BYTES // (1024 * 1024)} MB."
+        )
     
     # Save and process resume
     service = ResumeService()
-    resume = await service.save_resume(db, current_user.id, file.filename, file_content)
+    try:
+        resume = await service.save_resume(db, current_user.id, file.filename, file_content)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     return resume
 
 @router.get("/", response_model=List[ResumeResponse])
 def get_resumes(
+    response: Response,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all resumes for the current user."""
+    """Get the current user's resumes, all or one page (summary=true omits extracted text)."""
     service = ResumeService()
-    resumes = service.get_user_resumes(db, current_user.id)
+    resumes = service.get_user_resumes(
+        db, current_user.id, cursor=page.cursor, limit=page.limit, summary=page.summary
+    )
+    set_next_cursor(response, resumes, page)
     return resumes
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
@@ -6,6 +6,47 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-in-production-use-env-variable"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    TOKEN_INCLUDE_USER_ID: bool = True  # Add a "uid" claim so requests resolve the user by primary key
+    USER_CACHE_TTL_SECONDS: float = 30.0  # Per-process cache of authenticated users; 0 disables
+    
+    # bcrypt runs on its own small thread pool; beyond MAX_PENDING queued logins get 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    
+    # Connection pool (size/overflow/timeout are ignored for SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Replace connections before server-side idle timeouts drop them
+    DB_POOL_PRE_PING: bool = True
+    # Async engine for I/O-only routes; derived from DATABASE_URL (asyncpg / aiosqlite) if unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    
+    # Top-K resume search covers every user's resumes instead of only the caller's
+    RESUME_SEARCH_ALL_USERS: bool = False
+    # Each index sync re-reads features updated this long before the last one seen,
+    # to pick up rows committed late or stamped by a worker with a slower clock
+    RESUME_INDEX_SYNC_OVERLAP_SECONDS: float = 300.0
+    
+    # Process pool for parsing and matching; None = one worker per core, 0 = run inline
+    ANALYSIS_POOL_WORKERS: Optional[int] = None
+    ANALYSIS_POOL_MAX_PENDING: int = 64  # Queued + running tasks before requests get 503
+    ANALYSIS_POOL_TIMEOUT_SECONDS: float = 60.0
+    
+    # Resume upload limits
+    MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    MAX_RESUME_PAGES: int = 30
+    
+    # Background analysis jobs (stored in the app database, no broker needed)
+    ANALYSIS_JOB_WORKERS: int = 2  # Worker threads per API process; 0 disables
+    ANALYSIS_JOB_POLL_SECONDS: float = 1.0
+    ANALYSIS_JOB_LEASE_SECONDS: int = 300  # A running job older than this is assumed lost and retried
+    ANALYSIS_JOB_MAX_ATTEMPTS: int = 3
+    ANALYSIS_JOB_RETRY_SECONDS: float = 5.0  # First delay before retrying a job the pool was too busy for; doubles per attempt
+    
+    # List endpoints (keyset pagination, used when the client passes cursor or limit)
+    LIST_PAGE_SIZE: int = 100
+    LIST_MAX_PAGE_SIZE: int = 500
     
     class Config:
         env_file = ".env"
@@ -1,11 +1,66 @@
-from sqlalchemy import create_engine
+from typing import Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+# Async drivers used when ASYNC_DATABASE_URL is not set explicitly
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def _engine_options(url: str) -> Dict:
+    """Pool settings from Settings; SQLite keeps SQLAlchemy's defaults, which suit a local file."""
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        )
+    return options
+
+def _track_pool(target: Engine, stats: Dict[str, int]):
+    """Count new DBAPI connections and checkouts so connection churn can be watched."""
+    def on_connect(dbapi_connection, connection_record):
+        stats["connects"] += 1
+    
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats["checkouts"] += 1
+    
+    event.listen(target, "connect", on_connect)
+    event.listen(target, "checkout", on_checkout)
+
+def _pool_status(target: Engine, stats: Dict[str, int]) -> Dict:
+    status = dict(stats)
+    pool = target.pool
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return status
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+_sync_pool_stats = {"connects": 0, "checkouts": 0}
+_track_pool(engine, _sync_pool_stats)
+
+# Created on first use, so the async driver is only needed by deployments that hit async routes
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_pool_stats = {"connects": 0, "checkouts": 0}
+
 Base = declarative_base()
 
 def get_db():
@@ -15,3 +70,40 @@ def get_db():
     finally:
         db.close()
 
+def get_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver known for {url.get_backend_name()}; set ASYNC_DATABASE_URL")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        url = get_async_database_url()
+        _async_engine = create_async_engine(url, **_engine_options(url))
+        _async_session_factory = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+        _track_pool(_async_engine.sync_engine, _async_pool_stats)
+    return _async_engine
+
+async def get_async_db():
+    """Async counterpart of get_db for routes that only do database I/O."""
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+async def dispose_async_engine():
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+def get_pool_stats() -> Dict:
+    """Connection pool usage for both engines (the async one only once it has been used)."""
+    stats = {"sync": _pool_status(engine, _sync_pool_stats)}
+    if _async_engine is not None:
+        stats["async"] = _pool_status(_async_engine.sync_engine, _async_pool_stats)
+    return stats
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Optional
+
+class ExecutorBusyError(Exception):
+    """Raised when a bounded executor already has its maximum number of tasks in flight."""
+    pass
+
+class BoundedExecutor:
+    """
+    Wraps a concurrent.futures executor with a cap on queued + running tasks.
+    
+    Submitting beyond the cap fails fast with ExecutorBusyError instead of
+    growing an unbounded queue, so callers can shed load (HTTP 503) while the
+    workers catch up.
+    """
+    
+    def __init__(self, executor: Executor, max_pending: int):
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.max_pending = max_pending
+    
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise ExecutorBusyError("Too many tasks in flight")
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+    
+    def run(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Submit a task and block the calling thread until it finishes.
+        
+        On timeout the task is cancelled if it has not started yet, freeing its
+        slot; a task already running cannot be interrupted and finishes in the
+        background. The futures TimeoutError is re-raised either way.
+        """
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
+    
+    async def run_async(self, fn: Callable, *args, **kwargs) -> Any:
+        """Submit a task and await it without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+    
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,48 @@
+from fastapi import Query, Response
+from typing import Optional, Sequence, TypeVar
+from app.core.config import settings
+
+QueryT = TypeVar("QueryT")
+
+class PageParams:
+    """
+    Common query parameters for list endpoints.
+    
+    Without cursor and limit the whole list is returned, oldest first, as
+    before pagination existed. Passing either one opts into pages: limit
+    defaults to LIST_PAGE_SIZE, and a full page sets X-Next-Cursor.
+    """
+    
+    def __init__(
+        self,
+        cursor: Optional[int] = Query(None, description="Id of the last item of the previous page"),
+        limit: Optional[int] = Query(None, ge=1, le=settings.LIST_MAX_PAGE_SIZE, description="Page size; omit both cursor and limit for the full list"),
+        summary: bool = Query(False, description="Omit large text fields and nested collections")
+    ):
+        if limit is None and cursor is not None:
+            limit = settings.LIST_PAGE_SIZE
+        self.cursor = cursor
+        self.limit = limit
+        self.summary = summary
+
+def set_next_cursor(response: Response, items: Sequence, page: PageParams):
+    """Point the client at the next page when this one came back full."""
+    if page.limit is not None and len(items) == page.limit:
+        response.headers["X-Next-Cursor"] = str(items[-1].id)
+
+def keyset_page(query: QueryT, id_column, cursor: Optional[int], limit: Optional[int]) -> QueryT:
+    """
+    Restrict a query to one page ordered by id.
+    
+    Works on both ORM Query objects and 2.0-style select() statements.
+    
+    Keyset (seek) pagination: the next page starts after the last id seen, so
+    every page costs the same index range scan however deep the client goes,
+    unlike OFFSET which re-reads all skipped rows.
+    """
+    if cursor is not None:
+        query = query.filter(id_column > cursor)
+    query = query.order_by(id_column)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
@@ -1,17 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.executors import BoundedExecutor
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a few threads give real parallelism while capping
+# how much CPU login/register bursts can take from other requests
+_password_executor: Optional[BoundedExecutor] = None
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+def _get_password_executor() -> BoundedExecutor:
+    global _password_executor
+    if _password_executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="password-hash"
+        )
+        _password_executor = BoundedExecutor(executor, max_pending=settings.PASSWORD_HASH_MAX_PENDING)
+    return _password_executor
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the password executor; raises ExecutorBusyError when its queue is full."""
+    return await _get_password_executor().run_async(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the password executor; raises ExecutorBusyError when its queue is full."""
+    return await _get_password_executor().run_async(get_password_hash, password)
+
+def shutdown_password_executor():
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=True)
+        _password_executor = None
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
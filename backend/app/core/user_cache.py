@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class UserCache:
+    """
+    Short-lived in-process cache of authenticated users' column values.
+    
+    Only plain values are stored, never ORM instances, so an entry can't be
+    expired or bound to a finished request's session. Entries are dropped after
+    ttl_seconds, on explicit invalidation (once a transaction that changed the
+    user commits), or least-recently-used past max_entries.
+    Each API process has its own cache; the TTL bounds how long another
+    process's change can go unseen.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        if self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return values
+    
+    def put(self, key: Hashable, values: Dict[str, Any]):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, user_id: int):
+        """Drop every entry for a user, whichever key it was cached under."""
+        with self._lock:
+            stale = [key for key, (_, values) in self._entries.items() if values.get("id") == user_id]
+            for key in stale:
+                del self._entries[key]
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
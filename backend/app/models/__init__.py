@@ -6,5 +6,7 @@ from app.models.skill import Skill
 from app.models.syllabus import Syllabus
 from app.models.interview_question import InterviewQuestion
 from app.models.learning_resource import LearningResource
+from app.models.document_features import DocumentFeatures
+from app.models.analysis_job import AnalysisJob
 from app.models.preparation_plan import PreparationPlan, PreparationPhase, PhaseTopic
 
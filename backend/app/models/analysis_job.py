@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from datetime import datetime
+from app.core.database import Base
+
+class AnalysisJob(Base):
+    __tablename__ = "analysis_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # Plain ids rather than foreign keys: a job record outlives the rows it refers to
+    resume_id = Column(Integer, nullable=False)
+    job_description_id = Column(Integer, nullable=False)
+    status = Column(String, nullable=False, default="queued", index=True)  # "queued", "running", "succeeded", "failed"
+    match_result_id = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    run_after = Column(DateTime, nullable=True)  # A retried job is not claimed before this
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, LargeBinary, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.core.database import Base
+
+class DocumentFeatures(Base):
+    """Cached skills and TF-IDF vector for one resume or job description."""
+    __tablename__ = "document_features"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True, unique=True)
+    job_description_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=True, unique=True)
+    text_hash = Column(String(64), nullable=False)  # SHA-256 of the text the features were computed from
+    features_version = Column(String, nullable=False)  # Skill dictionary + vectorizer that produced them
+    skills = Column(Text, nullable=False)  # JSON list of skill names
+    vector_indices = Column(LargeBinary, nullable=True)  # int32 column indices of the sparse vector
+    vector_data = Column(LargeBinary, nullable=True)  # float32 values of the sparse vector
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    resume = relationship("Resume", back_populates="features")
+    job_description = relationship("JobDescription", back_populates="features")
@@ -6,7 +6,7 @@ class InterviewQuestion(Base):
     __tablename__ = "interview_questions"
     
     id = Column(Integer, primary_key=True, index=True)
-    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False)
+    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False, index=True)
     question = Column(Text, nullable=False)
     category = Column(String, nullable=True)  # "Technical", "Behavioral", "System Design"
     
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
 
 class JobDescription(Base):
     __tablename__ = "job_descriptions"
+    __table_args__ = (Index("ix_job_descriptions_user_id_id", "user_id", "id"),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -15,4 +16,5 @@ class JobDescription(Base):
     
     owner = relationship("User", back_populates="job_descriptions")
     match_results = relationship("MatchResult", back_populates="job_description", cascade="all, delete-orphan")
+    features = relationship("DocumentFeatures", back_populates="job_description", uselist=False, cascade="all, delete-orphan")
 
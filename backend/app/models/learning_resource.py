@@ -6,7 +6,7 @@ class LearningResource(Base):
     __tablename__ = "learning_resources"
     
     id = Column(Integer, primary_key=True, index=True)
-    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False)
+    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     url = Column(String, nullable=True)
     resource_type = Column(String, nullable=True)  # "Article", "Video", "Course", "Documentation"
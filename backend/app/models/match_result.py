@@ -7,8 +7,8 @@ class MatchResult(Base):
     __tablename__ = "match_results"
     
     id = Column(Integer, primary_key=True, index=True)
-    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
-    job_description_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=False)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False, index=True)
+    job_description_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=False, index=True)
     similarity_score = Column(Float, nullable=False)
     match_status = Column(String, nullable=False)  # "Good Match", "Partial Match", "Poor Match"
     correction_suggestions = Column(Text, nullable=True)
@@ -1,15 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
 
 class PreparationPlan(Base):
     __tablename__ = "preparation_plans"
+    __table_args__ = (Index("ix_preparation_plans_user_id_id", "user_id", "id"),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    job_description_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=True)
-    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=True)
+    job_description_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=True, index=True)
+    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     total_estimated_days = Column(Integer, nullable=True)
@@ -22,7 +23,7 @@ class PreparationPhase(Base):
     __tablename__ = "preparation_phases"
     
     id = Column(Integer, primary_key=True, index=True)
-    plan_id = Column(Integer, ForeignKey("preparation_plans.id"), nullable=False)
+    plan_id = Column(Integer, ForeignKey("preparation_plans.id"), nullable=False, index=True)
     phase_number = Column(Integer, nullable=False)
     phase_name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
@@ -36,7 +37,7 @@ class PhaseTopic(Base):
     __tablename__ = "phase_topics"
     
     id = Column(Integer, primary_key=True, index=True)
-    phase_id = Column(Integer, ForeignKey("preparation_phases.id"), nullable=False)
+    phase_id = Column(Integer, ForeignKey("preparation_phases.id"), nullable=False, index=True)
     topic_name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     practice_tasks = Column(Text, nullable=True)
@@ -1,18 +1,22 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
 
 class Resume(Base):
     __tablename__ = "resumes"
+    # Ownership-checked lookups and per-user listings filter on user_id and seek on id
+    __table_args__ = (Index("ix_resumes_user_id_id", "user_id", "id"),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     filename = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded bytes
     extracted_text = Column(Text, nullable=True)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
     
     owner = relationship("User", back_populates="resumes")
     match_results = relationship("MatchResult", back_populates="resume", cascade="all, delete-orphan")
+    features = relationship("DocumentFeatures", back_populates="resume", uselist=False, cascade="all, delete-orphan")
 
@@ -6,7 +6,7 @@ class Skill(Base):
     __tablename__ = "skills"
     
     id = Column(Integer, primary_key=True, index=True)
-    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False)
+    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False, index=True)
     skill_name = Column(String, nullable=False)
     is_present = Column(Boolean, default=False)
     is_required = Column(Boolean, default=True)
@@ -6,7 +6,7 @@ class Syllabus(Base):
     __tablename__ = "syllabus"
     
     id = Column(Integer, primary_key=True, index=True)
-    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False)
+    match_result_id = Column(Integer, ForeignKey("match_results.id"), nullable=False, index=True)
     topic = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     priority = Column(String, nullable=True)  # "High", "Medium", "Low"
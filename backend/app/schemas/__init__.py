@@ -1,7 +1,14 @@
 from app.schemas.user import UserCreate, UserResponse, Token, TokenData
 from app.schemas.resume import ResumeCreate, ResumeResponse
 from app.schemas.job_description import JobDescriptionCreate, JobDescriptionResponse
-from app.schemas.match_result import MatchResultResponse, MatchAnalysisRequest
+from app.schemas.match_result import (
+    MatchResultResponse,
+    MatchAnalysisRequest,
+    RankJobDescriptionsRequest,
+    RankedJobDescriptionResponse,
+    RankedResumeResponse,
+    AnalysisJobResponse
+)
 from app.schemas.preparation_plan import (
     PreparationPlanResponse,
     PreparationPhaseResponse,
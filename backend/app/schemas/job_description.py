@@ -12,7 +12,7 @@ class JobDescriptionResponse(BaseModel):
     user_id: int
     title: str
     company: Optional[str]
-    description: str
+    description: Optional[str] = None  # Omitted in summary listings
     created_at: datetime
     
     class Config:
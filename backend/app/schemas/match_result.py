@@ -44,7 +44,7 @@ class MatchResultResponse(BaseModel):
     job_description_id: int
     similarity_score: float
     match_status: str
-    correction_suggestions: Optional[str]
+    correction_suggestions: Optional[str] = None  # Omitted (with the lists below) in summary listings
     created_at: datetime
     skills: List[SkillResponse] = []
     syllabus_items: List[SyllabusResponse] = []
@@ -58,3 +58,38 @@ class MatchAnalysisRequest(BaseModel):
     resume_id: int
     job_description_id: int
 
+
+class RankJobDescriptionsRequest(BaseModel):
+    resume_id: int
+    job_description_ids: Optional[List[int]] = None  # None ranks all of the user's job descriptions
+    persist: bool = False
+
+class RankedJobDescriptionResponse(BaseModel):
+    job_description_id: int
+    title: str
+    company: Optional[str]
+    similarity_score: float
+    match_status: str
+    match_result_id: Optional[int] = None
+
+class RankedResumeResponse(BaseModel):
+    resume_id: int
+    user_id: int
+    filename: str
+    similarity_score: float
+    match_status: str
+
+class AnalysisJobResponse(BaseModel):
+    id: int
+    resume_id: int
+    job_description_id: int
+    status: str
+    match_result_id: Optional[int] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -31,7 +31,7 @@ class PreparationPlanResponse(BaseModel):
     job_description_id: Optional[int]
     match_result_id: Optional[int]
     title: str
-    description: Optional[str]
+    description: Optional[str] = None  # Omitted (with phases) in summary listings
     total_estimated_days: Optional[int]
     created_at: datetime
     phases: List[PreparationPhaseResponse] = []
@@ -9,7 +9,7 @@ class ResumeResponse(BaseModel):
     id: int
     user_id: int
     filename: str
-    extracted_text: Optional[str]
+    extracted_text: Optional[str] = None  # Omitted in summary listings
     uploaded_at: datetime
     
     class Config:
@@ -0,0 +1,215 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
+from typing import List, Optional
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta
+import threading
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.executors import ExecutorBusyError
+from app.models.analysis_job import AnalysisJob
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from app.services.analysis_service import AnalysisService
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+class AnalysisJobService:
+    """
+    Queue of analysis jobs stored in the app database.
+    
+    Jobs are claimed with a compare-and-swap UPDATE, so any number of worker
+    threads or processes can share the table without an external broker.
+    A job left "running" past its lease (e.g. the worker died) is claimed again.
+    The claim's started_at and attempts fence the outcome: a worker that lost
+    its lease to another one writes neither its result nor the job's status.
+    A job the analysis pool was too busy for goes back to "queued" with a
+    growing delay; only other errors, or running out of attempts, fail it.
+    """
+    
+    @staticmethod
+    def submit(db: Session, user_id: int, resume_id: int, job_description_id: int) -> AnalysisJob:
+        """Queue an analysis and return the job right away."""
+        resume = db.query(Resume.id).filter(Resume.id == resume_id, Resume.user_id == user_id).first()
+        jd = db.query(JobDescription.id).filter(
+            JobDescription.id == job_description_id,
+            JobDescription.user_id == user_id
+        ).first()
+        if not resume or not jd:
+            raise ValueError("Resume or Job Description not found")
+        
+        job = AnalysisJob(
+            user_id=user_id,
+            resume_id=resume_id,
+            job_description_id=job_description_id,
+            status="queued"
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        
+        AnalysisJobWorkers.notify()
+        return job
+    
+    @staticmethod
+    def get_job(db: Session, job_id: int, user_id: int) -> Optional[AnalysisJob]:
+        """Get a job by ID (with user ownership check)."""
+        return db.query(AnalysisJob).filter(AnalysisJob.id == job_id, AnalysisJob.user_id == user_id).first()
+    
+    @staticmethod
+    def claim_next(db: Session) -> Optional[AnalysisJob]:
+        """Atomically take the oldest runnable job, or return None if there is none."""
+        now = datetime.utcnow()
+        lease_expiry = now - timedelta(seconds=settings.ANALYSIS_JOB_LEASE_SECONDS)
+        
+        # Give up on jobs that keep getting lost
+        db.query(AnalysisJob).filter(
+            AnalysisJob.status == "running",
+            AnalysisJob.started_at < lease_expiry,
+            AnalysisJob.attempts >= settings.ANALYSIS_JOB_MAX_ATTEMPTS
+        ).update({
+            AnalysisJob.status: "failed",
+            AnalysisJob.error: "Job did not finish after repeated attempts",
+            AnalysisJob.finished_at: now
+        }, synchronize_session=False)
+        db.commit()
+        
+        runnable = or_(
+            and_(
+                AnalysisJob.status == "queued",
+                or_(AnalysisJob.run_after.is_(None), AnalysisJob.run_after <= now)
+            ),
+            and_(AnalysisJob.status == "running", AnalysisJob.started_at < lease_expiry)
+        )
+        
+        # Another worker may win the race for a candidate; try the next one
+        for _ in range(5):
+            candidate = db.query(
+                AnalysisJob.id, AnalysisJob.status, AnalysisJob.started_at
+            ).filter(runnable).order_by(AnalysisJob.id).first()
+            if candidate is None:
+                return None
+            
+            unchanged = [AnalysisJob.id == candidate.id, AnalysisJob.status == candidate.status]
+            if candidate.started_at is None:
+                unchanged.append(AnalysisJob.started_at.is_(None))
+            else:
+                unchanged.append(AnalysisJob.started_at == candidate.started_at)
+            
+            claimed = db.query(AnalysisJob).filter(*unchanged).update({
+                AnalysisJob.status: "running",
+                AnalysisJob.started_at: now,
+                AnalysisJob.attempts: AnalysisJob.attempts + 1
+            }, synchronize_session=False)
+            db.commit()
+            
+            if claimed == 1:
+                return db.get(AnalysisJob, candidate.id)
+        
+        return None
+    
+    @staticmethod
+    def run_job(db: Session, job: AnalysisJob) -> bool:
+        """
+        Run a claimed job and record its outcome.
+        
+        The match result and the job's new status are committed together, and
+        only while the job still carries this claim. Returns False if the lease
+        was lost meanwhile; the work done is then rolled back.
+        """
+        # The claim token; the job's attributes are reloaded after each commit or rollback
+        job_id, claimed_at, attempts = job.id, job.started_at, job.attempts
+        try:
+            match_result_id = AnalysisService().add_match_result(
+                db, job.resume_id, job.job_description_id, job.user_id
+            )
+            outcome = {
+                AnalysisJob.status: "succeeded",
+                AnalysisJob.match_result_id: match_result_id,
+                AnalysisJob.error: None,
+                AnalysisJob.finished_at: datetime.utcnow()
+            }
+        except (ExecutorBusyError, FuturesTimeoutError) as e:
+            # The pool was saturated or slow; that says nothing about the job itself
+            db.rollback()
+            if attempts < settings.ANALYSIS_JOB_MAX_ATTEMPTS:
+                delay = settings.ANALYSIS_JOB_RETRY_SECONDS * 2 ** (attempts - 1)
+                outcome = {
+                    AnalysisJob.status: "queued",
+                    AnalysisJob.run_after: datetime.utcnow() + timedelta(seconds=delay),
+                    AnalysisJob.error: f"Retrying: {type(e).__name__} {e}".strip()
+                }
+            else:
+                outcome = {
+                    AnalysisJob.status: "failed",
+                    AnalysisJob.error: "Analysis workers stayed busy after repeated attempts",
+                    AnalysisJob.finished_at: datetime.utcnow()
+                }
+        except Exception as e:
+            db.rollback()
+            outcome = {
+                AnalysisJob.status: "failed",
+                AnalysisJob.error: str(e),
+                AnalysisJob.finished_at: datetime.utcnow()
+            }
+        
+        updated = db.query(AnalysisJob).filter(
+            AnalysisJob.id == job_id,
+            AnalysisJob.status == "running",
+            AnalysisJob.started_at == claimed_at,
+            AnalysisJob.attempts == attempts
+        ).update(outcome, synchronize_session=False)
+        if updated != 1:
+            db.rollback()
+            print(f"Analysis job {job_id} was claimed again after its lease expired; discarding this run")
+            return False
+        db.commit()
+        return True
+
+class AnalysisJobWorkers:
+    """Background threads that drain the analysis job table."""
+    
+    _threads: List[threading.Thread] = []
+    _stop = threading.Event()
+    _wake = threading.Event()
+    
+    @classmethod
+    def start(cls, count: int):
+        if count <= 0 or cls._threads:
+            return
+        cls._stop.clear()
+        for index in range(count):
+            thread = threading.Thread(target=cls._run, name=f"analysis-job-worker-{index}", daemon=True)
+            thread.start()
+            cls._threads.append(thread)
+    
+    @classmethod
+    def stop(cls):
+        cls._stop.set()
+        cls._wake.set()
+        for thread in cls._threads:
+            thread.join(timeout=10)
+        cls._threads = []
+    
+    @classmethod
+    def notify(cls):
+        """Wake idle workers in this process; other processes pick the job up on their next poll."""
+        cls._wake.set()
+    
+    @classmethod
+    def _run(cls):
+        while not cls._stop.is_set():
+            db = SessionLocal()
+            try:
+                job = AnalysisJobService.claim_next(db)
+                if job is not None:
+                    AnalysisJobService.run_job(db, job)
+                    continue
+            except Exception as e:
+                print(f"Analysis job worker error: {str(e)}")
+                db.rollback()
+            finally:
+                db.close()
+            
+            cls._wake.wait(settings.ANALYSIS_JOB_POLL_SECONDS)
+            cls._wake.clear()
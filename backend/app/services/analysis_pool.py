@@ -0,0 +1,97 @@
+"""
+Process pool for the CPU-bound parts of the API: resume parsing, feature
+extraction and matching.
+
+Model artifacts are loaded in the API process before the workers are forked,
+so they start with them instead of unpickling them on their first task, and
+their memory-mapped arrays are shared; workers pick up a replaced artifact
+file on their own. Workers are started
+once at app startup and warmed (skill automaton built) before the first
+request. Submissions are bounded; when the pool is saturated callers get
+ExecutorBusyError, which the app turns into a 503 so clients back off
+instead of piling onto a queue.
+
+When the pool is not running (scripts, ANALYSIS_POOL_WORKERS=0) tasks run
+inline in the calling thread.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.executors import BoundedExecutor
+from ml.matcher import ResumeMatcher, CORPUS_VECTORIZER_PATH
+from ml.model_registry import ModelRegistry, TRAINED_COMPACT_MODEL_PATH, TRAINED_VECTORIZER_PATH
+from ml.resume_parser import ResumeParser
+
+# The trained model is preloaded in its compact export: all of its arrays are
+# memory-mapped, so forked workers share them. The pickled forest is not, since
+# unpickling copies every tree into private memory.
+MODEL_ARTIFACTS = (CORPUS_VECTORIZER_PATH, TRAINED_COMPACT_MODEL_PATH, TRAINED_VECTORIZER_PATH)
+
+_pool: Optional[BoundedExecutor] = None
+
+# --- Functions executed inside worker processes ---
+
+def _warm_worker():
+    """Load models once per worker process so the first task does not pay for it."""
+    ResumeMatcher()
+
+def _ping() -> int:
+    return os.getpid()
+
+def process_resume(file_content: bytes, filename: str, max_bytes: int, max_pages: int) -> Tuple[str, Dict, str]:
+    """Parse an uploaded resume and compute its features in one round-trip."""
+    text = ResumeParser.extract_text(file_content, filename, max_bytes=max_bytes, max_pages=max_pages)
+    features, version = extract_document_features(text)
+    return text, features, version
+
+def extract_document_features(text: str) -> Tuple[Dict, str]:
+    """Return a document's features with the version of the models that produced them."""
+    # The corpus vectorizer is cached per process, so this does not reload it
+    matcher = ResumeMatcher()
+    return matcher.extract_features(text), matcher.features_version
+
+def analyze_texts(resume_text: str, jd_text: str, resume_features: Optional[Dict], jd_features: Optional[Dict]) -> Dict:
+    return ResumeMatcher().analyze_match(resume_text, jd_text, resume_features, jd_features)
+
+# --- Pool management ---
+
+def start_analysis_pool():
+    """Load the model artifacts, then start and warm the worker processes."""
+    global _pool
+    # Before forking, so the workers inherit the loaded artifacts
+    ModelRegistry.preload(MODEL_ARTIFACTS)
+    
+    workers = settings.ANALYSIS_POOL_WORKERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0 or _pool is not None:
+        return
+    
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+    _pool = BoundedExecutor(executor, max_pending=max(settings.ANALYSIS_POOL_MAX_PENDING, workers))
+    
+    # Workers are spawned on demand; touch each one so they are ready before traffic
+    warmups = [executor.submit(_ping) for _ in range(workers)]
+    for future in warmups:
+        future.result()
+
+def shutdown_analysis_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+        _pool = None
+
+def run_cpu_bound(fn: Callable, *args) -> Any:
+    """Run a task on the pool from synchronous code (blocks the calling thread, not the event loop)."""
+    if _pool is None:
+        return fn(*args)
+    return _pool.run(fn, *args, timeout=settings.ANALYSIS_POOL_TIMEOUT_SECONDS)
+
+async def run_cpu_bound_async(fn: Callable, *args) -> Any:
+    """Run a task on the pool from async code without blocking the event loop."""
+    if _pool is None:
+        return await run_in_threadpool(fn, *args)
+    return await _pool.run_async(fn, *args)
@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
+from typing import Dict, List, Optional, Tuple
 from app.models.match_result import MatchResult
 from app.models.skill import Skill
 from app.models.syllabus import Syllabus
@@ -6,16 +8,35 @@ from app.models.interview_question import InterviewQuestion
 from app.models.learning_resource import LearningResource
 from app.models.resume import Resume
 from app.models.job_description import JobDescription
+from app.core.pagination import keyset_page
+from app.services.document_feature_service import DocumentFeatureService
+from app.services.analysis_pool import run_cpu_bound, analyze_texts
 from ml.matcher import ResumeMatcher
 from ml.job_preparation import JobPreparationGenerator
 
+# Loads a match result's whole child graph in one extra query per collection
+MATCH_RESULT_CHILDREN = (
+    selectinload(MatchResult.skills),
+    selectinload(MatchResult.syllabus_items),
+    selectinload(MatchResult.interview_questions),
+    selectinload(MatchResult.learning_resources)
+)
+
 class AnalysisService:
     def __init__(self):
         self.matcher = ResumeMatcher()
         self.preparation_generator = JobPreparationGenerator()
+        self.feature_service = DocumentFeatureService(self.matcher)
     
     def analyze_resume_jd_match(self, db: Session, resume_id: int, job_description_id: int, user_id: int) -> MatchResult:
         """Perform complete analysis of resume vs job description."""
+        match_result_id = self.add_match_result(db, resume_id, job_description_id, user_id)
+        db.commit()
+        
+        return db.query(MatchResult).options(*MATCH_RESULT_CHILDREN).filter(MatchResult.id == match_result_id).one()
+    
+    def add_match_result(self, db: Session, resume_id: int, job_description_id: int, user_id: int) -> int:
+        """Analyse a resume against a job description and add the match result to the session, without committing."""
         # Get resume and JD
         resume = db.query(Resume).filter(Resume.id == resume_id, Resume.user_id == user_id).first()
         jd = db.query(JobDescription).filter(JobDescription.id == job_description_id, JobDescription.user_id == user_id).first()
@@ -26,87 +47,237 @@ class AnalysisService:
         if not resume.extracted_text:
             raise ValueError("Resume text not extracted")
         
-        # Perform matching analysis
-        analysis = self.matcher.analyze_match(resume.extracted_text, jd.description)
+        # Reuse cached per-document features (computed on upload/creation)
+        resume_features = self.feature_service.get_resume_features(db, resume)
+        jd_features = self.feature_service.get_job_description_features(db, jd)
+        
+        # Perform matching analysis on the process pool
+        analysis = run_cpu_bound(
+            analyze_texts, resume.extracted_text, jd.description, resume_features, jd_features
+        )
+        
+        return self._persist_match_results(db, resume_id, [(job_description_id, analysis)])[0]
+    
+    def rank_job_descriptions(
+        self,
+        db: Session,
+        resume_id: int,
+        user_id: int,
+        job_description_ids: Optional[List[int]] = None,
+        persist: bool = False
+    ) -> List[Dict]:
+        """
+        Rank one resume against many job descriptions.
+        
+        All similarities come from a single sparse matrix product over the cached
+        document vectors. Without a corpus vectorizer there are none, and each pair
+        is scored on its own, exactly as analyze_resume_jd_match scores it. If
+        job_description_ids is None, every JD owned by the user is ranked. With
+        persist=True a MatchResult is stored for each JD.
+        """
+        resume = db.query(Resume).filter(Resume.id == resume_id, Resume.user_id == user_id).first()
+        if not resume:
+            raise ValueError("Resume not found")
+        
+        if not resume.extracted_text:
+            raise ValueError("Resume text not extracted")
+        
+        query = db.query(JobDescription).options(selectinload(JobDescription.features)).filter(
+            JobDescription.user_id == user_id
+        )
+        if job_description_ids is not None:
+            query = query.filter(JobDescription.id.in_(job_description_ids))
+        jds = query.all()
+        
+        if job_description_ids is not None and len(jds) != len(set(job_description_ids)):
+            raise ValueError("Job Description not found")
+        
+        if not jds:
+            return []
+        
+        resume_features = self.feature_service.get_resume_features(db, resume)
+        jd_features = [self.feature_service.get_job_description_features(db, jd) for jd in jds]
         
-        # Create match result
-        match_result = MatchResult(
-            resume_id=resume_id,
-            job_description_id=job_description_id,
-            similarity_score=analysis['similarity_score'],
-            match_status=analysis['match_status'],
-            correction_suggestions=analysis['correction_suggestions']
+        scores = self.matcher.calculate_similarities(
+            resume.extracted_text,
+            [jd.description for jd in jds],
+            resume_features['vector'],
+            [features['vector'] for features in jd_features]
         )
-        db.add(match_result)
-        db.flush()
         
-        # Add skills
-        all_jd_skills = set(analysis['jd_skills'])
+        ranking = []
+        analyses = []
+        for jd, features, score in zip(jds, jd_features, scores):
+            score = float(score)
+            if persist:
+                analysis = self.matcher.summarize_match(score, resume_features['skills'], features['skills'])
+                analyses.append((jd.id, analysis))
+            
+            ranking.append({
+                'job_description_id': jd.id,
+                'title': jd.title,
+                'company': jd.company,
+                'similarity_score': score,
+                'match_status': self.matcher.classify_match(score),
+                'match_result_id': None
+            })
+        
+        if analyses:
+            match_result_ids = self._persist_match_results(db, resume.id, analyses)
+            for entry, match_result_id in zip(ranking, match_result_ids):
+                entry['match_result_id'] = match_result_id
+        # Persist match results and any features computed on the way in one commit
+        db.commit()
+        
+        ranking.sort(key=lambda entry: entry['similarity_score'], reverse=True)
+        return ranking
+    
+    def _persist_match_results(self, db: Session, resume_id: int, analyses: List[Tuple[int, Dict]]) -> List[int]:
+        """
+        Insert match results and all their child rows without building ORM objects.
+        
+        One multi-row INSERT ... RETURNING creates the match results, then each
+        child table gets a single executemany, so the number of round-trips does
+        not grow with the number of skills, topics, questions or resources.
+        Repeated job descriptions need the ids in parameter order, which SQLite
+        can only return one row at a time.
+        
+        Args:
+            resume_id: Resume shared by all the results
+            analyses: (job_description_id, analysis dict) pairs
+        
+        Returns:
+            New match result ids, in the order of analyses
+        """
+        built = [self._build_match_rows(resume_id, jd_id, analysis) for jd_id, analysis in analyses]
+        match_rows = [match_row for match_row, _ in built]
+        jd_ids = [jd_id for jd_id, _ in analyses]
+        
+        # Keep None values in every row, or the ORM splits the executemany by the keys present
+        if len(set(jd_ids)) == len(jd_ids):
+            # One result per job description: pair the returned ids up by it, so the
+            # rows may come back in any order and SQLite also batches the INSERT
+            returned = db.execute(
+                insert(MatchResult).returning(MatchResult.id, MatchResult.job_description_id).execution_options(render_nulls=True),
+                match_rows
+            ).all()
+            id_by_jd = {jd_id: match_result_id for match_result_id, jd_id in returned}
+            match_result_ids = [id_by_jd[jd_id] for jd_id in jd_ids]
+        else:
+            match_result_ids = db.scalars(
+                insert(MatchResult).returning(MatchResult.id, sort_by_parameter_order=True).execution_options(render_nulls=True),
+                match_rows
+            ).all()
+        
+        child_rows = {Skill: [], Syllabus: [], InterviewQuestion: [], LearningResource: []}
+        for match_result_id, (_, children) in zip(match_result_ids, built):
+            for model, rows in children.items():
+                child_rows[model].extend(dict(row, match_result_id=match_result_id) for row in rows)
+        
+        for model, rows in child_rows.items():
+            if rows:
+                db.execute(insert(model).execution_options(render_nulls=True), rows)
+        
+        return list(match_result_ids)
+    
+    def _build_match_rows(self, resume_id: int, job_description_id: int, analysis: Dict) -> Tuple[Dict, Dict[type, List[Dict]]]:
+        """Build the column values of a match result and of its skills, syllabus, questions and resources."""
+        match_row = {
+            'resume_id': resume_id,
+            'job_description_id': job_description_id,
+            'similarity_score': analysis['similarity_score'],
+            'match_status': analysis['match_status'],
+            'correction_suggestions': analysis['correction_suggestions']
+        }
+        
+        # Skills
         present_skills_set = set(analysis['present_skills'])
-        missing_skills_set = set(analysis['missing_skills'])
-        
-        for skill_name in all_jd_skills:
-            is_present = skill_name in present_skills_set
-            skill = Skill(
-                match_result_id=match_result.id,
-                skill_name=skill_name,
-                is_present=is_present,
-                is_required=True
-            )
-            db.add(skill)
+        skills = [
+            {
+                'skill_name': skill_name,
+                'is_present': skill_name in present_skills_set,
+                'is_required': True
+            }
+            for skill_name in set(analysis['jd_skills'])
+        ]
         
-        # Generate and add syllabus
+        # Syllabus
         syllabus_items = self.preparation_generator.generate_syllabus(
             analysis['jd_skills'],
             analysis['missing_skills']
         )
-        for item in syllabus_items:
-            syllabus = Syllabus(
-                match_result_id=match_result.id,
-                topic=item['topic'],
-                description=item['description'],
-                priority=item['priority']
-            )
-            db.add(syllabus)
+        syllabus = [
+            {
+                'topic': item['topic'],
+                'description': item['description'],
+                'priority': item['priority']
+            }
+            for item in syllabus_items
+        ]
         
-        # Generate and add interview questions
+        # Interview questions
         interview_questions = self.preparation_generator.generate_interview_questions(analysis['jd_skills'])
-        for q in interview_questions:
-            question = InterviewQuestion(
-                match_result_id=match_result.id,
-                question=q['question'],
-                category=q['category']
-            )
-            db.add(question)
+        questions = [
+            {
+                'question': q['question'],
+                'category': q['category']
+            }
+            for q in interview_questions
+        ]
         
-        # Generate and add learning resources
+        # Learning resources
         learning_resources = self.preparation_generator.generate_learning_resources(
             analysis['jd_skills'],
             analysis['missing_skills']
         )
-        for resource in learning_resources:
-            lr = LearningResource(
-                match_result_id=match_result.id,
-                title=resource['title'],
-                url=resource.get('url'),
-                resource_type=resource.get('type'),
-                description=resource.get('description')
-            )
-            db.add(lr)
+        resources = [
+            {
+                'title': resource['title'],
+                'url': resource.get('url'),
+                'resource_type': resource.get('type'),
+                'description': resource.get('description')
+            }
+            for resource in learning_resources
+        ]
         
-        db.commit()
-        db.refresh(match_result)
-        
-        return match_result
+        return match_row, {
+            Skill: skills,
+            Syllabus: syllabus,
+            InterviewQuestion: questions,
+            LearningResource: resources
+        }
     
-    def get_match_results(self, db: Session, user_id: int) -> list[MatchResult]:
-        """Get all match results for a user."""
-        return db.query(MatchResult).join(Resume).filter(Resume.user_id == user_id).all()
+    def get_match_results(
+        self,
+        db: Session,
+        user_id: int,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        summary: bool = False
+    ) -> list[MatchResult]:
+        """
+        Get a page of a user's match results, oldest first.
+        
+        Children are loaded with one query per collection. With summary=True
+        only the scalar columns are selected and no children are loaded.
+        """
+        if summary:
+            query = db.query(
+                MatchResult.id,
+                MatchResult.resume_id,
+                MatchResult.job_description_id,
+                MatchResult.similarity_score,
+                MatchResult.match_status,
+                MatchResult.created_at
+            )
+        else:
+            query = db.query(MatchResult).options(*MATCH_RESULT_CHILDREN)
+        query = query.join(Resume).filter(Resume.user_id == user_id)
+        return keyset_page(query, MatchResult.id, cursor, limit).all()
     
     def get_match_result_by_id(self, db: Session, match_result_id: int, user_id: int) -> MatchResult:
         """Get match result by ID (with user ownership check)."""
-        return db.query(MatchResult).join(Resume).filter(
+        return db.query(MatchResult).options(*MATCH_RESULT_CHILDREN).join(Resume).filter(
             MatchResult.id == match_result_id,
             Resume.user_id == user_id
         ).first()
-
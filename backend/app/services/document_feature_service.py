@@ -0,0 +1,101 @@
+from sqlalchemy.orm import Session
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import numpy as np
+from scipy.sparse import csr_matrix
+from app.models.document_features import DocumentFeatures
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from ml.matcher import ResumeMatcher
+
+class DocumentFeatureService:
+    """
+    Computes per-document features (skills and TF-IDF vector) once and caches
+    them in the document_features table, so repeat matches skip text processing.
+    """
+    
+    def __init__(self, matcher: Optional[ResumeMatcher] = None):
+        self.matcher = matcher or ResumeMatcher()
+    
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def get_resume_features(self, db: Session, resume: Resume, computed: Optional[Tuple[Dict, str]] = None) -> Dict:
+        """
+        Get cached features for a resume, computing them if missing or stale.
+        
+        computed: (features, version) already produced elsewhere, e.g. by a pool worker
+        """
+        if resume.features is None:
+            resume.features = DocumentFeatures()
+        return self._get_or_refresh(db, resume.features, resume.extracted_text or "", computed)
+    
+    def get_job_description_features(self, db: Session, jd: JobDescription, computed: Optional[Tuple[Dict, str]] = None) -> Dict:
+        """Get cached features for a job description, computing them if missing or stale."""
+        if jd.features is None:
+            jd.features = DocumentFeatures()
+        return self._get_or_refresh(db, jd.features, jd.description, computed)
+    
+    def _get_or_refresh(self, db: Session, cached: DocumentFeatures, text: str, computed: Optional[Tuple[Dict, str]]) -> Dict:
+        text_hash = self.hash_text(text)
+        
+        if computed is not None:
+            features, version = computed
+        else:
+            version = self.matcher.features_version
+            if cached.text_hash == text_hash and cached.features_version == version:
+                return self._deserialize(cached)
+            
+            # Text or the model behind the features changed - recompute
+            features = self.matcher.extract_features(text)
+        
+        cached.text_hash = text_hash
+        cached.features_version = version
+        cached.skills = json.dumps(sorted(features['skills']))
+        cached.vector_indices, cached.vector_data = self._pack_vector(features['vector'])
+        db.add(cached)
+        db.flush()
+        
+        return features
+    
+    def _deserialize(self, cached: DocumentFeatures) -> Dict:
+        vector = None
+        if cached.vector_indices is not None and self.matcher.corpus_vectorizer is not None:
+            n_features = len(self.matcher.corpus_vectorizer.vocabulary_)
+            vector = self.unpack_vector(cached.vector_indices, cached.vector_data, n_features)
+        
+        return {
+            "skills": set(json.loads(cached.skills)),
+            "vector": vector
+        }
+    
+    @staticmethod
+    def copy_features(source: DocumentFeatures) -> DocumentFeatures:
+        """Copy cached features to another document with the same text."""
+        return DocumentFeatures(
+            text_hash=source.text_hash,
+            features_version=source.features_version,
+            skills=source.skills,
+            vector_indices=source.vector_indices,
+            vector_data=source.vector_data
+        )
+    
+    @staticmethod
+    def unpack_vector(indices: bytes, data: bytes, n_features: int) -> csr_matrix:
+        """Rebuild a 1-row sparse vector stored by _pack_vector."""
+        indices = np.frombuffer(indices, dtype=np.int32)
+        data = np.frombuffer(data, dtype=np.float32).astype(np.float64)
+        return csr_matrix((data, indices, np.array([0, len(indices)])), shape=(1, n_features))
+    
+    @staticmethod
+    def _pack_vector(vector: Optional[csr_matrix]):
+        """Store a 1-row sparse vector as raw int32 indices and float32 values."""
+        if vector is None:
+            return None, None
+        vector = vector.tocsr()
+        return (
+            vector.indices.astype(np.int32).tobytes(),
+            vector.data.astype(np.float32).tobytes()
+        )
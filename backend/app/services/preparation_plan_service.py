@@ -1,9 +1,10 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Dict, Optional
 from app.models.preparation_plan import PreparationPlan, PreparationPhase, PhaseTopic
 from app.models.user import User
 from app.models.job_description import JobDescription
 from app.models.match_result import MatchResult
+from app.core.pagination import keyset_page
 from ml.skill_extractor import SkillExtractor
 from ml.job_preparation import JobPreparationGenerator
 
@@ -269,9 +270,35 @@ class PreparationPlanService:
         return plan
     
     @staticmethod
-    def get_user_plans(db: Session, user_id: int) -> List[PreparationPlan]:
-        """Get all preparation plans for a user."""
-        return db.query(PreparationPlan).filter(PreparationPlan.user_id == user_id).all()
+    def get_user_plans(
+        db: Session,
+        user_id: int,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        summary: bool = False
+    ) -> List[PreparationPlan]:
+        """
+        Get a page of a user's preparation plans, oldest first.
+        
+        Phases and topics are loaded with one query per level; summary=True
+        selects only the plan's small columns and skips them.
+        """
+        if summary:
+            query = db.query(
+                PreparationPlan.id,
+                PreparationPlan.user_id,
+                PreparationPlan.job_description_id,
+                PreparationPlan.match_result_id,
+                PreparationPlan.title,
+                PreparationPlan.total_estimated_days,
+                PreparationPlan.created_at
+            )
+        else:
+            query = db.query(PreparationPlan).options(
+                selectinload(PreparationPlan.phases).selectinload(PreparationPhase.topics)
+            )
+        query = query.filter(PreparationPlan.user_id == user_id)
+        return keyset_page(query, PreparationPlan.id, cursor, limit).all()
     
     @staticmethod
     def get_plan_by_id(db: Session, plan_id: int, user_id: int) -> Optional[PreparationPlan]:
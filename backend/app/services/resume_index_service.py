@@ -0,0 +1,113 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+import threading
+from app.core.config import settings
+from app.models.document_features import DocumentFeatures
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from app.services.document_feature_service import DocumentFeatureService
+from ml.matcher import ResumeMatcher
+from ml.vector_index import VectorIndex
+
+class ResumeIndexService:
+    """
+    Top-K resume search for a job description.
+    
+    Keeps one process-wide VectorIndex over the cached resume vectors. Each
+    search first pulls in document_features rows updated since the last sync,
+    so resumes uploaded through any worker become searchable without a rebuild.
+    Resumes deleted since they were indexed are dropped when a search hits them.
+    """
+    
+    _index: Optional[VectorIndex] = None
+    _index_version: Optional[str] = None
+    _synced_until: Optional[datetime] = None
+    _lock = threading.Lock()
+    
+    def __init__(self, matcher: Optional[ResumeMatcher] = None):
+        self.matcher = matcher or ResumeMatcher()
+        self.feature_service = DocumentFeatureService(self.matcher)
+    
+    def top_resumes_for_job_description(self, db: Session, job_description_id: int, user_id: int, k: int = 10) -> List[Dict]:
+        """Find the k stored resumes most similar to a job description."""
+        jd = db.query(JobDescription).filter(
+            JobDescription.id == job_description_id,
+            JobDescription.user_id == user_id
+        ).first()
+        if not jd:
+            raise ValueError("Job Description not found")
+        
+        if self.matcher.corpus_vectorizer is None:
+            raise ValueError("Resume search requires the corpus vectorizer. Run ml/fit_corpus_vectorizer.py first.")
+        
+        jd_features = self.feature_service.get_job_description_features(db, jd)
+        db.commit()
+        
+        index = self._sync(db)
+        owner_id = None if settings.RESUME_SEARCH_ALL_USERS else user_id
+        while True:
+            hits = index.search(jd_features['vector'], k, owner_id=owner_id)
+            if not hits:
+                return []
+            
+            resumes = {
+                row.id: row for row in db.query(Resume.id, Resume.user_id, Resume.filename).filter(
+                    Resume.id.in_([resume_id for resume_id, _ in hits])
+                )
+            }
+            deleted = [resume_id for resume_id, _ in hits if resume_id not in resumes]
+            if not deleted:
+                break
+            # Deleted since they were indexed; search again so they don't take up the top k
+            for resume_id in deleted:
+                index.remove(resume_id)
+        
+        ranking = []
+        for resume_id, similarity in hits:
+            resume = resumes[resume_id]
+            score = round(similarity * 100, 2)
+            ranking.append({
+                'resume_id': resume.id,
+                'user_id': resume.user_id,
+                'filename': resume.filename,
+                'similarity_score': score,
+                'match_status': self.matcher.classify_match(score)
+            })
+        return ranking
+    
+    def _sync(self, db: Session) -> VectorIndex:
+        """Bring the shared index up to date with the document_features table."""
+        cls = ResumeIndexService
+        version = self.matcher.features_version
+        n_features = len(self.matcher.corpus_vectorizer.vocabulary_)
+        
+        with cls._lock:
+            if cls._index is None or cls._index_version != version:
+                # The vectorizer changed; vectors from the old one are not comparable
+                cls._index = VectorIndex(n_features)
+                cls._index_version = version
+                cls._synced_until = None
+            
+            query = db.query(
+                DocumentFeatures.resume_id,
+                Resume.user_id,
+                DocumentFeatures.vector_indices,
+                DocumentFeatures.vector_data,
+                DocumentFeatures.updated_at
+            ).join(Resume, Resume.id == DocumentFeatures.resume_id).filter(
+                DocumentFeatures.features_version == version,
+                DocumentFeatures.vector_indices.isnot(None)
+            )
+            if cls._synced_until is not None:
+                # updated_at is stamped at flush, not commit: re-read an overlap window so rows
+                # committed after a later one was synced are not skipped. Re-adding a row replaces it.
+                overlap = timedelta(seconds=settings.RESUME_INDEX_SYNC_OVERLAP_SECONDS)
+                query = query.filter(DocumentFeatures.updated_at >= cls._synced_until - overlap)
+            
+            for row in query.order_by(DocumentFeatures.updated_at).yield_per(5000):
+                vector = DocumentFeatureService.unpack_vector(row.vector_indices, row.vector_data, n_features)
+                cls._index.add(row.resume_id, vector, owner_id=row.user_id)
+                cls._synced_until = max(cls._synced_until or row.updated_at, row.updated_at)
+            
+            return cls._index
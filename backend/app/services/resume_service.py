@@ -1,8 +1,13 @@
 from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.config import settings
+from app.core.pagination import keyset_page
 from app.models.resume import Resume
 from app.models.user import User
-from ml.resume_parser import ResumeParser
+from app.services.document_feature_service import DocumentFeatureService
+from app.services.analysis_pool import run_cpu_bound_async, process_resume
 import os
+import hashlib
 import aiofiles
 from pathlib import Path
 
@@ -13,34 +18,97 @@ class ResumeService:
         self.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     
     async def save_resume(self, db: Session, user_id: int, filename: str, file_content: bytes) -> Resume:
-        """Save resume file and extract text."""
-        # Generate unique filename
-        file_path = self.UPLOAD_DIR / f"{user_id}_{filename}"
+        """
+        Save resume file and extract text.
         
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(file_content)
+        Files are stored content-addressed by SHA-256. Re-uploading bytes that
+        were seen before reuses the stored blob, extracted text and cached
+        features and skips parsing; the same user re-uploading the same file
+        gets their existing resume back.
+        """
+        content_hash = hashlib.sha256(file_content).hexdigest()
         
-        # Extract text
-        parser = ResumeParser()
-        extracted_text = parser.extract_text(file_content, filename)
+        existing = db.query(Resume).filter(
+            Resume.user_id == user_id,
+            Resume.content_hash == content_hash
+        ).first()
+        if existing:
+            return existing
+        
+        source = db.query(Resume).filter(
+            Resume.content_hash == content_hash,
+            Resume.extracted_text.isnot(None)
+        ).first()
+        
+        if source:
+            # Seen before (another user): nothing to parse or write
+            resume = Resume(
+                user_id=user_id,
+                filename=filename,
+                file_path=source.file_path,
+                content_hash=content_hash,
+                extracted_text=source.extracted_text
+            )
+            if source.features is not None:
+                resume.features = DocumentFeatureService.copy_features(source.features)
+            db.add(resume)
+            db.commit()
+            db.refresh(resume)
+            return resume
+        
+        # Extract text and features on the process pool, off the event loop
+        extracted_text, features, features_version = await run_cpu_bound_async(
+            process_resume,
+            file_content,
+            filename,
+            settings.MAX_UPLOAD_BYTES,
+            settings.MAX_RESUME_PAGES
+        )
+        
+        # Save file under its content hash
+        file_path = self.UPLOAD_DIR / f"{content_hash}{Path(filename).suffix.lower()}"
+        if not file_path.exists():
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(file_content)
         
         # Save to database
         resume = Resume(
             user_id=user_id,
             filename=filename,
             file_path=str(file_path),
+            content_hash=content_hash,
             extracted_text=extracted_text
         )
         db.add(resume)
+        
+        # Store skills and vector once so later matches skip text processing
+        DocumentFeatureService().get_resume_features(db, resume, (features, features_version))
+        
         db.commit()
         db.refresh(resume)
         
         return resume
     
-    def get_user_resumes(self, db: Session, user_id: int) -> list[Resume]:
-        """Get all resumes for a user."""
-        return db.query(Resume).filter(Resume.user_id == user_id).all()
+    def get_user_resumes(
+        self,
+        db: Session,
+        user_id: int,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        summary: bool = False
+    ) -> list[Resume]:
+        """
+        Get a page of a user's resumes, oldest first.
+        
+        With summary=True only the small columns are selected, so the
+        extracted text is never read from the database.
+        """
+        if summary:
+            query = db.query(Resume.id, Resume.user_id, Resume.filename, Resume.uploaded_at)
+        else:
+            query = db.query(Resume)
+        query = query.filter(Resume.user_id == user_id)
+        return keyset_page(query, Resume.id, cursor, limit).all()
     
     def get_resume_by_id(self, db: Session, resume_id: int, user_id: int) -> Resume:
         """Get resume by ID (with user ownership check)."""
@@ -0,0 +1,99 @@
+"""
+Measure login throughput, and what a login burst does to other requests.
+
+Start the API first (e.g. `python run.py` or uvicorn with several workers),
+then run:
+
+    python benchmark_login.py [--url http://localhost:8000] [--concurrency 1 4 16 64] [--requests 200]
+
+For each concurrency level the script fires that many parallel logins until
+--requests have completed, while a separate thread keeps calling /health.
+It reports login throughput and latency, how many logins were shed with 503
+(password executor full), and /health latency during the burst.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+
+def percentile(values, fraction):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def ensure_user(client: httpx.Client, email: str, password: str):
+    response = client.post("/api/auth/register", json={"email": email, "password": password, "full_name": "Benchmark"})
+    if response.status_code not in (201, 400):
+        raise SystemExit(f"Could not register benchmark user: {response.status_code} {response.text}")
+
+def run_level(url: str, email: str, password: str, concurrency: int, total: int):
+    latencies = []
+    statuses = {}
+    health_latencies = []
+    lock = threading.Lock()
+    done = threading.Event()
+    
+    def login(client: httpx.Client):
+        start = time.perf_counter()
+        response = client.post("/api/auth/login", data={"username": email, "password": password})
+        elapsed = time.perf_counter() - start
+        with lock:
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                latencies.append(elapsed)
+    
+    def probe_health():
+        with httpx.Client(base_url=url, timeout=30) as client:
+            while not done.is_set():
+                start = time.perf_counter()
+                client.get("/health")
+                health_latencies.append(time.perf_counter() - start)
+                time.sleep(0.01)
+    
+    prober = threading.Thread(target=probe_health, daemon=True)
+    prober.start()
+    
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    with httpx.Client(base_url=url, timeout=60, limits=limits) as client:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for _ in range(total):
+                pool.submit(login, client)
+        wall = time.perf_counter() - start
+    
+    done.set()
+    prober.join()
+    
+    ok = statuses.get(200, 0)
+    shed = statuses.get(503, 0)
+    other = sum(count for status, count in statuses.items() if status not in (200, 503))
+    print(
+        f"{concurrency:>11} {ok / wall:>10.1f} "
+        f"{percentile(latencies, 0.5) * 1000:>9.0f} {percentile(latencies, 0.95) * 1000:>9.0f} "
+        f"{shed:>6} {other:>6} "
+        f"{statistics.median(health_latencies) * 1000 if health_latencies else float('nan'):>12.1f} "
+        f"{percentile(health_latencies, 0.95) * 1000:>12.1f}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=200, help="Logins per concurrency level")
+    parser.add_argument("--email", default="login-benchmark@example.com")
+    parser.add_argument("--password", default="Benchmark@123")
+    args = parser.parse_args()
+    
+    with httpx.Client(base_url=args.url, timeout=30) as client:
+        ensure_user(client, args.email, args.password)
+    
+    print(f"{'concurrency':>11} {'logins/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'503':>6} {'other':>6} {'health p50':>12} {'health p95':>12}")
+    for concurrency in args.concurrency:
+        run_level(args.url, args.email, args.password, concurrency, args.requests)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark storing match results: one ORM object per child row vs. the bulk path.
+
+Runs against a throwaway SQLite file by default; pass a database URL to
+measure against PostgreSQL (tables are created there if missing and the
+benchmark rows are deleted afterwards).
+
+Usage:
+    python benchmark_persistence.py [--results 200] [--database-url URL]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models.user import User
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from app.models.match_result import MatchResult
+from app.models.skill import Skill
+from app.models.syllabus import Syllabus
+from app.models.interview_question import InterviewQuestion
+from app.models.learning_resource import LearningResource
+from app.services.analysis_service import AnalysisService
+
+RESUME_TEXT = (
+    "Senior software engineer with Python, Django, Flask and FastAPI. Built REST APIs "
+    "and microservices on AWS with Docker and Kubernetes. PostgreSQL, Redis, React."
+)
+JD_TEXT = (
+    "We need a backend engineer: Python, Java, Spring Boot, Kubernetes, Terraform, "
+    "Kafka, PostgreSQL, MongoDB, GraphQL, machine learning with TensorFlow and PyTorch."
+)
+
+def persist_with_orm(service, db, resume_id, analyses):
+    """The previous path: build ORM objects and let the unit of work flush them."""
+    match_results = []
+    for jd_id, analysis in analyses:
+        match_row, children = service._build_match_rows(resume_id, jd_id, analysis)
+        match_results.append(MatchResult(
+            **match_row,
+            skills=[Skill(**row) for row in children[Skill]],
+            syllabus_items=[Syllabus(**row) for row in children[Syllabus]],
+            interview_questions=[InterviewQuestion(**row) for row in children[InterviewQuestion]],
+            learning_resources=[LearningResource(**row) for row in children[LearningResource]]
+        ))
+    db.add_all(match_results)
+    db.flush()
+    return [match_result.id for match_result in match_results]
+
+def time_path(name, persist, service, Session, resume_id, analyses, batch):
+    db = Session()
+    try:
+        start = time.perf_counter()
+        ids = []
+        for offset in range(0, len(analyses), batch):
+            ids.extend(persist(service, db, resume_id, analyses[offset:offset + batch]))
+            db.commit()
+        elapsed = time.perf_counter() - start
+        
+        children = sum(
+            db.query(model).filter(model.match_result_id.in_(ids)).count()
+            for model in (Skill, Syllabus, InterviewQuestion, LearningResource)
+        )
+        print(f"{name:<6} batch={batch:<4} {elapsed * 1000:9.1f} ms  "
+              f"({elapsed * 1000 / len(analyses):.2f} ms/result, {children} child rows)")
+        
+        for model in (Skill, Syllabus, InterviewQuestion, LearningResource):
+            db.query(model).filter(model.match_result_id.in_(ids)).delete(synchronize_session=False)
+        db.query(MatchResult).filter(MatchResult.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=200, help="Match results to store per run")
+    parser.add_argument("--database-url", default=None, help="Database to benchmark against (default: temporary SQLite)")
+    args = parser.parse_args()
+    
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+    
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    
+    service = AnalysisService()
+    analysis = service.matcher.analyze_match(RESUME_TEXT, JD_TEXT)
+    
+    db = Session()
+    user = User(email=f"benchmark-{time.time_ns()}@example.com", hashed_password="-", full_name="Benchmark")
+    db.add(user)
+    db.flush()
+    resume = Resume(user_id=user.id, filename="benchmark.pdf", file_path="-", extracted_text=RESUME_TEXT)
+    jd = JobDescription(user_id=user.id, title="Benchmark", description=JD_TEXT)
+    db.add_all([resume, jd])
+    db.commit()
+    resume_id, jd_id, user_id = resume.id, jd.id, user.id
+    db.close()
+    
+    analyses = [(jd_id, analysis)] * args.results
+    print(f"Storing {args.results} match results on {engine.dialect.name}\n")
+    
+    try:
+        # batch=1 is one analysis per request; larger batches are rank_job_descriptions(persist=True)
+        for batch in (1, 50):
+            time_path("orm", persist_with_orm, service, Session, resume_id, analyses, batch)
+            time_path("bulk", lambda s, d, r, a: s._persist_match_results(d, r, a), service, Session, resume_id, analyses, batch)
+    finally:
+        db = Session()
+        db.query(JobDescription).filter(JobDescription.id == jd_id).delete()
+        db.query(Resume).filter(Resume.id == resume_id).delete()
+        db.query(User).filter(User.id == user_id).delete()
+        db.commit()
+        db.close()
+
+if __name__ == "__main__":
+    main()
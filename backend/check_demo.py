@@ -10,9 +10,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.core.database import SessionLocal, engine, Base
+from app.core.database import SessionLocal
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
+from migrate import upgrade_database
 
 def check_and_fix_demo():
     """Check and fix demo account."""
@@ -22,7 +23,7 @@ def check_and_fix_demo():
     
     # Ensure tables exist
     try:
-        Base.metadata.create_all(bind=engine)
+        upgrade_database()
         print("✅ Database tables verified")
     except Exception as e:
         print(f"❌ Database error: {e}")
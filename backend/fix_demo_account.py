@@ -10,14 +10,15 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.core.database import engine, Base, SessionLocal
+from app.core.database import SessionLocal
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
+from migrate import upgrade_database
 
 def fix_demo_account():
     """Check, create, or reset demo account."""
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # Create or upgrade tables
+    upgrade_database()
     
     db = SessionLocal()
     try:
@@ -9,9 +9,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.core.database import engine, Base, SessionLocal
+from app.core.database import SessionLocal
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
+from migrate import upgrade_database
 
 def init_db():
     """Initialize database and create demo user."""
@@ -19,12 +20,12 @@ def init_db():
     print("Database Initialization")
     print("=" * 60)
     
-    # Create all tables
+    # Create or upgrade tables
     try:
-        Base.metadata.create_all(bind=engine)
+        upgrade_database()
         print("✅ Database tables created/verified")
     except Exception as e:
-        print(f"❌ Error creating tables: {str(e)}")
+        print(f"❌ Error migrating database: {str(e)}")
         return
     
     db = SessionLocal()
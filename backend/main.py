@@ -6,13 +6,17 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from fastapi import FastAPI
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.database import engine, Base
+from fastapi.responses import JSONResponse
+from app.core.database import dispose_async_engine, get_pool_stats
+from app.core.executors import ExecutorBusyError
+from app.core.security import shutdown_password_executor
 from app.api import auth, resume, job_description, analysis, preparation_plan
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
+from app.services.analysis_pool import start_analysis_pool, shutdown_analysis_pool
+from app.services.analysis_job_service import AnalysisJobWorkers
+from app.core.config import settings
 
 app = FastAPI(
     title="AI Resume Analyzer API",
@@ -28,8 +32,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+@app.on_event("startup")
+def start_workers():
+    start_analysis_pool()
+    AnalysisJobWorkers.start(settings.ANALYSIS_JOB_WORKERS)
+
+@app.on_event("shutdown")
+async def stop_workers():
+    AnalysisJobWorkers.stop()
+    shutdown_analysis_pool()
+    shutdown_password_executor()
+    await dispose_async_engine()
+
+@app.exception_handler(ExecutorBusyError)
+def executor_busy_handler(request: Request, exc: ExecutorBusyError):
+    # Backpressure: tell clients to retry instead of queueing without bound
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy. Please retry shortly."},
+        headers={"Retry-After": "1"}
+    )
+
+@app.exception_handler(FuturesTimeoutError)
+def executor_timeout_handler(request: Request, exc: FuturesTimeoutError):
+    # An analysis outlived ANALYSIS_POOL_TIMEOUT_SECONDS; run_cpu_bound already cancelled it if it had not started
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "Analysis took too long. Please retry shortly."},
+        headers={"Retry-After": "5"}
+    )
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(resume.router)
@@ -43,4 +78,4 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy", "db_pool": get_pool_stats()}
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Bring the database schema up to date.
+
+Run this on deploy, before starting the API servers (which no longer touch
+the schema at startup):
+
+    python migrate.py            # upgrade to the latest revision
+    python migrate.py 0001       # upgrade to a specific revision
+
+Other Alembic commands (downgrade, history, revision --autogenerate) work
+as usual with `alembic` from the backend directory.
+
+Databases created by older versions of the app with create_all() have no
+migration history; they are stamped at the initial revision first so only
+the later migrations run against them.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+backend_dir = Path(__file__).parent
+project_root = backend_dir.parent
+sys.path.insert(0, str(project_root))
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from app.core.database import engine
+
+INITIAL_REVISION = "0001"
+
+def get_alembic_config() -> Config:
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(backend_dir / "migrations"))
+    return config
+
+def upgrade_database(revision: str = "head"):
+    """Apply migrations up to revision, adopting a pre-migration database if needed."""
+    config = get_alembic_config()
+
+    tables = set(inspect(engine).get_table_names())
+    if "users" in tables and "alembic_version" not in tables:
+        print(f"Existing database without migration history - stamping {INITIAL_REVISION}")
+        command.stamp(config, INITIAL_REVISION)
+
+    command.upgrade(config, revision)
+
+if __name__ == "__main__":
+    upgrade_database(sys.argv[1] if len(sys.argv) > 1 else "head")
+    print("✅ Database schema is up to date")
@@ -0,0 +1,149 @@
+"""Initial schema: users, resumes, job descriptions, match results and preparation plans
+
+This is the schema the app used to create with create_all(); databases made
+that way are stamped at this revision by migrate.py instead of re-running it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    
+    op.create_table(
+        "resumes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("file_path", sa.String(), nullable=False),
+        sa.Column("extracted_text", sa.Text(), nullable=True),
+        sa.Column("uploaded_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_resumes_id", "resumes", ["id"])
+    
+    op.create_table(
+        "job_descriptions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("company", sa.String(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_job_descriptions_id", "job_descriptions", ["id"])
+    
+    op.create_table(
+        "match_results",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id"), nullable=False),
+        sa.Column("job_description_id", sa.Integer(), sa.ForeignKey("job_descriptions.id"), nullable=False),
+        sa.Column("similarity_score", sa.Float(), nullable=False),
+        sa.Column("match_status", sa.String(), nullable=False),
+        sa.Column("correction_suggestions", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_match_results_id", "match_results", ["id"])
+    
+    op.create_table(
+        "skills",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("match_result_id", sa.Integer(), sa.ForeignKey("match_results.id"), nullable=False),
+        sa.Column("skill_name", sa.String(), nullable=False),
+        sa.Column("is_present", sa.Boolean(), nullable=True),
+        sa.Column("is_required", sa.Boolean(), nullable=True),
+    )
+    op.create_index("ix_skills_id", "skills", ["id"])
+    
+    op.create_table(
+        "syllabus",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("match_result_id", sa.Integer(), sa.ForeignKey("match_results.id"), nullable=False),
+        sa.Column("topic", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("priority", sa.String(), nullable=True),
+    )
+    op.create_index("ix_syllabus_id", "syllabus", ["id"])
+    
+    op.create_table(
+        "interview_questions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("match_result_id", sa.Integer(), sa.ForeignKey("match_results.id"), nullable=False),
+        sa.Column("question", sa.Text(), nullable=False),
+        sa.Column("category", sa.String(), nullable=True),
+    )
+    op.create_index("ix_interview_questions_id", "interview_questions", ["id"])
+    
+    op.create_table(
+        "learning_resources",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("match_result_id", sa.Integer(), sa.ForeignKey("match_results.id"), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=True),
+        sa.Column("resource_type", sa.String(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+    )
+    op.create_index("ix_learning_resources_id", "learning_resources", ["id"])
+    
+    op.create_table(
+        "preparation_plans",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("job_description_id", sa.Integer(), sa.ForeignKey("job_descriptions.id"), nullable=True),
+        sa.Column("match_result_id", sa.Integer(), sa.ForeignKey("match_results.id"), nullable=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("total_estimated_days", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_preparation_plans_id", "preparation_plans", ["id"])
+    
+    op.create_table(
+        "preparation_phases",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("plan_id", sa.Integer(), sa.ForeignKey("preparation_plans.id"), nullable=False),
+        sa.Column("phase_number", sa.Integer(), nullable=False),
+        sa.Column("phase_name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("estimated_days", sa.Integer(), nullable=True),
+        sa.Column("order_index", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_preparation_phases_id", "preparation_phases", ["id"])
+    
+    op.create_table(
+        "phase_topics",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("phase_id", sa.Integer(), sa.ForeignKey("preparation_phases.id"), nullable=False),
+        sa.Column("topic_name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("practice_tasks", sa.Text(), nullable=True),
+        sa.Column("estimated_hours", sa.Float(), nullable=True),
+        sa.Column("order_index", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_phase_topics_id", "phase_topics", ["id"])
+
+def downgrade():
+    for table in (
+        "phase_topics", "preparation_phases", "preparation_plans",
+        "learning_resources", "interview_questions", "syllabus", "skills",
+        "match_results", "job_descriptions", "resumes", "users",
+    ):
+        op.drop_table(table)
@@ -0,0 +1,31 @@
+"""Resume content hash for deduplicated uploads
+
+Resume.content_hash (SHA-256 of the uploaded file) must exist before the
+upload deduplication code runs against an older database. Databases created
+with create_all() by later app versions already have it, so this checks first.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    
+    if "content_hash" not in {column["name"] for column in inspector.get_columns("resumes")}:
+        with op.batch_alter_table("resumes") as batch_op:
+            batch_op.add_column(sa.Column("content_hash", sa.String(64), nullable=True))
+    if "ix_resumes_content_hash" not in {index["name"] for index in inspector.get_indexes("resumes")}:
+        op.create_index("ix_resumes_content_hash", "resumes", ["content_hash"])
+
+def downgrade():
+    op.drop_index("ix_resumes_content_hash", table_name="resumes")
+    with op.batch_alter_table("resumes") as batch_op:
+        batch_op.drop_column("content_hash")
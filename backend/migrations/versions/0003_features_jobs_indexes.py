@@ -0,0 +1,81 @@
+"""Document features cache, analysis jobs and lookup indexes
+
+Databases created with create_all() by later app versions, or stamped at
+0002 when that revision still included these objects, may already have some
+of them, so each step checks before creating.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_resumes_user_id_id", "resumes", ["user_id", "id"]),
+    ("ix_job_descriptions_user_id_id", "job_descriptions", ["user_id", "id"]),
+    ("ix_match_results_resume_id", "match_results", ["resume_id"]),
+    ("ix_match_results_job_description_id", "match_results", ["job_description_id"]),
+    ("ix_skills_match_result_id", "skills", ["match_result_id"]),
+    ("ix_syllabus_match_result_id", "syllabus", ["match_result_id"]),
+    ("ix_interview_questions_match_result_id", "interview_questions", ["match_result_id"]),
+    ("ix_learning_resources_match_result_id", "learning_resources", ["match_result_id"]),
+    ("ix_preparation_plans_user_id_id", "preparation_plans", ["user_id", "id"]),
+    ("ix_preparation_plans_job_description_id", "preparation_plans", ["job_description_id"]),
+    ("ix_preparation_plans_match_result_id", "preparation_plans", ["match_result_id"]),
+    ("ix_preparation_phases_plan_id", "preparation_phases", ["plan_id"]),
+    ("ix_phase_topics_phase_id", "phase_topics", ["phase_id"]),
+]
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    
+    if "document_features" not in tables:
+        op.create_table(
+            "document_features",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id"), nullable=True, unique=True),
+            sa.Column("job_description_id", sa.Integer(), sa.ForeignKey("job_descriptions.id"), nullable=True, unique=True),
+            sa.Column("text_hash", sa.String(64), nullable=False),
+            sa.Column("features_version", sa.String(), nullable=False),
+            sa.Column("skills", sa.Text(), nullable=False),
+            sa.Column("vector_indices", sa.LargeBinary(), nullable=True),
+            sa.Column("vector_data", sa.LargeBinary(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_document_features_id", "document_features", ["id"])
+    
+    if "analysis_jobs" not in tables:
+        op.create_table(
+            "analysis_jobs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("resume_id", sa.Integer(), nullable=False),
+            sa.Column("job_description_id", sa.Integer(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("match_result_id", sa.Integer(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_analysis_jobs_id", "analysis_jobs", ["id"])
+        op.create_index("ix_analysis_jobs_status", "analysis_jobs", ["status"])
+    
+    for name, table, columns in INDEXES:
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    op.drop_table("analysis_jobs")
+    op.drop_table("document_features")
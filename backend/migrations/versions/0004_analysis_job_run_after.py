@@ -0,0 +1,27 @@
+"""Retry delay for analysis jobs
+
+Jobs the analysis pool was too busy for are re-queued with run_after set,
+and are not claimed again before that time.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    
+    if "run_after" not in {column["name"] for column in inspector.get_columns("analysis_jobs")}:
+        with op.batch_alter_table("analysis_jobs") as batch_op:
+            batch_op.add_column(sa.Column("run_after", sa.DateTime(), nullable=True))
+
+def downgrade():
+    with op.batch_alter_table("analysis_jobs") as batch_op:
+        batch_op.drop_column("run_after")
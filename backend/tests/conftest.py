@@ -0,0 +1,75 @@
+"""
+Shared test setup: import paths and an in-memory SQLite database.
+
+Run from backend/: python -m pytest -q tests
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# The app reads its settings at import; keep tests off the configured database
+os.environ["DATABASE_URL"] = "sqlite://"
+
+# Add project root (ml/) and backend (app/) to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.api.dependencies import get_current_user
+from app.core.database import Base, get_db
+from app.models.user import User
+
+@pytest.fixture
+def engine():
+    # One shared connection, so every session sees the same in-memory database
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def user(db):
+    user = User(email="tester@example.com", hashed_password="-", full_name="Tester")
+    db.add(user)
+    db.commit()
+    return user
+
+@pytest.fixture
+def client(engine, user):
+    """API client on the test database, signed in as user; startup hooks (pools, job workers) don't run."""
+    from main import app
+    
+    make_session = sessionmaker(bind=engine, autoflush=False)
+    user_id = user.id
+    
+    def override_get_db():
+        db = make_session()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    def override_get_current_user(db: Session = Depends(get_db)):
+        return db.get(User, user_id)
+    
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
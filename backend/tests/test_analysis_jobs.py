@@ -0,0 +1,72 @@
+"""
+A worker whose job lease expired and was claimed again must not write its
+result or the job's status.
+"""
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.core.database import Base
+from app.models.analysis_job import AnalysisJob
+from app.models.job_description import JobDescription
+from app.models.match_result import MatchResult
+from app.models.resume import Resume
+from app.models.user import User
+from app.services.analysis_job_service import AnalysisJobService
+
+RESUME_TEXT = "Python developer with Django, React, AWS, Docker and PostgreSQL."
+JD_TEXT = "Backend engineer: Python, Django, Kubernetes and PostgreSQL."
+
+@pytest.fixture
+def make_session(tmp_path):
+    # A file database, so each worker's session has its own connection and transaction
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+@pytest.fixture
+def job_id(make_session):
+    db = make_session()
+    user = User(email="jobs@example.com", hashed_password="-")
+    db.add(user)
+    db.flush()
+    resume = Resume(user_id=user.id, filename="cv.pdf", file_path="-", extracted_text=RESUME_TEXT)
+    jd = JobDescription(user_id=user.id, title="Backend", description=JD_TEXT)
+    db.add_all([resume, jd])
+    db.commit()
+    job = AnalysisJobService.submit(db, user.id, resume.id, jd.id)
+    db.close()
+    return job.id
+
+def test_expired_lease_reclaim_keeps_only_the_new_claims_result(make_session, job_id, monkeypatch):
+    stale_db, current_db = make_session(), make_session()
+    try:
+        stale_job = AnalysisJobService.claim_next(stale_db)
+        assert stale_job.id == job_id and stale_job.attempts == 1
+
+        # Every running job is past its lease, so the next claim takes it over
+        monkeypatch.setattr(settings, "ANALYSIS_JOB_LEASE_SECONDS", 0)
+        current_job = AnalysisJobService.claim_next(current_db)
+        assert current_job.id == job_id and current_job.attempts == 2
+
+        # The first worker finishes late: its result and status are discarded
+        assert AnalysisJobService.run_job(stale_db, stale_job) is False
+        assert stale_db.scalar(select(func.count()).select_from(MatchResult)) == 0
+        job = stale_db.get(AnalysisJob, job_id)
+        assert (job.status, job.attempts, job.match_result_id) == ("running", 2, None)
+
+        assert AnalysisJobService.run_job(current_db, current_job) is True
+    finally:
+        stale_db.close()
+        current_db.close()
+
+    db = make_session()
+    try:
+        match_result_ids = db.scalars(select(MatchResult.id)).all()
+        job = db.get(AnalysisJob, job_id)
+        assert len(match_result_ids) == 1
+        assert (job.status, job.match_result_id, job.error) == ("succeeded", match_result_ids[0], None)
+    finally:
+        db.close()
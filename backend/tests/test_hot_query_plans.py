@@ -0,0 +1,142 @@
+"""
+The hot ownership-filtered queries must be answered from their indexes.
+
+Migrates an in-memory SQLite database to head, seeds it with a realistic
+number of users and rows, refreshes planner statistics, then checks the
+EXPLAIN QUERY PLAN of each statement the services issue on every request.
+"""
+
+import pytest
+from alembic import command
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.pool import StaticPool
+from app.models.user import User
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from app.models.match_result import MatchResult
+from app.models.skill import Skill
+from app.models.preparation_plan import PreparationPlan, PreparationPhase, PhaseTopic
+from migrate import get_alembic_config
+
+USERS = 200
+PER_USER = 10  # Resumes, JDs, match results and plans per user
+USER_ID = 42
+ROW_ID = 500
+
+PRIMARY_KEY = "INTEGER PRIMARY KEY"
+
+def seed(conn, users: int, per_user: int):
+    """Insert users, each with per_user resumes, JDs, match results and plans."""
+    rows = users * per_user
+    conn.execute(insert(User), [
+        {"id": i, "email": f"user{i}@example.com", "hashed_password": "-"}
+        for i in range(1, users + 1)
+    ])
+    # Interleave owners so one user's rows are spread over the table, as in production
+    owners = [1 + i % users for i in range(rows)]
+    conn.execute(insert(Resume), [
+        {"id": i + 1, "user_id": owners[i], "filename": "cv.pdf", "file_path": "-", "extracted_text": "text"}
+        for i in range(rows)
+    ])
+    conn.execute(insert(JobDescription), [
+        {"id": i + 1, "user_id": owners[i], "title": "JD", "description": "text"}
+        for i in range(rows)
+    ])
+    conn.execute(insert(MatchResult), [
+        {"id": i + 1, "resume_id": i + 1, "job_description_id": i + 1, "similarity_score": 50.0, "match_status": "Partial Match"}
+        for i in range(rows)
+    ])
+    conn.execute(insert(Skill), [
+        {"match_result_id": 1 + i // 5, "skill_name": f"skill{i % 5}", "is_present": True, "is_required": True}
+        for i in range(rows * 5)
+    ])
+    conn.execute(insert(PreparationPlan), [
+        {"id": i + 1, "user_id": owners[i], "title": "Plan"}
+        for i in range(rows)
+    ])
+    conn.execute(insert(PreparationPhase), [
+        {"id": i + 1, "plan_id": 1 + i // 3, "phase_number": i % 3, "phase_name": "Phase", "order_index": i % 3}
+        for i in range(rows * 3)
+    ])
+    conn.execute(insert(PhaseTopic), [
+        {"phase_id": 1 + i // 3, "topic_name": "Topic", "order_index": i % 3}
+        for i in range(rows * 9)
+    ])
+    
+    conn.execute(text("ANALYZE"))
+
+# name -> (statement, indexes its plan must use)
+PAGE_IDS = list(range(ROW_ID, ROW_ID + 100))
+HOT_QUERIES = {
+    "resume by id + owner": (
+        select(Resume).where(Resume.id == ROW_ID, Resume.user_id == USER_ID),
+        [PRIMARY_KEY]
+    ),
+    "resume page": (
+        select(Resume).where(Resume.user_id == USER_ID, Resume.id > ROW_ID).order_by(Resume.id).limit(100),
+        ["ix_resumes_user_id_id"]
+    ),
+    "job description by id + owner": (
+        select(JobDescription).where(JobDescription.id == ROW_ID, JobDescription.user_id == USER_ID),
+        [PRIMARY_KEY]
+    ),
+    "job description page": (
+        select(JobDescription).where(
+            JobDescription.user_id == USER_ID, JobDescription.id > ROW_ID
+        ).order_by(JobDescription.id).limit(100),
+        ["ix_job_descriptions_user_id_id"]
+    ),
+    "match results by owner": (
+        select(MatchResult).join(Resume).where(Resume.user_id == USER_ID).order_by(MatchResult.id).limit(100),
+        ["ix_resumes_user_id_id", "ix_match_results_resume_id"]
+    ),
+    "match results for a JD": (
+        select(MatchResult.id).where(MatchResult.job_description_id == ROW_ID),
+        ["ix_match_results_job_description_id"]
+    ),
+    "skills of a page of results": (
+        select(Skill).where(Skill.match_result_id.in_(PAGE_IDS)),
+        ["ix_skills_match_result_id"]
+    ),
+    "plan page": (
+        select(PreparationPlan).where(
+            PreparationPlan.user_id == USER_ID, PreparationPlan.id > ROW_ID
+        ).order_by(PreparationPlan.id).limit(100),
+        ["ix_preparation_plans_user_id_id"]
+    ),
+    "phases of a page of plans": (
+        select(PreparationPhase).where(PreparationPhase.plan_id.in_(PAGE_IDS)),
+        ["ix_preparation_phases_plan_id"]
+    ),
+    "topics of a page of phases": (
+        select(PhaseTopic).where(PhaseTopic.phase_id.in_(PAGE_IDS)),
+        ["ix_phase_topics_phase_id"]
+    ),
+}
+
+@pytest.fixture(scope="module")
+def migrated_connection():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    with engine.connect() as conn:
+        config = get_alembic_config()
+        config.attributes["connection"] = conn
+        command.upgrade(config, "head")
+        conn.commit()
+        
+        seed(conn, USERS, PER_USER)
+        conn.commit()
+        yield conn
+    engine.dispose()
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_its_index(migrated_connection, name):
+    statement, indexes = HOT_QUERIES[name]
+    sql = str(statement.compile(dialect=migrated_connection.dialect, compile_kwargs={"literal_binds": True}))
+    plan = [row[-1] for row in migrated_connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    
+    # "SCAN <table>" without an index is a full table scan; "SEARCH" and index scans are not
+    full_scans = [line for line in plan if line.startswith("SCAN") and "INDEX" not in line]
+    assert not full_scans, plan
+    for index in indexes:
+        expected = index if index == PRIMARY_KEY else f"INDEX {index} "
+        assert any(expected in line for line in plan), plan
@@ -0,0 +1,68 @@
+"""
+Listing match results must take a fixed number of queries, however many
+results (and skills, topics, questions and resources per result) there are.
+"""
+
+import pytest
+from sqlalchemy import event
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from app.services.analysis_service import AnalysisService
+
+RESUME_TEXT = (
+    "Senior software engineer with Python, Django, Flask and FastAPI. Built REST APIs "
+    "and microservices on AWS with Docker and Kubernetes. PostgreSQL, Redis, React."
+)
+JD_TEXT = (
+    "We need a backend engineer: Python, Java, Spring Boot, Kubernetes, Terraform, "
+    "Kafka, PostgreSQL, MongoDB, GraphQL, machine learning with TensorFlow and PyTorch."
+)
+
+# Loading the signed-in user, then the results; full listings add one selectin
+# query per child collection
+USER_QUERIES = 1
+# (query parameters, statements the request may issue)
+LISTINGS = {
+    "full": ({}, USER_QUERIES + 1 + 4),
+    "full page": ({"cursor": 0, "limit": 100}, USER_QUERIES + 1 + 4),
+    "summary": ({"summary": "true"}, USER_QUERIES + 1),
+    "summary page": ({"summary": "true", "cursor": 0, "limit": 100}, USER_QUERIES + 1),
+}
+
+def seed_match_results(db, user, count):
+    """Store count analysed match results, each with its full child graph."""
+    service = AnalysisService()
+    resume = Resume(user_id=user.id, filename="resume.pdf", file_path="-", extracted_text=RESUME_TEXT)
+    jds = [JobDescription(user_id=user.id, title=f"Backend {i}", description=JD_TEXT) for i in range(count)]
+    db.add_all([resume, *jds])
+    db.flush()
+    analysis = service.matcher.analyze_match(RESUME_TEXT, JD_TEXT)
+    service._persist_match_results(db, resume.id, [(jd.id, analysis) for jd in jds])
+    db.commit()
+
+def count_statements(engine, request):
+    statements = []
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = request()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return response, statements
+
+@pytest.mark.parametrize("listing", list(LISTINGS))
+@pytest.mark.parametrize("results", [1, 40])
+def test_listing_takes_fixed_queries(engine, db, user, client, listing, results):
+    params, expected = LISTINGS[listing]
+    seed_match_results(db, user, results)
+    
+    response, statements = count_statements(engine, lambda: client.get("/api/analysis/results", params=params))
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == results
+    if "summary" not in params:
+        assert all(item["skills"] and item["syllabus_items"] and item["interview_questions"] for item in body)
+    assert len(statements) == expected, statements
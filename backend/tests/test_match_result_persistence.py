@@ -0,0 +1,67 @@
+"""
+Storing match results must take a fixed number of statements, however many
+results and child rows there are.
+"""
+
+import pytest
+from sqlalchemy import event, func, select
+from app.models.user import User
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from app.models.match_result import MatchResult
+from app.models.skill import Skill
+from app.models.syllabus import Syllabus
+from app.models.interview_question import InterviewQuestion
+from app.models.learning_resource import LearningResource
+from app.services.analysis_service import AnalysisService
+
+RESUME_TEXT = (
+    "Senior software engineer with Python, Django, Flask and FastAPI. Built REST APIs "
+    "and microservices on AWS with Docker and Kubernetes. PostgreSQL, Redis, React."
+)
+JD_TEXT = (
+    "We need a backend engineer: Python, Java, Spring Boot, Kubernetes, Terraform, "
+    "Kafka, PostgreSQL, MongoDB, GraphQL, machine learning with TensorFlow and PyTorch."
+)
+
+# One INSERT ... RETURNING for the match results plus one executemany per child table
+EXPECTED_STATEMENTS = 1 + 4
+
+@pytest.fixture(scope="module")
+def service():
+    return AnalysisService()
+
+def add_resume_and_jds(db, count):
+    user = User(email="persist@example.com", hashed_password="-", full_name="Persist")
+    db.add(user)
+    db.flush()
+    resume = Resume(user_id=user.id, filename="resume.pdf", file_path="-", extracted_text=RESUME_TEXT)
+    jds = [JobDescription(user_id=user.id, title=f"Backend {i}", description=JD_TEXT) for i in range(count)]
+    db.add_all([resume, *jds])
+    db.commit()
+    return resume.id, [jd.id for jd in jds]
+
+@pytest.mark.parametrize("results", [1, 5, 40])
+def test_statement_count_does_not_grow_with_results(service, engine, db, results):
+    resume_id, jd_ids = add_resume_and_jds(db, results)
+    analysis = service.matcher.analyze_match(RESUME_TEXT, JD_TEXT)
+    analyses = [(jd_id, analysis) for jd_id in jd_ids]
+    
+    statements = []
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        ids = service._persist_match_results(db, resume_id, analyses)
+        db.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    
+    assert len(statements) == EXPECTED_STATEMENTS, statements
+    # Ids come back in the order of the analyses
+    assert [db.get(MatchResult, match_result_id).job_description_id for match_result_id in ids] == jd_ids
+    assert db.scalar(select(func.count()).select_from(MatchResult)) == results
+    for model in (Skill, Syllabus, InterviewQuestion, LearningResource):
+        per_result = db.scalar(select(func.count()).select_from(model)) / results
+        assert per_result > 0 and per_result.is_integer(), model.__tablename__
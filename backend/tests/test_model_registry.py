@@ -0,0 +1,59 @@
+"""
+Model artifacts: the compact forest is shared through memory-mapped arrays,
+and reload_if_changed() picks up replaced files.
+"""
+
+import os
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from ml.compact_forest import CompactForest
+from ml.model_registry import ModelRegistry, save_artifact
+
+@pytest.fixture
+def registry():
+    ModelRegistry._artifacts.clear()
+    yield ModelRegistry
+    ModelRegistry._artifacts.clear()
+
+def fit_forest(seed: int) -> RandomForestClassifier:
+    rng = np.random.default_rng(seed)
+    X = rng.random((200, 6))
+    y = rng.integers(0, 3, 200)
+    return RandomForestClassifier(n_estimators=5, random_state=seed).fit(X, y)
+
+def bump_mtime(path: str):
+    """Make a rewrite visible even on filesystems with coarse timestamps."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+def test_compact_forest_arrays_are_memory_mapped(registry, tmp_path):
+    path = str(tmp_path / "matching_model.compact.pkl")
+    forest = fit_forest(0)
+    save_artifact(CompactForest(forest), path)
+    
+    compact, _ = registry.get(path)
+    
+    for name in ("feature", "threshold", "left", "right", "roots", "leaf_values", "used_features"):
+        assert isinstance(getattr(compact, name), np.memmap), name
+    X = np.random.default_rng(1).random((20, 6))
+    assert np.array_equal(compact.predict(X), forest.predict(X))
+
+def test_reload_if_changed(registry, tmp_path):
+    path = str(tmp_path / "vectorizer.pkl")
+    save_artifact({"generation": 1}, path)
+    _, first_version = registry.get(path)
+    
+    assert registry.reload_if_changed() == []
+    
+    save_artifact({"generation": 2}, path)
+    bump_mtime(path)
+    assert registry.reload_if_changed() == [path]
+    artifact, version = registry.get(path)
+    assert artifact == {"generation": 2}
+    assert version != first_version
+    
+    os.remove(path)
+    assert registry.reload_if_changed() == [path]
+    assert path not in registry._artifacts
+    assert registry.get(path) is None
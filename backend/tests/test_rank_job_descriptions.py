@@ -0,0 +1,50 @@
+"""
+Ranking a resume against many job descriptions must score each pair exactly as
+analysing that pair alone does, with or without a corpus vectorizer.
+"""
+
+import pytest
+from ml.matcher import ResumeMatcher, CORPUS_VECTORIZER_PATH
+from ml.model_registry import ModelRegistry
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+
+RESUME_TEXT = (
+    "Senior software engineer with Python, Django and FastAPI. Built REST APIs and "
+    "microservices on AWS with Docker and Kubernetes. PostgreSQL, Redis and React."
+)
+JD_TEXTS = [
+    "Backend engineer: Python, Django, PostgreSQL and Docker. REST API design.",
+    "Java developer with Spring Boot, Kafka and microservices on Kubernetes.",
+    "Data scientist: Python, pandas, scikit-learn, TensorFlow and SQL.",
+    "Frontend developer: React, TypeScript, GraphQL and CSS.",
+]
+
+@pytest.fixture(params=[False, True], ids=["pair-fitted", "corpus vectorizer"])
+def corpus_vectorizer(request, tmp_path, monkeypatch):
+    """Run from an empty directory, with or without a fitted corpus vectorizer in its models/."""
+    monkeypatch.chdir(tmp_path)
+    ModelRegistry._artifacts.clear()
+    if request.param:
+        ResumeMatcher.fit_corpus_vectorizer([RESUME_TEXT] + JD_TEXTS, CORPUS_VECTORIZER_PATH)
+    yield request.param
+    ModelRegistry._artifacts.clear()
+
+def test_rank_scores_like_analyze(corpus_vectorizer, db, user, client):
+    assert (ResumeMatcher().corpus_vectorizer is not None) == corpus_vectorizer
+    resume = Resume(user_id=user.id, filename="resume.pdf", file_path="-", extracted_text=RESUME_TEXT)
+    jds = [JobDescription(user_id=user.id, title=f"Role {i}", description=text) for i, text in enumerate(JD_TEXTS)]
+    db.add_all([resume, *jds])
+    db.commit()
+    
+    response = client.post("/api/analysis/rank", json={"resume_id": resume.id})
+    assert response.status_code == 200
+    ranking = {entry["job_description_id"]: entry for entry in response.json()}
+    assert len(ranking) == len(jds)
+    
+    for jd in jds:
+        response = client.post("/api/analysis/analyze", json={"resume_id": resume.id, "job_description_id": jd.id})
+        assert response.status_code == 201
+        analysis = response.json()
+        assert ranking[jd.id]["similarity_score"] == analysis["similarity_score"]
+        assert ranking[jd.id]["match_status"] == analysis["match_status"]
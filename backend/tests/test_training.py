@@ -0,0 +1,92 @@
+"""
+Training: appending rows to cached data extends the cached forest instead of
+training a new one, and tuning fits its search to the size of the dataset.
+"""
+
+import random
+import pytest
+from ml.train_model import MATCH_LABELS, ResumeMatchingModelTrainer, create_sample_training_data
+
+SKILLS = [
+    "python", "django", "react", "java", "spring", "kubernetes", "docker", "aws",
+    "postgresql", "terraform", "kafka", "graphql", "tensorflow", "pytorch", "vue", "golang",
+]
+
+def make_pairs(count: int, seed: int):
+    """Labeled pairs whose label follows the share of JD skills in the resume."""
+    rng = random.Random(seed)
+    resume_texts, jd_texts, labels = [], [], []
+    for i in range(count):
+        label = MATCH_LABELS[i % len(MATCH_LABELS)]
+        required = rng.sample(SKILLS, 5)
+        shared = {"Good Match": 5, "Partial Match": 3, "Poor Match": 0}[label]
+        others = [skill for skill in SKILLS if skill not in required]
+        resume = required[:shared] + rng.sample(others, 5 - shared)
+        resume_texts.append(f"Engineer experienced with {' '.join(resume)} and teamwork")
+        jd_texts.append(f"We are hiring an engineer who knows {' '.join(required)}")
+        labels.append(label)
+    return resume_texts, jd_texts, labels
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "feature_cache")
+
+def test_appended_rows_extend_the_cached_forest(cache_dir):
+    resume_texts, jd_texts, labels = make_pairs(150, seed=0)
+    first = ResumeMatchingModelTrainer()
+    assert first.train(resume_texts, jd_texts, labels, cache_dir=cache_dir)['incremental'] is False
+    first_trees = first.model.estimators_
+    
+    new_resumes, new_jds, new_labels = make_pairs(60, seed=1)
+    second = ResumeMatchingModelTrainer()
+    metrics = second.train(
+        resume_texts + new_resumes, jd_texts + new_jds, labels + new_labels, cache_dir=cache_dir
+    )
+    
+    assert metrics['incremental'] is True
+    # Evaluated on the new rows' held-out split only
+    assert sum(map(sum, metrics['confusion_matrix'])) == 12
+    # The old trees are kept as they were; 60 new rows on 150 add 40 trees
+    assert len(second.model.estimators_) == 140
+    for old, kept in zip(first_trees, second.model.estimators_):
+        assert (old.tree_.threshold == kept.tree_.threshold).all()
+    assert second.model.warm_start is False
+    assert second.vectorizer.vocabulary_ == first.vectorizer.vocabulary_
+
+def test_changed_rows_train_from_scratch(cache_dir):
+    resume_texts, jd_texts, labels = make_pairs(150, seed=0)
+    ResumeMatchingModelTrainer().train(resume_texts, jd_texts, labels, cache_dir=cache_dir)
+    
+    trainer = ResumeMatchingModelTrainer()
+    metrics = trainer.train(resume_texts[1:], jd_texts[1:], labels[1:], cache_dir=cache_dir)
+    
+    assert metrics['incremental'] is False
+    assert len(trainer.model.estimators_) == 100
+
+def test_tune_runs_on_the_sample_data():
+    data = create_sample_training_data()
+    trainer = ResumeMatchingModelTrainer()
+    
+    report = trainer.tune(data['resume_texts'], data['jd_texts'], data['labels'])
+    
+    # 12 examples leave 9 for training: too few for two halving rounds, so one
+    # plain search over at most 9 candidates, with 3 folds of one per label each
+    assert report['rounds'] == [{'round': 0, 'candidates': 9, 'n_resources': 9}]
+    assert sum(map(sum, report['confusion_matrix'])) == 3
+    assert trainer.is_trained
+
+def test_tune_clamps_candidates_to_the_halving_rounds():
+    resume_texts, jd_texts, labels = make_pairs(150, seed=0)
+    
+    report = ResumeMatchingModelTrainer().tune(resume_texts, jd_texts, labels)
+    
+    # 120 training examples fit rounds of 18 and 54: 40 candidates would not
+    # narrow down, so 9 start and 3 go on
+    assert [(r['candidates'], r['n_resources']) for r in report['rounds']] == [(9, 18), (3, 54)]
+
+def test_tune_rejects_labels_too_rare_to_split():
+    resume_texts, jd_texts, labels = make_pairs(12, seed=0)
+    labels[:2] = ['Rare', 'Rare']
+    
+    with pytest.raises(ValueError):
+        ResumeMatchingModelTrainer().tune(resume_texts, jd_texts, labels)
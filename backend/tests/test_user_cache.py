@@ -0,0 +1,69 @@
+"""
+Cached users are invalidated when the transaction that changed them commits,
+not when the change is flushed.
+"""
+
+import pytest
+from app.api.dependencies import CHANGED_USER_IDS, _cache_key, _snapshot, user_cache
+from app.models.user import User
+
+@pytest.fixture
+def cached_user(db, user):
+    key = _cache_key(user.email, user.id)
+    user_cache.clear()
+    user_cache.put(key, _snapshot(user))
+    yield key
+    user_cache.clear()
+
+def test_update_invalidates_on_commit(db, user, cached_user):
+    user.full_name = "Renamed"
+    db.flush()
+    # Another request may read and re-cache the committed row in the meantime
+    assert user_cache.get(cached_user) is not None
+    
+    db.commit()
+    
+    assert user_cache.get(cached_user) is None
+    assert CHANGED_USER_IDS not in db.info
+
+def test_delete_invalidates_on_commit(db, user, cached_user):
+    db.delete(user)
+    db.flush()
+    assert user_cache.get(cached_user) is not None
+    
+    db.commit()
+    
+    assert user_cache.get(cached_user) is None
+
+def test_rollback_keeps_the_entry(db, user, cached_user):
+    user.full_name = "Renamed"
+    db.flush()
+    
+    db.rollback()
+    
+    assert user_cache.get(cached_user) is not None
+    assert CHANGED_USER_IDS not in db.info
+    # A later unrelated commit does not drop it either
+    db.add(User(email="other@example.com", hashed_password="-"))
+    db.commit()
+    assert user_cache.get(cached_user) is not None
+
+def test_savepoint_waits_for_the_outer_commit(db, user, cached_user):
+    with db.begin_nested():
+        user.full_name = "Renamed"
+    assert user_cache.get(cached_user) is not None
+    
+    db.commit()
+    
+    assert user_cache.get(cached_user) is None
+
+def test_rolled_back_savepoint_keeps_the_outer_change(db, user, cached_user):
+    user.full_name = "Renamed"
+    db.flush()
+    savepoint = db.begin_nested()
+    db.add(User(email="other@example.com", hashed_password="-"))
+    savepoint.rollback()
+    
+    db.commit()
+    
+    assert user_cache.get(cached_user) is None
@@ -0,0 +1,78 @@
+"""
+VectorIndex: search over sealed blocks and pending rows matches a brute-force
+scan, without sealing on search, and dead rows are compacted away.
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix, random as sparse_random
+from sklearn.preprocessing import normalize
+from ml.vector_index import VectorIndex
+
+N_FEATURES = 50
+
+def make_vectors(count: int, seed: int) -> csr_matrix:
+    matrix = sparse_random(count, N_FEATURES, density=0.2, random_state=seed, format='csr')
+    return normalize(matrix).tocsr()
+
+def brute_force(vectors: dict, owners: dict, query: csr_matrix, k: int, owner_id=None):
+    scores = {
+        doc_id: float((vector @ query.T).toarray()[0, 0])
+        for doc_id, vector in vectors.items()
+        if owner_id is None or owners[doc_id] == owner_id
+    }
+    return sorted(scores.items(), key=lambda item: (-item[1], -item[0]))[:k]
+
+def assert_same_results(index, vectors, owners, queries, k=5):
+    for query in queries:
+        for owner_id in (None, 1):
+            expected = brute_force(vectors, owners, query, k, owner_id)
+            found = index.search(query, k, owner_id=owner_id)
+            assert [doc_id for doc_id, _ in found] == [doc_id for doc_id, _ in expected]
+            assert np.allclose([score for _, score in found], [score for _, score in expected])
+
+def test_search_covers_blocks_and_pending_rows():
+    index = VectorIndex(N_FEATURES, block_size=40, seal_threshold=20)
+    rows = make_vectors(110, seed=0)
+    vectors, owners = {}, {}
+    for doc_id in range(110):
+        vectors[doc_id], owners[doc_id] = rows[doc_id], doc_id % 3
+        index.add(doc_id, rows[doc_id], owner_id=doc_id % 3)
+    
+    # 100 rows sealed 20 at a time into blocks of 40, 40 and 20; the last 10 stay pending
+    assert [block[0].shape[0] for block in index._blocks] == [40, 40, 20]
+    assert len(index._pending_ids) == 10 and len(index) == 110
+    
+    queries = make_vectors(10, seed=1)
+    assert_same_results(index, vectors, owners, queries)
+    # Searching does not seal the pending rows
+    assert len(index._pending_ids) == 10
+
+def test_dead_rows_are_compacted():
+    index = VectorIndex(N_FEATURES, block_size=40, seal_threshold=40, compact_fraction=0.25)
+    rows = make_vectors(80, seed=2)
+    vectors, owners = {}, {}
+    for doc_id in range(80):
+        vectors[doc_id], owners[doc_id] = rows[doc_id], doc_id % 2
+        index.add(doc_id, rows[doc_id], owner_id=doc_id % 2)
+    
+    # Replacing a sealed row tombstones it; 10 of 40 dead compacts the block
+    replacements = make_vectors(10, seed=3)
+    for i, doc_id in enumerate(range(0, 20, 2)):
+        vectors[doc_id] = replacements[i]
+        index.add(doc_id, replacements[i], owner_id=owners[doc_id])
+    assert index._blocks[0][0].shape[0] == 30 and index._blocks[0][3].all()
+    
+    # A block whose rows are all removed is dropped; later rows keep working
+    for doc_id in range(1, 40, 2):
+        del vectors[doc_id]
+        index.remove(doc_id)
+    for doc_id in range(20, 40, 2):
+        del vectors[doc_id]
+        index.remove(doc_id)
+    assert [block[0].shape[0] for block in index._blocks] == [40]
+    assert len(index) == len(vectors)
+    
+    assert_same_results(index, vectors, owners, make_vectors(10, seed=4))
+    index.remove(79)
+    del vectors[79]
+    assert_same_results(index, vectors, owners, make_vectors(10, seed=5))
@@ -0,0 +1,99 @@
+"""
+Compare per-pair prediction latency and size of the matching model formats.
+Run: python benchmark_model.py [--model-dir models] [--pairs 500] [--data resume_data.csv]
+
+Times, for the same resume/JD pairs:
+  - tfidf:   ResumeMatcher's plain TF-IDF scoring (no trained model)
+  - pickle:  feature building + predict_proba with matching_model.pkl
+  - compact: the same with matching_model.compact.pkl (export_compact_model.py)
+
+Texts come from --data: a CSV with a Resume column (like resume_data.csv) or
+resume_text/jd_text columns, or training_data.json.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+import joblib
+import pandas as pd
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.matcher import ResumeMatcher
+from ml.pair_features import pair_features
+
+def load_pairs(path: Path, count: int):
+    if path.suffix == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        pairs = list(zip(data.get('resume_texts', []), data.get('jd_texts', [])))
+    else:
+        df = pd.read_csv(path)
+        if 'resume_text' in df.columns:
+            pairs = list(zip(df['resume_text'].fillna(""), df['jd_text'].fillna("")))
+        else:
+            # Only resumes: pair them with each other
+            texts = df['Resume'].fillna("").tolist()
+            pairs = list(zip(texts, random.Random(42).sample(texts, len(texts))))
+    random.Random(42).shuffle(pairs)
+    return pairs[:count]
+
+def percentiles(timings):
+    ordered = sorted(timings)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+    return p50 * 1000, p99 * 1000
+
+def time_each(pairs, score):
+    timings = []
+    for resume_text, jd_text in pairs:
+        start = time.perf_counter()
+        score(resume_text, jd_text)
+        timings.append(time.perf_counter() - start)
+    return percentiles(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-dir", default=str(Path(__file__).parent / 'models'))
+    parser.add_argument("--data", default=str(Path(__file__).parent / 'resume_data.csv'))
+    parser.add_argument("--pairs", type=int, default=500)
+    args = parser.parse_args()
+    
+    model_path = os.path.join(args.model_dir, 'matching_model.pkl')
+    compact_path = os.path.join(args.model_dir, 'matching_model.compact.pkl')
+    vectorizer_path = os.path.join(args.model_dir, 'vectorizer.pkl')
+    if not os.path.exists(model_path) or not os.path.exists(vectorizer_path):
+        print(f"❌ No trained model in {args.model_dir}/")
+        return
+    
+    pairs = load_pairs(Path(args.data), args.pairs)
+    print(f"Benchmarking {len(pairs)} pairs from {args.data}\n")
+    
+    vectorizer = joblib.load(vectorizer_path)
+    formats = [('pickle', model_path, joblib.load(model_path))]
+    if os.path.exists(compact_path):
+        formats.append(('compact', compact_path, joblib.load(compact_path)))
+    else:
+        print("ℹ️  No compact model; run export_compact_model.py to include it\n")
+    
+    matcher = ResumeMatcher()
+    features = {text: matcher.extract_features(text) for pair in pairs for text in pair}
+    
+    print(f"{'format':<10} {'p50 ms':>9} {'p99 ms':>9} {'size KB':>10}")
+    p50, p99 = time_each(pairs, lambda r, j: matcher._score(r, j, features[r], features[j]))
+    print(f"{'tfidf':<10} {p50:>9.2f} {p99:>9.2f} {'-':>10}")
+    
+    for name, path, model in formats:
+        def score(resume_text, jd_text):
+            model.predict_proba(pair_features(vectorizer, [resume_text], [jd_text]))
+        score(*pairs[0])  # Warm-up
+        p50, p99 = time_each(pairs, score)
+        print(f"{name:<10} {p50:>9.2f} {p99:>9.2f} {os.path.getsize(path) / 1024:>10.0f}")
+
+if __name__ == "__main__":
+    main()
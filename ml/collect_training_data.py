@@ -1,6 +1,9 @@
 """
 Script to collect training data from your database.
 Run this from the backend directory.
+
+    python ../ml/collect_training_data.py           # training_data.json (for train.py)
+    python ../ml/collect_training_data.py --jsonl   # training_data.jsonl, streamed (for train_stream.py)
 """
 
 import sys
@@ -16,6 +19,35 @@ from app.models.resume import Resume
 from app.models.job_description import JobDescription
 import json
 
+def export_training_data_jsonl(batch_size: int = 1000):
+    """Write every labeled pair to training_data.jsonl, one row at a time."""
+    db = SessionLocal()
+    output_file = Path(__file__).parent / 'training_data.jsonl'
+    count = 0
+    
+    try:
+        rows = (
+            db.query(Resume.extracted_text, JobDescription.description, MatchResult.match_status)
+            .join(Resume, Resume.id == MatchResult.resume_id)
+            .join(JobDescription, JobDescription.id == MatchResult.job_description_id)
+            .filter(Resume.extracted_text.isnot(None))
+            .yield_per(batch_size)
+        )
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for resume_text, jd_text, label in rows:
+                f.write(json.dumps({'resume_text': resume_text, 'jd_text': jd_text, 'label': label}, ensure_ascii=False) + "\n")
+                count += 1
+        
+        print(f"\n✅ Exported {count} training examples")
+        print(f"   Saved to: {output_file}")
+        return count
+        
+    except Exception as e:
+        print(f"❌ Error collecting data: {str(e)}")
+        return None
+    finally:
+        db.close()
+
 def collect_training_data():
     """Collect training data from database."""
     db = SessionLocal()
@@ -72,5 +104,8 @@ def collect_training_data():
         db.close()
 
 if __name__ == "__main__":
-    collect_training_data()
+    if "--jsonl" in sys.argv[1:]:
+        export_training_data_jsonl()
+    else:
+        collect_training_data()
 
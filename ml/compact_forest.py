@@ -0,0 +1,149 @@
+"""
+Compact inference format for tree-ensemble matching models.
+
+A pickled scikit-learn forest stores, for every node of every tree, a
+float64 threshold, impurity, sample counts and a full class-value row, and
+predicts one tree at a time. CompactForest keeps only what prediction needs,
+as a few flat arrays: split feature, float32 threshold and child indices per
+node, and float32 class probabilities per leaf. Prediction walks all trees
+level by level with numpy, and only the input columns the trees actually
+split on are read from the (sparse) feature matrix.
+"""
+
+import os
+import joblib
+import numpy as np
+from scipy.sparse import issparse
+from typing import Any, Optional, Tuple
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from ml.model_registry import save_artifact
+
+def _forest_of(model: Any):
+    """The forest inside a model (bare or as the last step of a pass-through Pipeline)."""
+    if isinstance(model, Pipeline):
+        for _, step in model.steps[:-1]:
+            if step not in (None, 'passthrough'):
+                raise ValueError("Only forests without a preprocessing step can be compacted")
+        model = model.steps[-1][1]
+    if not isinstance(model, (RandomForestClassifier, ExtraTreesClassifier)):
+        raise ValueError(f"Only random forest / extra trees models can be compacted, not {type(model).__name__}")
+    return model
+
+def _float32_at_most(values: np.ndarray) -> np.ndarray:
+    """
+    Largest float32 <= each value.
+    
+    Trees compare float32 inputs with `x <= threshold`; for a float32 x that is
+    true exactly when x <= this rounded-down threshold, so predictions don't change.
+    """
+    rounded = values.astype(np.float32)
+    too_high = rounded.astype(np.float64) > values
+    rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+    return rounded
+
+class CompactForest:
+    """
+    Flattened random forest with the predict/predict_proba interface of the original.
+    
+    Node arrays hold every tree back to back; roots[i] is tree i's first node.
+    Leaves have feature -1 and point to their probability row through left.
+    """
+    
+    def __init__(self, model: Any, source_stamp: Optional[Tuple[int, int]] = None):
+        """
+        Args:
+            model: Fitted RandomForestClassifier / ExtraTreesClassifier (or a
+                Pipeline ending in one with pass-through preprocessing)
+            source_stamp: (size, mtime_ns) of the pickle it was exported from
+        """
+        forest = _forest_of(model)
+        self.classes_ = forest.classes_
+        self.n_features_in_ = forest.n_features_in_
+        self.source_stamp = source_stamp
+        
+        features, thresholds, lefts, rights, roots, leaf_values = [], [], [], [], [], []
+        node_offset = 0
+        leaf_offset = 0
+        max_depth = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            is_leaf = tree.children_left < 0
+            leaf_ids = np.cumsum(is_leaf) - 1 + leaf_offset
+            
+            values = tree.value[is_leaf, 0, :]
+            values = values / np.maximum(values.sum(axis=1, keepdims=True), 1e-12)
+            
+            features.append(np.where(is_leaf, -1, tree.feature))
+            thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+            lefts.append(np.where(is_leaf, leaf_ids, tree.children_left + node_offset))
+            rights.append(np.where(is_leaf, -1, tree.children_right + node_offset))
+            leaf_values.append(values)
+            roots.append(node_offset)
+            
+            node_offset += tree.node_count
+            leaf_offset += int(is_leaf.sum())
+            max_depth = max(max_depth, tree.max_depth)
+        
+        feature = np.concatenate(features)
+        # Only columns used by some split are read at prediction time; renumber them densely
+        self.used_features = np.unique(feature[feature >= 0]).astype(np.int32)
+        remap = np.full(max(self.n_features_in_, 1), -1, dtype=np.int32)
+        remap[self.used_features] = np.arange(len(self.used_features), dtype=np.int32)
+        
+        self.feature = np.where(feature >= 0, remap[np.maximum(feature, 0)], -1).astype(np.int32)
+        self.threshold = _float32_at_most(np.concatenate(thresholds))
+        self.left = np.concatenate(lefts).astype(np.int32)
+        self.right = np.concatenate(rights).astype(np.int32)
+        self.roots = np.array(roots, dtype=np.int32)
+        self.leaf_values = np.concatenate(leaf_values).astype(np.float32)
+        self.max_depth = max_depth
+    
+    def matches(self, model_path: str) -> bool:
+        """True if this was exported from the pickle currently at model_path."""
+        if self.source_stamp is None or not os.path.exists(model_path):
+            return False
+        stat = os.stat(model_path)
+        return (stat.st_size, stat.st_mtime_ns) == tuple(self.source_stamp)
+    
+    def predict_proba(self, X, batch_size: int = 256) -> np.ndarray:
+        """Class probabilities averaged over the trees, like the original forest's."""
+        n_rows = X.shape[0]
+        probabilities = np.empty((n_rows, len(self.classes_)), dtype=np.float64)
+        for start in range(0, n_rows, batch_size):
+            stop = min(start + batch_size, n_rows)
+            probabilities[start:stop] = self._predict_batch(X[start:stop])
+        return probabilities
+    
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+    
+    def _predict_batch(self, X) -> np.ndarray:
+        columns = X[:, self.used_features]
+        columns = columns.toarray() if issparse(columns) else np.asarray(columns)
+        # Inputs are compared as float32, as scikit-learn's trees do
+        columns = columns.astype(np.float32, copy=False)
+        
+        rows = np.arange(columns.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (columns.shape[0], len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            feature = self.feature[nodes]
+            internal = feature >= 0
+            if not internal.any():
+                break
+            go_left = columns[rows, np.maximum(feature, 0)] <= self.threshold[nodes]
+            nodes = np.where(internal, np.where(go_left, self.left[nodes], self.right[nodes]), nodes)
+        
+        return self.leaf_values[self.left[nodes]].mean(axis=1)
+
+def export_compact_model(model_path: str, compact_path: str) -> CompactForest:
+    """
+    Write the compact form of a saved forest next to it.
+    
+    The export records the source pickle's size and modification time, so a
+    model retrained later is not shadowed by a stale compact file.
+    """
+    stat = os.stat(model_path)
+    compact = CompactForest(joblib.load(model_path), source_stamp=(stat.st_size, stat.st_mtime_ns))
+    save_artifact(compact, compact_path)
+    return compact
@@ -0,0 +1,43 @@
+"""
+Export the trained forest in the compact inference format.
+Run: python export_compact_model.py [--model-dir models]
+
+Writes matching_model.compact.pkl next to matching_model.pkl. The app uses
+it instead of the pickled forest for as long as matching_model.pkl is not
+replaced; re-run this after each training. Compare the two with
+benchmark_model.py.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.compact_forest import export_compact_model
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-dir", default=str(Path(__file__).parent / 'models'))
+    args = parser.parse_args()
+    
+    model_path = os.path.join(args.model_dir, 'matching_model.pkl')
+    compact_path = os.path.join(args.model_dir, 'matching_model.compact.pkl')
+    if not os.path.exists(model_path):
+        print(f"❌ {model_path} not found! Train a model first.")
+        return
+    
+    try:
+        compact = export_compact_model(model_path, compact_path)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    print(f"✅ Exported {len(compact.roots)} trees ({len(compact.feature)} nodes, max depth {compact.max_depth})")
+    print(f"   {model_path}: {os.path.getsize(model_path) / 1024:.0f} KB")
+    print(f"   {compact_path}: {os.path.getsize(compact_path) / 1024:.0f} KB")
+
+if __name__ == "__main__":
+    main()
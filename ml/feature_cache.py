@@ -0,0 +1,136 @@
+"""
+On-disk cache of training feature matrices.
+
+Vectorizing the training set is the slow part of a training run, and the
+features only depend on the texts and the vectorizer settings, not on the
+labels or the model. Each cached entry stores the sparse feature matrix and
+the fitted vectorizer under a hash of the dataset, so re-running training on
+the same data skips vectorization, and a dataset that only appends rows to a
+cached one vectorizes just the new rows. An entry can also keep the random
+forest trained on it, which a run on appended rows extends with new trees
+instead of training from scratch.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import joblib
+from scipy.sparse import csr_matrix, load_npz, save_npz
+from typing import List, Optional, Tuple
+from ml.model_registry import save_artifact
+
+class FeatureCache:
+    """Feature matrices keyed by dataset hash, in one directory."""
+    
+    INDEX_FILE = 'index.json'
+    
+    def __init__(self, cache_dir: str, vectorizer, max_entries: int = 3):
+        """
+        Args:
+            cache_dir: Directory holding the cached matrices
+            vectorizer: The (unfitted) vectorizer; its settings are part of the key
+            max_entries: Oldest entries beyond this are deleted on save
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        params = sorted((name, repr(value)) for name, value in vectorizer.get_params().items())
+        self._settings = f"{type(vectorizer).__name__}:{params}".encode('utf-8')
+    
+    @staticmethod
+    def row_digests(resume_texts: List[str], jd_texts: List[str]) -> List[bytes]:
+        """One digest per training pair, in order."""
+        return [
+            hashlib.sha1(f"{resume}\0{jd}".encode('utf-8')).digest()
+            for resume, jd in zip(resume_texts, jd_texts)
+        ]
+    
+    def dataset_key(self, digests: List[bytes]) -> str:
+        """Hash of the vectorizer settings and the ordered rows."""
+        h = hashlib.sha1(self._settings)
+        for digest in digests:
+            h.update(digest)
+        return h.hexdigest()
+    
+    def find(self, digests: List[bytes]) -> Optional[Tuple[int, csr_matrix, object, object]]:
+        """
+        Find the cached entry covering the longest prefix of these rows.
+        
+        Returns:
+            Tuple of (rows covered, feature matrix, fitted vectorizer, model
+            trained on those rows or None), or None
+        """
+        index = self._read_index()
+        h = hashlib.sha1(self._settings)
+        prefix_keys = {}
+        wanted = {n_rows for n_rows in index.values() if n_rows <= len(digests)}
+        for i, digest in enumerate(digests, start=1):
+            h.update(digest)
+            if i in wanted:
+                prefix_keys[h.hexdigest()] = i
+        
+        matches = [(n_rows, key) for key, n_rows in index.items() if prefix_keys.get(key) == n_rows]
+        for n_rows, key in sorted(matches, reverse=True):
+            try:
+                features = load_npz(self._path(key, '.npz')).tocsr()
+                vectorizer = joblib.load(self._path(key, '.vectorizer.pkl'))
+            except (OSError, ValueError, EOFError):
+                continue
+            return n_rows, features, vectorizer, self._load_model(key)
+        return None
+    
+    def save(self, digests: List[bytes], features: csr_matrix, vectorizer):
+        """Store a feature matrix and the vectorizer that produced it."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        key = self.dataset_key(digests)
+        
+        # Write to a temporary name and rename, so a crash never leaves a truncated entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.npz')
+        os.close(fd)
+        try:
+            save_npz(tmp_path, features, compressed=False)
+            os.replace(tmp_path, self._path(key, '.npz'))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        save_artifact(vectorizer, self._path(key, '.vectorizer.pkl'))
+        
+        index = self._read_index()
+        index.pop(key, None)
+        index[key] = len(digests)
+        # Entries are kept in insertion order; drop the oldest
+        while len(index) > self.max_entries:
+            stale = next(iter(index))
+            del index[stale]
+            for suffix in ('.npz', '.vectorizer.pkl', '.model.pkl'):
+                if os.path.exists(self._path(stale, suffix)):
+                    os.remove(self._path(stale, suffix))
+        self._write_index(index)
+    
+    def save_model(self, digests: List[bytes], model):
+        """Keep the model trained on a cached entry's rows, with that entry."""
+        key = self.dataset_key(digests)
+        if key in self._read_index():
+            save_artifact(model, self._path(key, '.model.pkl'))
+    
+    def _load_model(self, key: str):
+        try:
+            return joblib.load(self._path(key, '.model.pkl'))
+        except (OSError, ValueError, EOFError):
+            return None
+    
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, key + suffix)
+    
+    def _read_index(self) -> dict:
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_index(self, index: dict):
+        tmp_path = os.path.join(self.cache_dir, self.INDEX_FILE + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(self.cache_dir, self.INDEX_FILE))
@@ -0,0 +1,70 @@
+"""
+Script to fit the corpus TF-IDF vectorizer used by ResumeMatcher.
+Run this from the backend directory so the model lands in backend/models/.
+
+Once the vectorizer exists, ResumeMatcher only calls transform() per request
+instead of refitting on every resume/JD pair.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend and project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'backend'))
+sys.path.insert(0, str(project_root))
+
+from app.core.database import SessionLocal
+from app.models.resume import Resume
+from app.models.job_description import JobDescription
+from app.services.document_feature_service import DocumentFeatureService
+from ml.matcher import ResumeMatcher, CORPUS_VECTORIZER_PATH
+
+def fit_corpus_vectorizer():
+    """Fit the vectorizer on every stored resume and job description."""
+    db = SessionLocal()
+    
+    try:
+        resume_texts = [
+            text for (text,) in db.query(Resume.extracted_text).filter(Resume.extracted_text.isnot(None))
+        ]
+        jd_texts = [text for (text,) in db.query(JobDescription.description)]
+        
+        corpus = [text for text in resume_texts + jd_texts if text and text.strip()]
+        print(f"Found {len(resume_texts)} resumes and {len(jd_texts)} job descriptions...")
+        
+        if not corpus:
+            print("❌ No documents found. Upload resumes and job descriptions first.")
+            return None
+        
+        vectorizer = ResumeMatcher.fit_corpus_vectorizer(corpus, CORPUS_VECTORIZER_PATH)
+        
+        print(f"\n✅ Fitted vectorizer on {len(corpus)} documents")
+        print(f"   Vocabulary size: {len(vectorizer.vocabulary_)}")
+        print(f"   Saved to: {CORPUS_VECTORIZER_PATH}")
+        
+        # Recompute cached document vectors so resume search covers the whole store
+        print("\nRefreshing cached document features...")
+        feature_service = DocumentFeatureService(ResumeMatcher(CORPUS_VECTORIZER_PATH))
+        for count, resume in enumerate(db.query(Resume).filter(Resume.extracted_text.isnot(None)).yield_per(500), 1):
+            feature_service.get_resume_features(db, resume)
+            if count % 500 == 0:
+                db.commit()
+        for count, jd in enumerate(db.query(JobDescription).yield_per(500), 1):
+            feature_service.get_job_description_features(db, jd)
+            if count % 500 == 0:
+                db.commit()
+        db.commit()
+        print("   ✅ Document features refreshed")
+        print("\nRestart your backend server (or let it pick up the new file) to use it.")
+        
+        return vectorizer
+    
+    except Exception as e:
+        print(f"❌ Error fitting vectorizer: {str(e)}")
+        return None
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    fit_corpus_vectorizer()
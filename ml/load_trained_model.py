@@ -3,12 +3,11 @@ Script to load and use a trained model (if available).
 This integrates trained models into the existing system.
 """
 
-import os
 import numpy as np
-import joblib
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from ml.matcher import ResumeMatcher
-from ml.skill_extractor import SkillExtractor
+from ml.model_registry import ModelRegistry, TRAINED_COMPACT_MODEL_PATH, TRAINED_MODEL_PATH, TRAINED_VECTORIZER_PATH
+from ml.pair_features import pair_features
 
 class TrainedResumeMatcher(ResumeMatcher):
     """
@@ -26,79 +25,96 @@ class TrainedResumeMatcher(ResumeMatcher):
             self._load_trained_model()
     
     def _load_trained_model(self):
-        """Load trained model if it exists."""
-        model_dir = 'models'
-        model_path = os.path.join(model_dir, 'matching_model.pkl')
-        vectorizer_path = os.path.join(model_dir, 'vectorizer.pkl')
+        """Use the trained model if it exists (loaded once per process by the registry)."""
+        try:
+            # Prefer the compact export (export_compact_model.py) while it matches the saved model
+            model = ModelRegistry.get(TRAINED_COMPACT_MODEL_PATH)
+            if not model or not model[0].matches(TRAINED_MODEL_PATH):
+                model = ModelRegistry.get(TRAINED_MODEL_PATH)
+            vectorizer = ModelRegistry.get(TRAINED_VECTORIZER_PATH)
+        except Exception as e:
+            print(f"⚠️  Could not load trained model: {e}")
+            print("   Using default TF-IDF method")
+            return
         
-        if os.path.exists(model_path) and os.path.exists(vectorizer_path):
-            try:
-                self.trained_model = joblib.load(model_path)
-                self.trained_vectorizer = joblib.load(vectorizer_path)
-                self.use_trained = True
-                print("✅ Loaded trained model")
-            except Exception as e:
-                print(f"⚠️  Could not load trained model: {e}")
-                print("   Using default TF-IDF method")
+        if model and vectorizer:
+            self.trained_model = model[0]
+            self.trained_vectorizer = vectorizer[0]
+            self.use_trained = True
         else:
             print("ℹ️  No trained model found. Using default TF-IDF method.")
     
-    def analyze_match(self, resume_text: str, jd_text: str) -> Dict:
+    def _score(self, resume_text: str, jd_text: str, resume_features: Dict, jd_features: Dict) -> Tuple[float, str]:
         """
-        Analyze match using trained model if available, otherwise use default method.
+        Scoring stage: use the trained model when loaded.
+        
+        analyze_match() runs ResumeMatcher's staged pipeline unchanged, so skills
+        are still extracted once and shared with the suggestions.
         """
         if self.use_trained and self.trained_model:
-            return self._analyze_with_trained_model(resume_text, jd_text)
-        else:
-            return super().analyze_match(resume_text, jd_text)
+            return self._score_with_trained_model(resume_text, jd_text)
+        return super()._score(resume_text, jd_text, resume_features, jd_features)
     
-    def _analyze_with_trained_model(self, resume_text: str, jd_text: str) -> Dict:
-        """Analyze using trained model."""
-        # Prepare features (same as training)
-        combined_text = f"{resume_text} {jd_text}"
-        tfidf_features = self.trained_vectorizer.transform([combined_text]).toarray()
-        
-        # Additional features
-        resume_words = len(resume_text.split())
-        jd_words = len(jd_text.split())
-        resume_word_set = set(resume_text.lower().split())
-        jd_word_set = set(jd_text.lower().split())
-        overlap = len(resume_word_set & jd_word_set) / max(len(jd_word_set), 1)
-        
-        additional_features = np.array([[
-            resume_words,
-            jd_words,
-            resume_words / max(jd_words, 1),
-            overlap
-        ]])
+    def _score_with_trained_model(self, resume_text: str, jd_text: str) -> Tuple[float, str]:
+        """Predict match status and confidence with the trained model."""
+        return self.score_pairs([(resume_text, jd_text)])[0]
+    
+    def score_pairs(self, pairs: List[Tuple[str, str]], batch_size: int = 1000) -> List[Tuple[float, str]]:
+        """
+        Score many (resume_text, jd_text) pairs at once.
         
-        # Combine features
-        import numpy as np
-        features = np.hstack([tfidf_features, additional_features])
+        Each batch is one feature matrix and a single predict_proba call; the
+        label is the most probable class, as predict() would return, so the
+        model is not run a second time. Without a trained model each pair is
+        scored with the default TF-IDF method.
         
-        # Predict
-        match_status = self.trained_model.predict(features)[0]
-        probabilities = self.trained_model.predict_proba(features)[0]
-        similarity_score = max(probabilities) * 100  # Convert to percentage
+        Returns:
+            List of (similarity_score, match_status), in the order of pairs
+        """
+        if not (self.use_trained and self.trained_model):
+            return [
+                super(TrainedResumeMatcher, self)._score(
+                    resume_text, jd_text,
+                    self._complete_features(resume_text, None), self._complete_features(jd_text, None)
+                )
+                for resume_text, jd_text in pairs
+            ]
         
-        # Extract skills (using original method)
-        resume_skills = SkillExtractor.extract_skills_from_text(resume_text)
-        jd_skills = SkillExtractor.extract_skills_from_jd(jd_text)
-        missing_skills = SkillExtractor.find_missing_skills(resume_skills, jd_skills)
-        present_skills = SkillExtractor.find_present_skills(resume_skills, jd_skills)
+        results = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            features = pair_features(
+                self.trained_vectorizer,
+                [resume_text for resume_text, _ in batch],
+                [jd_text for _, jd_text in batch]
+            )
+            probabilities = self.trained_model.predict_proba(features)
+            best = np.argmax(probabilities, axis=1)
+            labels = self.trained_model.classes_[best]
+            confidences = probabilities[np.arange(len(batch)), best] * 100  # Convert to percentage
+            results.extend(
+                (round(float(confidence), 2), str(label))
+                for confidence, label in zip(confidences, labels)
+            )
+        return results
+    
+    def analyze_matches(self, pairs: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        Full analyze_match() results for many pairs, with batched scoring.
         
-        # Generate suggestions
-        correction_suggestions = self.generate_correction_suggestions(
-            resume_text, jd_text, similarity_score
-        )
+        Skills are extracted once per distinct text, so re-scoring one resume
+        against many job descriptions (or the reverse) does not repeat work.
+        """
+        features = {}
+        for pair in pairs:
+            for text in pair:
+                if text not in features:
+                    features[text] = self._complete_features(text, None)
         
-        return {
-            "similarity_score": round(similarity_score, 2),
-            "match_status": match_status,
-            "correction_suggestions": correction_suggestions,
-            "resume_skills": list(resume_skills),
-            "jd_skills": list(jd_skills),
-            "missing_skills": list(missing_skills),
-            "present_skills": list(present_skills)
-        }
-
+        scores = self.score_pairs(pairs)
+        results = []
+        for (resume_text, jd_text), (similarity_score, match_status) in zip(pairs, scores):
+            skill_gap = self.compare_skills(features[resume_text]['skills'], features[jd_text]['skills'])
+            correction_suggestions = self._format_suggestions(skill_gap, similarity_score)
+            results.append(self._build_payload(similarity_score, match_status, correction_suggestions, skill_gap))
+        return results
@@ -1,19 +1,117 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-from typing import Tuple, Dict, List
+import os
+import time
+from contextlib import contextmanager
+from scipy.sparse import csr_matrix, vstack
+from typing import Tuple, Dict, List, Optional
 from ml.skill_extractor import SkillExtractor
+from ml.model_registry import ModelRegistry, save_artifact
+
+CORPUS_VECTORIZER_PATH = os.path.join('models', 'corpus_vectorizer.pkl')
+
+def load_corpus_vectorizer(path: str = CORPUS_VECTORIZER_PATH) -> Optional[Tuple[TfidfVectorizer, str]]:
+    """
+    Load a corpus-fitted vectorizer from disk.
+    
+    Returns:
+        Tuple of (vectorizer, version), or None if it has not been fitted.
+        The version is a content hash of the file, so vectors cached
+        elsewhere can tell which vectorizer produced them.
+    """
+    # Loaded once per process and reloaded when the file changes
+    return ModelRegistry.get(path)
+
+@contextmanager
+def _timed(timings: Dict[str, float], stage: str):
+    """Record the wall time of a pipeline stage in milliseconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = round((time.perf_counter() - start) * 1000, 3)
 
 class ResumeMatcher:
-    def __init__(self):
+    def __init__(self, corpus_vectorizer_path: Optional[str] = CORPUS_VECTORIZER_PATH):
         self.vectorizer = TfidfVectorizer(max_features=5000, stop_words='english', ngram_range=(1, 2))
+        
+        # When a corpus-fitted vectorizer exists, requests only call transform()
+        self.corpus_vectorizer = None
+        self.corpus_vectorizer_version = None
+        if corpus_vectorizer_path:
+            try:
+                loaded = load_corpus_vectorizer(corpus_vectorizer_path)
+                if loaded:
+                    self.corpus_vectorizer, self.corpus_vectorizer_version = loaded
+            except Exception as e:
+                print(f"Could not load corpus vectorizer: {str(e)}")
+    
+    @property
+    def features_version(self) -> str:
+        """Identify the skill dictionary and vectorizer that document features depend on."""
+        return f"{SkillExtractor.DICTIONARY_VERSION}:{self.corpus_vectorizer_version or 'pair'}"
     
-    def calculate_similarity(self, resume_text: str, jd_text: str) -> float:
+    def extract_features(self, text: str) -> Dict:
+        """
+        Compute the reusable per-document features for a text.
+        
+        Returns:
+            Dict with 'skills' (set of skill names) and 'vector' (L2-normalised
+            1-row sparse TF-IDF vector, or None without a corpus vectorizer)
+        """
+        features = self._complete_features(text, None)
+        return {
+            "skills": features['skills'],
+            "vector": features.get('vector')
+        }
+    
+    @staticmethod
+    def fit_corpus_vectorizer(texts: List[str], path: str = CORPUS_VECTORIZER_PATH) -> TfidfVectorizer:
+        """
+        Fit a TF-IDF vectorizer once on a reference corpus and save it to disk.
+        
+        Args:
+            texts: Resume and job description texts making up the corpus
+            path: Where to save the fitted vectorizer
+        
+        Returns:
+            The fitted vectorizer
+        """
+        vectorizer = TfidfVectorizer(
+            max_features=20000,
+            stop_words='english',
+            ngram_range=(1, 2),
+            sublinear_tf=True
+        )
+        vectorizer.fit(texts)
+        
+        save_artifact(vectorizer, path)
+        ModelRegistry.invalidate(path)
+        
+        return vectorizer
+    
+    def calculate_similarity(
+        self,
+        resume_text: str,
+        jd_text: str,
+        resume_vector: Optional[csr_matrix] = None,
+        jd_vector: Optional[csr_matrix] = None
+    ) -> float:
         """Calculate cosine similarity between resume and job description."""
         try:
-            # Combine texts for fitting
+            if resume_vector is not None and jd_vector is not None:
+                # Precomputed corpus vectors are L2-normalised, so the dot product is the cosine
+                similarity = resume_vector.multiply(jd_vector).sum()
+                return round(float(similarity) * 100, 2)
+            
             texts = [resume_text, jd_text]
-            tfidf_matrix = self.vectorizer.fit_transform(texts)
+            if self.corpus_vectorizer is not None:
+                # IDF weights come from the reference corpus, so scores are stable across requests
+                tfidf_matrix = self.corpus_vectorizer.transform(texts)
+            else:
+                # Fall back to fitting on the pair itself
+                tfidf_matrix = self.vectorizer.fit_transform(texts)
             
             # Calculate cosine similarity
             similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
@@ -26,6 +124,50 @@ class ResumeMatcher:
             print(f"Error calculating similarity: {str(e)}")
             return 0.0
     
+    def calculate_similarities(
+        self,
+        resume_text: str,
+        jd_texts: List[str],
+        resume_vector: Optional[csr_matrix] = None,
+        jd_vectors: Optional[List[csr_matrix]] = None
+    ) -> np.ndarray:
+        """
+        Score one resume against many job descriptions with a single sparse matrix product.
+        
+        Without a corpus vectorizer there are no shared vectors to multiply, and
+        each pair is scored separately with calculate_similarity.
+        
+        Args:
+            resume_text: Resume text
+            jd_texts: Job description texts
+            resume_vector: Precomputed corpus vector for the resume
+            jd_vectors: Precomputed corpus vectors, one per job description
+        
+        Returns:
+            Array of similarity percentages, aligned with jd_texts
+        """
+        if not jd_texts:
+            return np.zeros(0)
+        
+        try:
+            if resume_vector is not None and jd_vectors is not None and all(v is not None for v in jd_vectors):
+                jd_matrix = vstack(jd_vectors).tocsr()
+            elif self.corpus_vectorizer is not None:
+                resume_vector = self.corpus_vectorizer.transform([resume_text])
+                jd_matrix = self.corpus_vectorizer.transform(jd_texts)
+            else:
+                # Without corpus IDF weights a score depends on what the vectorizer is
+                # fitted on; fit each pair on its own, as calculate_similarity does, so
+                # a ranked pair scores the same as when it is analysed alone
+                return np.array([self.calculate_similarity(resume_text, jd_text) for jd_text in jd_texts])
+            
+            # Rows are L2-normalised, so the product gives cosine similarities
+            similarities = np.asarray((jd_matrix @ resume_vector.T).todense()).ravel()
+            return np.round(similarities * 100, 2)
+        except Exception as e:
+            print(f"Error calculating similarities: {str(e)}")
+            return np.zeros(len(jd_texts))
+    
     def classify_match(self, similarity_score: float) -> str:
         """Classify match status based on similarity score."""
         if similarity_score >= 70:
@@ -35,15 +177,38 @@ class ResumeMatcher:
         else:
             return "Poor Match"
     
-    def generate_correction_suggestions(self, resume_text: str, jd_text: str, similarity_score: float) -> str:
+    def generate_correction_suggestions(
+        self,
+        resume_text: str,
+        jd_text: str,
+        similarity_score: float,
+        resume_skills: Optional[set] = None,
+        jd_skills: Optional[set] = None
+    ) -> str:
         """Generate correction suggestions based on analysis."""
-        suggestions = []
+        # Extract skills unless they were precomputed
+        if resume_skills is None:
+            resume_skills = SkillExtractor.extract_skills_from_text(resume_text)
+        if jd_skills is None:
+            jd_skills = SkillExtractor.extract_skills_from_jd(jd_text)
         
-        # Extract skills
-        resume_skills = SkillExtractor.extract_skills_from_text(resume_text)
-        jd_skills = SkillExtractor.extract_skills_from_jd(jd_text)
-        missing_skills = SkillExtractor.find_missing_skills(resume_skills, jd_skills)
-        present_skills = SkillExtractor.find_present_skills(resume_skills, jd_skills)
+        skill_gap = self.compare_skills(resume_skills, jd_skills)
+        return self._format_suggestions(skill_gap, similarity_score)
+    
+    @staticmethod
+    def compare_skills(resume_skills: set, jd_skills: set) -> Dict:
+        """Compute the skill set differences once for scoring, suggestions and the payload."""
+        return {
+            "resume_skills": resume_skills,
+            "jd_skills": jd_skills,
+            "missing_skills": SkillExtractor.find_missing_skills(resume_skills, jd_skills),
+            "present_skills": SkillExtractor.find_present_skills(resume_skills, jd_skills)
+        }
+    
+    def _format_suggestions(self, skill_gap: Dict, similarity_score: float) -> str:
+        suggestions = []
+        missing_skills = skill_gap['missing_skills']
+        present_skills = skill_gap['present_skills']
         
         # Skill-based suggestions
         if missing_skills:
@@ -65,25 +230,77 @@ class ResumeMatcher:
         
         return "\n".join(suggestions)
     
-    def analyze_match(self, resume_text: str, jd_text: str) -> Dict:
-        """Complete match analysis."""
-        similarity_score = self.calculate_similarity(resume_text, jd_text)
-        match_status = self.classify_match(similarity_score)
-        correction_suggestions = self.generate_correction_suggestions(resume_text, jd_text, similarity_score)
-        
-        # Extract skills for detailed analysis
-        resume_skills = SkillExtractor.extract_skills_from_text(resume_text)
-        jd_skills = SkillExtractor.extract_skills_from_jd(jd_text)
-        missing_skills = SkillExtractor.find_missing_skills(resume_skills, jd_skills)
-        present_skills = SkillExtractor.find_present_skills(resume_skills, jd_skills)
+    def analyze_match(
+        self,
+        resume_text: str,
+        jd_text: str,
+        resume_features: Optional[Dict] = None,
+        jd_features: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Complete match analysis, run as a sequence of timed stages.
+        
+        Each document is processed at most once (skills extracted, vector built),
+        the skill differences are computed once, and the results are shared by
+        scoring, suggestions and the response payload. Features from
+        extract_features() can be passed in to skip the text processing stage.
         
+        The returned dict includes 'timings': milliseconds spent per stage.
+        """
+        timings = {}
+        
+        with _timed(timings, 'features'):
+            resume_features = self._complete_features(resume_text, resume_features)
+            jd_features = self._complete_features(jd_text, jd_features)
+        
+        with _timed(timings, 'skills'):
+            skill_gap = self.compare_skills(resume_features['skills'], jd_features['skills'])
+        
+        with _timed(timings, 'scoring'):
+            similarity_score, match_status = self._score(resume_text, jd_text, resume_features, jd_features)
+        
+        with _timed(timings, 'suggestions'):
+            correction_suggestions = self._format_suggestions(skill_gap, similarity_score)
+        
+        result = self._build_payload(similarity_score, match_status, correction_suggestions, skill_gap)
+        result['timings'] = timings
+        return result
+    
+    def summarize_match(self, similarity_score: float, resume_skills: set, jd_skills: set) -> Dict:
+        """Build the analysis payload from an already computed score and skill sets."""
+        skill_gap = self.compare_skills(resume_skills, jd_skills)
+        return self._build_payload(
+            similarity_score,
+            self.classify_match(similarity_score),
+            self._format_suggestions(skill_gap, similarity_score),
+            skill_gap
+        )
+    
+    def _complete_features(self, text: str, features: Optional[Dict]) -> Dict:
+        """Fill in whatever per-document features were not precomputed."""
+        features = dict(features or {})
+        if features.get('skills') is None:
+            features['skills'] = SkillExtractor.extract_skills_from_text(text)
+        if features.get('vector') is None and self.corpus_vectorizer is not None:
+            features['vector'] = self.corpus_vectorizer.transform([text])
+        return features
+    
+    def _score(self, resume_text: str, jd_text: str, resume_features: Dict, jd_features: Dict) -> Tuple[float, str]:
+        """Scoring stage: similarity percentage and match status."""
+        similarity_score = self.calculate_similarity(
+            resume_text, jd_text,
+            resume_features.get('vector'), jd_features.get('vector')
+        )
+        return similarity_score, self.classify_match(similarity_score)
+    
+    @staticmethod
+    def _build_payload(similarity_score: float, match_status: str, correction_suggestions: str, skill_gap: Dict) -> Dict:
         return {
             "similarity_score": similarity_score,
             "match_status": match_status,
             "correction_suggestions": correction_suggestions,
-            "resume_skills": list(resume_skills),
-            "jd_skills": list(jd_skills),
-            "missing_skills": list(missing_skills),
-            "present_skills": list(present_skills)
+            "resume_skills": list(skill_gap['resume_skills']),
+            "jd_skills": list(skill_gap['jd_skills']),
+            "missing_skills": list(skill_gap['missing_skills']),
+            "present_skills": list(skill_gap['present_skills'])
         }
-
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import joblib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+TRAINED_MODEL_PATH = os.path.join('models', 'matching_model.pkl')
+TRAINED_VECTORIZER_PATH = os.path.join('models', 'vectorizer.pkl')
+TRAINED_COMPACT_MODEL_PATH = os.path.join('models', 'matching_model.compact.pkl')
+
+def save_artifact(obj: Any, path: str):
+    """
+    Write a model artifact atomically.
+    
+    Loaded artifacts may memory-map the file's numpy arrays, so it must never be
+    truncated in place: dump to a temporary file next to it and rename over the old one.
+    Processes still mapping the old file keep reading it until they reload.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    os.close(fd)
+    try:
+        joblib.dump(obj, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+class ModelRegistry:
+    """
+    Process-wide cache of model artifacts (vectorizers, classifiers).
+    
+    Each artifact is unpickled once per process. joblib's mmap_mode='r' maps
+    plain numpy attributes from the file, so worker processes forked after
+    preload() share those pages, and separately loaded copies share the OS
+    page cache. That covers every array of a CompactForest (compact_forest.py)
+    and a vectorizer's idf_. Everything else is a private copy in each
+    process: a vectorizer's vocabulary_ dict, and the trees of a pickled
+    forest, which copy their node arrays when unpickled. Artifacts are
+    reloaded when their file changes, checked at most every
+    CHECK_INTERVAL_SECONDS per artifact or on reload_if_changed().
+    """
+    
+    CHECK_INTERVAL_SECONDS = 5.0
+    
+    # path -> (mtime, object, version, last check time)
+    _artifacts: Dict[str, Tuple[float, Any, str, float]] = {}
+    _lock = threading.RLock()
+    
+    @classmethod
+    def get(cls, path: str) -> Optional[Tuple[Any, str]]:
+        """
+        Return (artifact, version) for a file, or None if it does not exist.
+        
+        The version is a content hash, so results computed with an artifact can
+        record which one produced them.
+        """
+        with cls._lock:
+            entry = cls._artifacts.get(path)
+            now = time.monotonic()
+            if entry and now - entry[3] < cls.CHECK_INTERVAL_SECONDS:
+                return entry[1], entry[2]
+            
+            if not os.path.exists(path):
+                cls._artifacts.pop(path, None)
+                return None
+            
+            mtime = os.path.getmtime(path)
+            if entry and entry[0] == mtime:
+                cls._artifacts[path] = (entry[0], entry[1], entry[2], now)
+                return entry[1], entry[2]
+            
+            artifact, version = cls._load(path)
+            cls._artifacts[path] = (mtime, artifact, version, now)
+            return artifact, version
+    
+    @classmethod
+    def _load(cls, path: str) -> Tuple[Any, str]:
+        with open(path, 'rb') as f:
+            version = hashlib.sha1(f.read()).hexdigest()[:16]
+        # Compressed pickles can't be memory-mapped; joblib then loads them normally
+        artifact = joblib.load(path, mmap_mode='r')
+        return artifact, version
+    
+    @classmethod
+    def preload(cls, paths: Iterable[str]):
+        """Load artifacts now (e.g. in the parent before forking workers); missing files are skipped."""
+        for path in paths:
+            try:
+                if cls.get(path):
+                    print(f"✅ Loaded model artifact {path}")
+            except Exception as e:
+                print(f"⚠️  Could not load model artifact {path}: {e}")
+    
+    @classmethod
+    def reload_if_changed(cls) -> List[str]:
+        """Reload every loaded artifact whose file changed; returns the paths that were reloaded or dropped."""
+        reloaded = []
+        with cls._lock:
+            for path, (mtime, _, _, _) in list(cls._artifacts.items()):
+                if not os.path.exists(path):
+                    del cls._artifacts[path]
+                    reloaded.append(path)
+                elif os.path.getmtime(path) != mtime:
+                    artifact, version = cls._load(path)
+                    cls._artifacts[path] = (os.path.getmtime(path), artifact, version, time.monotonic())
+                    reloaded.append(path)
+        return reloaded
+    
+    @classmethod
+    def invalidate(cls, path: str):
+        """Forget an artifact so the next get() reads it from disk."""
+        with cls._lock:
+            cls._artifacts.pop(path, None)
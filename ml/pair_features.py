@@ -0,0 +1,80 @@
+"""
+Feature matrix for resume/job description pairs, shared by training and
+inference so both build exactly the same columns.
+"""
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.sparse import csr_matrix, hstack
+from typing import List
+
+# Below this many pairs the features are computed inline; worker start-up would cost more
+PARALLEL_MIN_PAIRS = 20000
+
+def _extra_feature_rows(resume_texts: List[str], jd_texts: List[str]) -> np.ndarray:
+    rows = []
+    for resume, jd in zip(resume_texts, jd_texts):
+        # Each text is tokenized once
+        resume_tokens = resume.split()
+        jd_tokens = jd.split()
+        resume_len = len(resume_tokens)
+        jd_len = len(jd_tokens)
+        resume_words = {token.lower() for token in resume_tokens}
+        jd_words = {token.lower() for token in jd_tokens}
+        overlap = len(resume_words & jd_words) / max(len(jd_words), 1)
+        
+        rows.append([
+            resume_len,
+            jd_len,
+            resume_len / max(jd_len, 1),  # Length ratio
+            overlap  # Word overlap ratio
+        ])
+    return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+def pair_extra_features(resume_texts: List[str], jd_texts: List[str], n_jobs: int = -1) -> np.ndarray:
+    """
+    Length and word-overlap features for each pair.
+    
+    Large inputs are split into chunks computed in parallel worker processes
+    (n_jobs as in scikit-learn; -1 uses every CPU).
+    
+    Returns:
+        Dense array of shape (n_pairs, 4): resume length, JD length,
+        length ratio and the share of JD words found in the resume
+    """
+    n_pairs = len(resume_texts)
+    workers = effective_n_jobs(n_jobs)
+    if n_pairs < PARALLEL_MIN_PAIRS or workers <= 1:
+        return _extra_feature_rows(resume_texts, jd_texts)
+    
+    chunk_size = -(-n_pairs // workers)
+    chunks = Parallel(n_jobs=workers)(
+        delayed(_extra_feature_rows)(resume_texts[start:start + chunk_size], jd_texts[start:start + chunk_size])
+        for start in range(0, n_pairs, chunk_size)
+    )
+    return np.vstack(chunks)
+
+def pair_features(vectorizer, resume_texts: List[str], jd_texts: List[str], fit: bool = False) -> csr_matrix:
+    """
+    Build the sparse feature matrix: TF-IDF of the combined text plus the extra features.
+    
+    The TF-IDF block is never densified; a 5000-column vocabulary costs only
+    its non-zeros per row, and the estimators accept CSR input directly.
+    
+    Args:
+        vectorizer: TF-IDF vectorizer for the combined text
+        resume_texts: List of resume texts
+        jd_texts: List of job description texts
+        fit: Fit the vectorizer on these texts first (training only)
+    
+    Returns:
+        CSR feature matrix
+    """
+    combined_texts = [f"{resume} {jd}" for resume, jd in zip(resume_texts, jd_texts)]
+    if fit:
+        tfidf_features = vectorizer.fit_transform(combined_texts)
+    else:
+        tfidf_features = vectorizer.transform(combined_texts)
+    
+    extra_features = csr_matrix(pair_extra_features(resume_texts, jd_texts))
+    return hstack([tfidf_features, extra_features], format='csr')
@@ -1,19 +1,41 @@
 import PyPDF2
 import docx
 import io
-from typing import Optional
+from typing import Iterator, Optional
 
 class ResumeParser:
     @staticmethod
-    def extract_text_from_pdf(file_content: bytes) -> str:
-        """Extract text from PDF file."""
+    def iter_pdf_pages(pdf_reader: PyPDF2.PdfReader) -> Iterator[str]:
+        """Yield the text of each PDF page in order, one page at a time."""
+        for page in pdf_reader.pages:
+            yield page.extract_text() or ""
+    
+    @staticmethod
+    def extract_text_from_pdf(file_content: bytes, max_pages: Optional[int] = None) -> str:
+        """
+        Extract text from PDF file.
+        
+        Pages are extracted one after another. PyPDF2 is pure Python, so
+        threads over page ranges would only take turns on the GIL, and the
+        upload already runs in an analysis pool worker: parallelism comes from
+        handling several uploads at once, not from splitting one document.
+        
+        Args:
+            file_content: Raw PDF bytes
+            max_pages: Reject documents with more pages than this (None = no limit)
+        """
         try:
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+            page_count = len(pdf_reader.pages)
+        except Exception as e:
+            raise Exception(f"Error extracting text from PDF: {str(e)}")
+        
+        if max_pages is not None and page_count > max_pages:
+            raise ValueError(f"PDF has {page_count} pages; at most {max_pages} are supported")
+        
+        try:
+            # Join once instead of growing a string page by page
+            return "\n".join(ResumeParser.iter_pdf_pages(pdf_reader)).strip()
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
     
@@ -29,14 +51,26 @@ class ResumeParser:
             raise Exception(f"Error extracting text from DOCX: {str(e)}")
     
     @staticmethod
-    def extract_text(file_content: bytes, filename: str) -> str:
-        """Extract text from resume file based on extension."""
+    def extract_text(
+        file_content: bytes,
+        filename: str,
+        max_bytes: Optional[int] = None,
+        max_pages: Optional[int] = None
+    ) -> str:
+        """
+        Extract text from resume file based on extension.
+        
+        The API passes its upload limits (MAX_UPLOAD_BYTES, MAX_RESUME_PAGES);
+        None leaves that limit off.
+        """
+        if max_bytes is not None and len(file_content) > max_bytes:
+            raise ValueError(f"File is {len(file_content)} bytes; at most {max_bytes} are supported")
+        
         filename_lower = filename.lower()
         
         if filename_lower.endswith('.pdf'):
-            return ResumeParser.extract_text_from_pdf(file_content)
+            return ResumeParser.extract_text_from_pdf(file_content, max_pages=max_pages)
         elif filename_lower.endswith('.docx') or filename_lower.endswith('.doc'):
             return ResumeParser.extract_text_from_docx(file_content)
         else:
             raise ValueError(f"Unsupported file format: {filename}")
-
@@ -1,5 +1,89 @@
-import re
-from typing import List, Set
+import hashlib
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """Mirror the definition of a word character used by ``re``'s ``\\b``."""
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed keyword set.
+    
+    Built once, then finds every keyword occurrence in a single left-to-right
+    pass over the text, so matching cost depends on the text length rather
+    than on the number of keywords.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[Tuple[int, str], ...]] = [()]
+        
+        for keyword in keywords:
+            self._add(keyword)
+        self._build_failure_links()
+    
+    def _add(self, keyword: str):
+        lowered = keyword.lower()
+        node = 0
+        for ch in lowered:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+        self._output[node] = self._output[node] + ((len(lowered), keyword),)
+    
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                # Inherit matches ending at the longest proper suffix
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield ``(start, end, keyword)`` for every occurrence in ``text``."""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for index, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, keyword in output[node]:
+                yield index + 1 - length, index + 1, keyword
+    
+    def find_words(self, text: str) -> Set[str]:
+        """
+        Find keywords that occur delimited by word boundaries.
+        
+        A boundary check at each end reproduces ``\\b`` semantics exactly, so
+        keywords ending in punctuation (``c++``, ``c#``) behave as they did
+        with the per-keyword regex.
+        """
+        found = set()
+        text_length = len(text)
+        for start, end, keyword in self.iter_matches(text):
+            if keyword in found:
+                continue
+            if (start > 0 and _is_word_char(text[start - 1])) == _is_word_char(text[start]):
+                continue
+            if (end < text_length and _is_word_char(text[end])) == _is_word_char(text[end - 1]):
+                continue
+            found.add(keyword)
+        return found
+
 
 class SkillExtractor:
     # Common technical skills database
@@ -25,19 +109,16 @@ class SkillExtractor:
         'git', 'rest api', 'graphql', 'microservices', 'agile', 'scrum', 'jira'
     }
     
+    # Built once at import; matching is a single pass regardless of dictionary size
+    _AUTOMATON = KeywordAutomaton(TECHNICAL_SKILLS)
+    
+    # Changes whenever the dictionary does, so cached skill sets can be invalidated
+    DICTIONARY_VERSION = hashlib.sha1('\n'.join(sorted(TECHNICAL_SKILLS)).encode('utf-8')).hexdigest()[:12]
+    
     @staticmethod
     def extract_skills_from_text(text: str) -> Set[str]:
         """Extract skills from text using keyword matching."""
-        text_lower = text.lower()
-        found_skills = set()
-        
-        for skill in SkillExtractor.TECHNICAL_SKILLS:
-            # Check for exact word match or phrase match
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill)
-        
-        return found_skills
+        return SkillExtractor._AUTOMATON.find_words(text.lower())
     
     @staticmethod
     def extract_skills_from_jd(jd_text: str) -> Set[str]:
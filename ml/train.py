@@ -12,7 +12,7 @@ import numpy as np
 backend_path = Path(__file__).parent.parent / 'backend'
 sys.path.insert(0, str(backend_path))
 
-from ml.train_model import ResumeMatchingModelTrainer
+from ml.train_model import FEATURE_CACHE_DIR, ResumeMatchingModelTrainer
 
 def load_training_data():
     """Load training data from JSON file."""
@@ -89,7 +89,8 @@ def main():
             jd_texts=jd_texts,
             labels=labels,
             test_size=0.2,  # 20% for testing
-            model_type='random_forest'  # or 'gradient_boosting'
+            model_type='random_forest',  # or 'gradient_boosting'
+            cache_dir=str(FEATURE_CACHE_DIR)
         )
         
         print("\n" + "=" * 60)
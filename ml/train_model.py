@@ -5,13 +5,73 @@ This is an optional enhancement to improve matching accuracy.
 
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.experimental import enable_halving_search_cv  # Required before importing HalvingRandomSearchCV
+from sklearn.model_selection import HalvingRandomSearchCV, RandomizedSearchCV, train_test_split
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier, GradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MaxAbsScaler
 from sklearn.metrics import classification_report, accuracy_score, confusion_matrix
 import joblib
+import json
+import math
 import os
-from typing import List, Dict, Tuple
+import sys
+import time
+from scipy.sparse import csr_matrix, vstack
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Tuple
+
+# Add project root to path (this file is also run directly: python train_model.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.feature_cache import FeatureCache
+from ml.model_registry import save_artifact
+from ml.pair_features import pair_features
+
+MATCH_LABELS = ['Good Match', 'Partial Match', 'Poor Match']
+
+# Default feature cache for the training scripts, wherever they are run from
+FEATURE_CACHE_DIR = Path(__file__).parent / 'models' / 'feature_cache'
+
+# Fewest trees added when train() extends a cached forest with new rows
+MIN_NEW_TREES = 10
+
+# Each successive halving round keeps the best 1/HALVING_FACTOR of its candidates
+HALVING_FACTOR = 3
+
+# Model families and parameter ranges explored by ResumeMatchingModelTrainer.tune()
+TUNING_SEARCH_SPACE = [
+    {
+        'scaler': ['passthrough'],
+        'classifier': [RandomForestClassifier(random_state=42)],
+        'classifier__n_estimators': [100, 200, 400],
+        'classifier__max_depth': [10, 20, 40, None],
+        'classifier__min_samples_leaf': [1, 2, 5],
+        'classifier__max_features': ['sqrt', 'log2'],
+    },
+    {
+        'scaler': ['passthrough'],
+        'classifier': [ExtraTreesClassifier(random_state=42)],
+        'classifier__n_estimators': [100, 200, 400],
+        'classifier__max_depth': [20, 40, None],
+        'classifier__min_samples_leaf': [1, 2, 5],
+    },
+    {
+        'scaler': ['passthrough'],
+        'classifier': [GradientBoostingClassifier(random_state=42)],
+        'classifier__n_estimators': [100, 200],
+        'classifier__max_depth': [3, 5],
+        'classifier__learning_rate': [0.05, 0.1, 0.2],
+        'classifier__subsample': [0.8, 1.0],
+    },
+    {
+        'scaler': [MaxAbsScaler()],
+        'classifier': [LogisticRegression(max_iter=2000)],
+        'classifier__C': [0.1, 1.0, 10.0, 100.0],
+    },
+]
 
 class ResumeMatchingModelTrainer:
     """
@@ -29,98 +89,158 @@ class ResumeMatchingModelTrainer:
         self.model = None
         self.is_trained = False
     
-    def prepare_features(self, resume_texts: List[str], jd_texts: List[str]) -> np.ndarray:
+    def prepare_features(self, resume_texts: List[str], jd_texts: List[str], fit: bool = True) -> csr_matrix:
         """
         Prepare features from resume and job description pairs.
         
         Args:
             resume_texts: List of resume texts
             jd_texts: List of job description texts
+            fit: Fit the vectorizer (training); False reuses the fitted one (prediction)
             
         Returns:
-            Feature matrix
+            Sparse feature matrix (TF-IDF plus length and overlap features)
         """
-        # Combine texts for TF-IDF
-        combined_texts = [f"{resume} {jd}" for resume, jd in zip(resume_texts, jd_texts)]
-        
-        # Fit and transform
-        tfidf_features = self.vectorizer.fit_transform(combined_texts).toarray()
-        
-        # Additional features
-        additional_features = []
-        for resume, jd in zip(resume_texts, jd_texts):
-            # Length features
-            resume_len = len(resume.split())
-            jd_len = len(jd.split())
-            
-            # Skill overlap (simplified)
-            resume_words = set(resume.lower().split())
-            jd_words = set(jd.lower().split())
-            overlap = len(resume_words & jd_words) / max(len(jd_words), 1)
-            
-            additional_features.append([
-                resume_len,
-                jd_len,
-                resume_len / max(jd_len, 1),  # Length ratio
-                overlap  # Word overlap ratio
-            ])
+        return pair_features(self.vectorizer, resume_texts, jd_texts, fit=fit)
+    
+    def build_features(self, resume_texts: List[str], jd_texts: List[str], cache_dir: Optional[str] = None) -> csr_matrix:
+        """
+        Training features, reusing a cached matrix for the same dataset when possible.
         
-        # Combine TF-IDF and additional features
-        additional_features = np.array(additional_features)
-        features = np.hstack([tfidf_features, additional_features])
+        If the dataset only appends rows to a cached one, the cached rows are
+        reused with the vectorizer fitted on them and only the new rows are
+        vectorized. The vocabulary is then the old one, so this is done only
+        while the new rows are at most as many as the cached ones; beyond that
+        everything is re-fitted.
         
+        Args:
+            resume_texts: List of resume texts
+            jd_texts: List of job description texts
+            cache_dir: Feature cache directory, or None to always vectorize
+            
+        Returns:
+            Sparse feature matrix
+        """
+        cache = FeatureCache(cache_dir, self.vectorizer) if cache_dir else None
+        features, _, _ = self._build_features(resume_texts, jd_texts, cache)
         return features
     
+    def _build_features(
+        self,
+        resume_texts: List[str],
+        jd_texts: List[str],
+        cache: Optional[FeatureCache]
+    ) -> Tuple[csr_matrix, int, object]:
+        """
+        build_features, also reporting what was reused.
+        
+        Returns:
+            Tuple of (feature matrix, leading rows whose features came from the
+            cache with the vectorizer unchanged, model cached for those rows or None)
+        """
+        if cache is None:
+            return self.prepare_features(resume_texts, jd_texts), 0, None
+        
+        digests = cache.row_digests(resume_texts, jd_texts)
+        cached = cache.find(digests)
+        
+        if cached and cached[0] == len(digests):
+            _, features, self.vectorizer, cached_model = cached
+            print(f"Loaded cached features for {len(digests)} examples")
+            return features, len(digests), cached_model
+        
+        if cached and len(digests) - cached[0] <= cached[0]:
+            n_cached, cached_features, self.vectorizer, cached_model = cached
+            print(f"Reusing cached features for {n_cached} examples, vectorizing {len(digests) - n_cached} new ones")
+            new_features = self.prepare_features(resume_texts[n_cached:], jd_texts[n_cached:], fit=False)
+            features = vstack([cached_features, new_features], format='csr')
+        else:
+            features = self.prepare_features(resume_texts, jd_texts)
+            n_cached, cached_model = 0, None
+        
+        cache.save(digests, features, self.vectorizer)
+        return features, n_cached, cached_model
+    
     def train(
         self,
         resume_texts: List[str],
         jd_texts: List[str],
         labels: List[str],
         test_size: float = 0.2,
-        model_type: str = 'random_forest'
+        model_type: str = 'random_forest',
+        cache_dir: Optional[str] = None
     ) -> Dict:
         """
         Train the matching model.
         
+        With a cache_dir, the random forest is kept with the cached features.
+        When a later run only appends rows to that data (see build_features),
+        the cached forest is extended instead of re-trained: its trees are kept
+        and new ones, in proportion to the new rows, are grown on the new rows'
+        training split. Metrics then cover the new rows' held-out split. Any
+        other change to the data, or new rows too few to split by label, trains
+        from scratch.
+        
         Args:
             resume_texts: List of resume texts
             jd_texts: List of job description texts
             labels: List of labels ('Good Match', 'Partial Match', 'Poor Match')
             test_size: Proportion of data for testing
             model_type: 'random_forest' or 'gradient_boosting'
+            cache_dir: Cache the feature matrix here (see build_features)
             
         Returns:
             Training metrics dictionary
         """
+        if model_type not in ('random_forest', 'gradient_boosting'):
+            raise ValueError(f"Unknown model_type: {model_type}")
+        
         # Prepare features
-        X = self.prepare_features(resume_texts, jd_texts)
+        cache = FeatureCache(cache_dir, self.vectorizer) if cache_dir else None
+        X, n_cached, cached_model = self._build_features(resume_texts, jd_texts, cache)
         y = np.array(labels)
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=42, stratify=y
-        )
-        
-        # Initialize model
-        if model_type == 'random_forest':
-            self.model = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=20,
-                random_state=42,
-                n_jobs=-1
+        incremental = model_type == 'random_forest' and self._can_extend(cached_model, y, n_cached, test_size)
+        if incremental:
+            # Only the new rows are split, trained and evaluated on
+            X_train, X_test, y_train, y_test = train_test_split(
+                X[n_cached:], y[n_cached:], test_size=test_size, random_state=42, stratify=y[n_cached:]
             )
-        elif model_type == 'gradient_boosting':
-            self.model = GradientBoostingClassifier(
-                n_estimators=100,
-                max_depth=5,
-                random_state=42
+            self.model = cached_model
+            new_trees = max(
+                MIN_NEW_TREES,
+                math.ceil(self.model.n_estimators * (len(y) - n_cached) / n_cached)
             )
+            self.model.set_params(warm_start=True, n_estimators=self.model.n_estimators + new_trees)
+            print(f"Adding {new_trees} trees for {len(y) - n_cached} new examples...")
         else:
-            raise ValueError(f"Unknown model_type: {model_type}")
+            # Split data
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=test_size, random_state=42, stratify=y
+            )
+            
+            # Initialize model
+            if model_type == 'random_forest':
+                self.model = RandomForestClassifier(
+                    n_estimators=100,
+                    max_depth=20,
+                    random_state=42,
+                    n_jobs=-1
+                )
+            else:
+                self.model = GradientBoostingClassifier(
+                    n_estimators=100,
+                    max_depth=5,
+                    random_state=42
+                )
+            print("Training model...")
         
         # Train
-        print("Training model...")
         self.model.fit(X_train, y_train)
+        if incremental:
+            self.model.set_params(warm_start=False)
+        if cache is not None and model_type == 'random_forest':
+            cache.save_model(cache.row_digests(resume_texts, jd_texts), self.model)
         
         # Evaluate
         y_pred = self.model.predict(X_test)
@@ -132,7 +252,165 @@ class ResumeMatchingModelTrainer:
         return {
             'accuracy': accuracy,
             'classification_report': report,
-            'confusion_matrix': confusion_matrix(y_test, y_pred).tolist()
+            'confusion_matrix': confusion_matrix(y_test, y_pred).tolist(),
+            'incremental': incremental
+        }
+    
+    @staticmethod
+    def _can_extend(cached_model, y: np.ndarray, n_cached: int, test_size: float) -> bool:
+        """Whether a cached forest can be grown on the rows after n_cached."""
+        if not isinstance(cached_model, RandomForestClassifier) or not 0 < n_cached < len(y):
+            return False
+        labels, counts = np.unique(y[n_cached:], return_counts=True)
+        # New trees must see every class the forest knows, and each class needs
+        # a row on both sides of the split
+        n_test = math.ceil(test_size * (len(y) - n_cached))
+        return (
+            np.array_equal(labels, cached_model.classes_)
+            and counts.min() >= 2
+            and len(labels) <= n_test <= len(y) - n_cached - len(labels)
+        )
+    
+    def tune(
+        self,
+        resume_texts: List[str],
+        jd_texts: List[str],
+        labels: List[str],
+        test_size: float = 0.2,
+        n_candidates: int = 40,
+        cv: int = 3,
+        n_jobs: int = -1,
+        cache_dir: Optional[str] = None
+    ) -> Dict:
+        """
+        Search model families and parameters, keeping the best as this trainer's model.
+        
+        Candidates from TUNING_SEARCH_SPACE are cross-validated with successive
+        halving: all of them start on a small sample of the training split,
+        and only the best third moves on to each larger round, so poor
+        configurations are dropped cheaply. Folds run in parallel on n_jobs
+        cores. The winner, refitted on the whole training split, is then
+        scored on the held-out split for accuracy and prediction latency.
+        
+        Small datasets are clamped to what they can support: the held-out
+        split gets at least one example per label, folds are capped by the
+        rarest label, and candidates by the number of halving rounds. Below
+        HALVING_FACTOR * the first round's minimum size there is room for only
+        one round, so candidates are cross-validated on the whole training split
+        instead (RandomizedSearchCV), at most one per training example.
+        
+        Args:
+            resume_texts: List of resume texts
+            jd_texts: List of job description texts
+            labels: List of labels
+            test_size: Proportion of data held out from the search
+            n_candidates: Configurations sampled for the first round
+            cv: Cross-validation folds
+            n_jobs: Parallel jobs (-1 uses every CPU)
+            cache_dir: Cache the feature matrix here (see build_features)
+            
+        Returns:
+            Report with the best configuration, cross-validation score,
+            held-out metrics, latency and the search rounds
+        """
+        X = self.build_features(resume_texts, jd_texts, cache_dir)
+        y = np.array(labels)
+        classes, counts = np.unique(y, return_counts=True)
+        if len(classes) < 2 or counts.min() < 3:
+            raise ValueError("Tuning needs at least two labels, with at least 3 examples of each")
+        
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=max(len(classes), math.ceil(test_size * len(y))), random_state=42, stratify=y
+        )
+        cv = max(2, min(cv, np.unique(y_train, return_counts=True)[1].min()))
+        
+        # Halving rounds the training split has room for; the first needs
+        # 2 examples per fold and label (sklearn's 'smallest' min_resources)
+        min_resources = 2 * cv * len(classes)
+        n_rounds = 0
+        while min_resources * HALVING_FACTOR ** n_rounds <= X_train.shape[0]:
+            n_rounds += 1
+        pipeline = Pipeline([('scaler', 'passthrough'), ('classifier', RandomForestClassifier())])
+        if n_rounds >= 2:
+            # More candidates than the rounds can narrow down only cost time
+            n_candidates = min(n_candidates, HALVING_FACTOR ** n_rounds)
+            search = HalvingRandomSearchCV(
+                pipeline,
+                TUNING_SEARCH_SPACE,
+                n_candidates=n_candidates,
+                factor=HALVING_FACTOR,
+                # Size the first round so the last one uses the whole training split
+                min_resources='exhaust',
+                cv=cv,
+                scoring='accuracy',
+                n_jobs=n_jobs,
+                random_state=42
+            )
+        else:
+            n_candidates = min(n_candidates, X_train.shape[0])
+            search = RandomizedSearchCV(
+                pipeline,
+                TUNING_SEARCH_SPACE,
+                n_iter=n_candidates,
+                cv=cv,
+                scoring='accuracy',
+                n_jobs=n_jobs,
+                random_state=42
+            )
+        print(f"Searching {n_candidates} configurations on {X_train.shape[0]} examples...")
+        start = time.perf_counter()
+        search.fit(X_train, y_train)
+        search_seconds = time.perf_counter() - start
+        
+        self.model = search.best_estimator_
+        self.is_trained = True
+        
+        y_pred = self.model.predict(X_test)
+        best_params = {
+            name: (type(value).__name__ if hasattr(value, 'get_params') else value)
+            for name, value in search.best_params_.items()
+        }
+        if isinstance(search, HalvingRandomSearchCV):
+            rounds = [
+                {
+                    'round': int(i),
+                    'candidates': int((search.cv_results_['iter'] == i).sum()),
+                    'n_resources': int(search.n_resources_[i])
+                }
+                for i in range(search.n_iterations_)
+            ]
+        else:
+            rounds = [{'round': 0, 'candidates': n_candidates, 'n_resources': X_train.shape[0]}]
+        
+        return {
+            'best_params': best_params,
+            'cv_accuracy': float(search.best_score_),
+            'accuracy': accuracy_score(y_test, y_pred),
+            'classification_report': classification_report(y_test, y_pred, output_dict=True),
+            'confusion_matrix': confusion_matrix(y_test, y_pred).tolist(),
+            'latency': self._measure_latency(X_test),
+            'search_seconds': round(search_seconds, 1),
+            'rounds': rounds
+        }
+    
+    def _measure_latency(self, X: csr_matrix, repeats: int = 200) -> Dict:
+        """Time single-pair and batch predictions, as the app makes them."""
+        single = []
+        for i in range(min(repeats, X.shape[0])):
+            row = X[i]
+            start = time.perf_counter()
+            self.model.predict_proba(row)
+            single.append(time.perf_counter() - start)
+        single.sort()
+        
+        start = time.perf_counter()
+        self.model.predict_proba(X)
+        batch_seconds = time.perf_counter() - start
+        
+        return {
+            'single_p50_ms': round(single[len(single) // 2] * 1000, 3),
+            'single_p95_ms': round(single[min(len(single) - 1, int(0.95 * len(single)))] * 1000, 3),
+            'batch_pairs_per_second': round(X.shape[0] / max(batch_seconds, 1e-9), 1)
         }
     
     def predict(self, resume_text: str, jd_text: str) -> Tuple[str, float]:
@@ -149,8 +427,8 @@ class ResumeMatchingModelTrainer:
         if not self.is_trained:
             raise ValueError("Model not trained. Call train() first.")
         
-        # Prepare features
-        X = self.prepare_features([resume_text], [jd_text])
+        # Prepare features with the vectorizer fitted during training
+        X = self.prepare_features([resume_text], [jd_text], fit=False)
         
         # Predict
         prediction = self.model.predict(X)[0]
@@ -166,11 +444,11 @@ class ResumeMatchingModelTrainer:
         
         os.makedirs(model_dir, exist_ok=True)
         
-        # Save model
-        joblib.dump(self.model, os.path.join(model_dir, 'matching_model.pkl'))
+        # Save model (atomically: the API may be memory-mapping the current files)
+        save_artifact(self.model, os.path.join(model_dir, 'matching_model.pkl'))
         
         # Save vectorizer
-        joblib.dump(self.vectorizer, os.path.join(model_dir, 'vectorizer.pkl'))
+        save_artifact(self.vectorizer, os.path.join(model_dir, 'vectorizer.pkl'))
         
         print(f"Model saved to {model_dir}/")
     
@@ -189,6 +467,154 @@ class ResumeMatchingModelTrainer:
         print(f"Model loaded from {model_dir}/")
 
 
+def iter_pair_chunks(path: str, chunk_size: int = 10000) -> Iterator[Tuple[List[str], List[str], List[str]]]:
+    """
+    Read labeled pairs from a file in chunks, never holding the whole file.
+    
+    Args:
+        path: CSV with columns resume_text, jd_text, label, or JSON Lines with
+            one {"resume_text", "jd_text", "label"} object per line
+        chunk_size: Pairs per chunk
+        
+    Yields:
+        Tuples of (resume_texts, jd_texts, labels)
+    """
+    if path.endswith('.csv'):
+        for frame in pd.read_csv(path, chunksize=chunk_size, usecols=['resume_text', 'jd_text', 'label']):
+            yield (
+                frame['resume_text'].fillna("").astype(str).tolist(),
+                frame['jd_text'].fillna("").astype(str).tolist(),
+                frame['label'].tolist()
+            )
+    elif path.endswith('.jsonl'):
+        resume_texts, jd_texts, labels = [], [], []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                resume_texts.append(row.get('resume_text') or "")
+                jd_texts.append(row.get('jd_text') or "")
+                labels.append(row['label'])
+                if len(labels) == chunk_size:
+                    yield resume_texts, jd_texts, labels
+                    resume_texts, jd_texts, labels = [], [], []
+        if labels:
+            yield resume_texts, jd_texts, labels
+    else:
+        raise ValueError(f"Unsupported training file (expected .csv or .jsonl): {path}")
+
+
+class StreamingMatchingModelTrainer:
+    """
+    Out-of-core trainer for datasets too large to load at once.
+    
+    Pairs are read and trained on one chunk at a time: a HashingVectorizer
+    needs no fitted vocabulary, and the scaler and SGD classifier learn with
+    partial_fit, so memory depends on the chunk size, not the dataset size.
+    The saved files have the same layout as ResumeMatchingModelTrainer's and
+    are used by TrainedResumeMatcher unchanged.
+    """
+    
+    def __init__(self, n_features: int = 2 ** 20, labels: Optional[List[str]] = None):
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            ngram_range=(1, 2),
+            alternate_sign=False
+        )
+        self.scaler = MaxAbsScaler()
+        self.classifier = SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42)
+        self.labels = list(labels or MATCH_LABELS)
+        self.model = None
+        self.is_trained = False
+    
+    def train(self, path: str, chunk_size: int = 10000, epochs: int = 1, holdout_every: int = 5) -> Dict:
+        """
+        Train from a CSV or JSON Lines file (see iter_pair_chunks).
+        
+        Every holdout_every-th pair is never trained on. In the last epoch each
+        chunk's held-out pairs are scored before the model learns from the
+        chunk, which gives a test estimate without a second pass over the data.
+        
+        Args:
+            path: Training file
+            chunk_size: Pairs per chunk
+            epochs: Passes over the file
+            holdout_every: Hold out one pair in this many for evaluation
+            
+        Returns:
+            Training metrics dictionary (same keys as ResumeMatchingModelTrainer.train)
+        """
+        matrix = np.zeros((len(self.labels), len(self.labels)), dtype=np.int64)
+        n_train = 0
+        
+        for epoch in range(epochs):
+            evaluate = epoch == epochs - 1
+            offset = 0
+            for resume_texts, jd_texts, labels in iter_pair_chunks(path, chunk_size):
+                unknown = set(labels) - set(self.labels)
+                if unknown:
+                    raise ValueError(f"Unknown labels {sorted(map(str, unknown))}; expected {self.labels}")
+                
+                X = pair_features(self.vectorizer, resume_texts, jd_texts)
+                y = np.array(labels)
+                held_out = np.arange(offset, offset + len(y)) % holdout_every == 0
+                offset += len(y)
+                
+                if evaluate and held_out.any() and n_train:
+                    predicted = self.classifier.predict(self.scaler.transform(X[held_out]))
+                    matrix += confusion_matrix(y[held_out], predicted, labels=self.labels)
+                
+                train_rows = ~held_out
+                if not train_rows.any():
+                    continue
+                self.scaler.partial_fit(X[train_rows])
+                self.classifier.partial_fit(self.scaler.transform(X[train_rows]), y[train_rows], classes=self.labels)
+                n_train += int(train_rows.sum())
+            print(f"Epoch {epoch + 1}/{epochs}: {offset} pairs read")
+        
+        if not n_train:
+            raise ValueError("No training data found.")
+        
+        self.model = Pipeline([('scaler', self.scaler), ('classifier', self.classifier)])
+        self.is_trained = True
+        return self._metrics(matrix)
+    
+    def _metrics(self, matrix: np.ndarray) -> Dict:
+        """Accuracy and per-label precision/recall from the held-out confusion matrix."""
+        total = matrix.sum()
+        report = {}
+        for i, label in enumerate(self.labels):
+            true_positive = matrix[i, i]
+            predicted = matrix[:, i].sum()
+            actual = matrix[i, :].sum()
+            precision = true_positive / predicted if predicted else 0.0
+            recall = true_positive / actual if actual else 0.0
+            report[label] = {
+                'precision': precision,
+                'recall': recall,
+                'f1-score': 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+                'support': int(actual)
+            }
+        
+        return {
+            'accuracy': np.trace(matrix) / total if total else 0.0,
+            'classification_report': report,
+            'confusion_matrix': matrix.tolist()
+        }
+    
+    def save_model(self, model_dir: str = 'models'):
+        """Save the trained model and vectorizer."""
+        if not self.is_trained:
+            raise ValueError("No trained model to save.")
+        
+        save_artifact(self.model, os.path.join(model_dir, 'matching_model.pkl'))
+        save_artifact(self.vectorizer, os.path.join(model_dir, 'vectorizer.pkl'))
+        
+        print(f"Model saved to {model_dir}/")
+
+
 def create_sample_training_data():
     """
     Create sample training data.
@@ -200,16 +626,34 @@ def create_sample_training_data():
             "Experienced Python developer with 5 years in web development. Proficient in Django, Flask, and React.",
             "Java developer with Spring Boot experience. Knowledge of microservices architecture.",
             "Frontend developer specializing in React and Vue.js. 3 years of experience.",
+            "Data scientist skilled in Python, pandas, scikit-learn and TensorFlow. Built NLP models in production.",
+            "Python developer with Flask experience. Some exposure to React. 1 year of experience.",
+            "Java developer with 2 years of Spring experience. Learning Docker.",
+            "Junior frontend developer with React experience. Learning TypeScript.",
+            "Data analyst using Python and SQL. Basic scikit-learn.",
+            "Graphic designer skilled in Photoshop, Illustrator and branding.",
+            "Accountant with experience in auditing, tax preparation and Excel.",
+            "Registered nurse with 6 years of experience in intensive care.",
+            "Sales manager with a track record in B2B account growth and negotiation.",
         ],
         'jd_texts': [
             "Looking for a Python developer with Django experience. Must know React and have 3+ years experience.",
             "Senior Java developer needed. Spring Boot, microservices, and cloud experience required.",
             "Frontend developer position. React, Vue.js, and modern JavaScript required.",
+            "Machine learning engineer: Python, scikit-learn, TensorFlow and NLP experience required.",
+            "Senior Python developer with Django, React and AWS experience. 5+ years required.",
+            "Java developer with Spring Boot, Kubernetes and AWS experience. 5+ years required.",
+            "Frontend engineer: React, TypeScript, GraphQL and testing. 4+ years required.",
+            "Data scientist: Python, deep learning with PyTorch, and MLOps experience required.",
+            "Backend engineer: Go, Kubernetes and PostgreSQL experience required.",
+            "Senior Java developer needed. Spring Boot, microservices, and cloud experience required.",
+            "Machine learning engineer: Python, scikit-learn, TensorFlow and NLP experience required.",
+            "Frontend developer position. React, Vue.js, and modern JavaScript required.",
         ],
         'labels': [
-            'Good Match',
-            'Good Match',
-            'Good Match',
+            'Good Match', 'Good Match', 'Good Match', 'Good Match',
+            'Partial Match', 'Partial Match', 'Partial Match', 'Partial Match',
+            'Poor Match', 'Poor Match', 'Poor Match', 'Poor Match',
         ]
     }
     
@@ -257,7 +701,8 @@ def main():
             resume_texts=training_data['resume_texts'],
             jd_texts=training_data['jd_texts'],
             labels=training_data['labels'],
-            model_type='random_forest'
+            model_type='random_forest',
+            cache_dir=str(FEATURE_CACHE_DIR)
         )
         
         print("\n" + "=" * 50)
@@ -0,0 +1,55 @@
+"""
+Streaming training for large datasets - reads the data in chunks.
+Run: python train_stream.py training_data.jsonl [--chunk-size 10000] [--epochs 1]
+
+Accepts a CSV (resume_text, jd_text, label columns) or JSON Lines file.
+Use this instead of train.py when the data does not comfortably fit in
+memory; the saved model is used by the app the same way.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.train_model import StreamingMatchingModelTrainer
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Training data (.csv or .jsonl)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Pairs read and trained on at a time")
+    parser.add_argument("--epochs", type=int, default=1, help="Passes over the data")
+    parser.add_argument("--n-features", type=int, default=2 ** 20, help="Hashed TF features")
+    parser.add_argument("--model-dir", default=str(Path(__file__).parent / 'models'))
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Streaming Resume Matching Model Training")
+    print("=" * 60)
+    
+    if not Path(args.path).exists():
+        print(f"❌ {args.path} not found!")
+        return
+    
+    trainer = StreamingMatchingModelTrainer(n_features=args.n_features)
+    
+    try:
+        metrics = trainer.train(args.path, chunk_size=args.chunk_size, epochs=args.epochs)
+    except ValueError as e:
+        print(f"\n❌ Training failed: {e}")
+        return
+    
+    print("\n" + "=" * 60)
+    print("Training Results (held-out pairs)")
+    print("=" * 60)
+    print(f"✅ Accuracy: {metrics['accuracy']:.2%}")
+    for label, scores in metrics['classification_report'].items():
+        print(f"   {label}: precision {scores['precision']:.2%}, recall {scores['recall']:.2%}, support {scores['support']}")
+    
+    trainer.save_model(args.model_dir)
+    print(f"\n✅ Model saved to: {args.model_dir}/")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import heapq
+import threading
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from typing import Dict, List, Optional, Tuple
+
+class VectorIndex:
+    """
+    In-memory index of L2-normalised sparse document vectors.
+    
+    Vectors are kept in fixed-size CSR blocks. A query scores one block at a
+    time with a sparse matrix product, keeps that block's best k with
+    argpartition and merges the per-block candidates with a heap, so memory
+    for scores stays bounded by the block size however large the store gets.
+    
+    New rows wait in a small pending matrix, scored like one more block, and
+    are sealed into the blocks once seal_threshold of them have gathered, so a
+    trickle of adds between searches never re-copies a whole block. Removed
+    rows are tombstoned, and a block is compacted once compact_fraction of its
+    rows are dead.
+    """
+    
+    def __init__(
+        self,
+        n_features: int,
+        block_size: int = 50000,
+        seal_threshold: int = 1024,
+        compact_fraction: float = 0.25
+    ):
+        self.n_features = n_features
+        self.block_size = block_size
+        self.seal_threshold = min(seal_threshold, block_size)
+        self.compact_fraction = compact_fraction
+        
+        # Sealed blocks: (matrix, doc ids, owner ids, alive mask)
+        self._blocks: List[Tuple[csr_matrix, np.ndarray, np.ndarray, np.ndarray]] = []
+        # Rows added since the last seal
+        self._pending_vectors: List[csr_matrix] = []
+        self._pending_ids: List[int] = []
+        self._pending_owners: List[int] = []
+        self._pending_set = set()
+        # The pending rows as one block, built on the first search after a change
+        self._pending_block: Optional[Tuple[csr_matrix, np.ndarray, np.ndarray, np.ndarray]] = None
+        # doc id -> (block index, row) for sealed rows, used to tombstone replaced documents
+        self._locations: Dict[int, Tuple[int, int]] = {}
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._locations) + len(self._pending_ids)
+    
+    def add(self, doc_id: int, vector: csr_matrix, owner_id: Optional[int] = None):
+        """Add or replace a document's vector."""
+        with self._lock:
+            self.remove(doc_id)
+            self._pending_vectors.append(vector)
+            self._pending_ids.append(doc_id)
+            self._pending_set.add(doc_id)
+            self._pending_owners.append(-1 if owner_id is None else owner_id)
+            self._pending_block = None
+            if len(self._pending_ids) >= self.seal_threshold:
+                self._seal()
+    
+    def remove(self, doc_id: int):
+        """Drop a document from future results."""
+        with self._lock:
+            location = self._locations.pop(doc_id, None)
+            if location is not None:
+                block_index, row = location
+                alive = self._blocks[block_index][3]
+                alive[row] = False
+                if len(alive) - np.count_nonzero(alive) >= self.compact_fraction * len(alive):
+                    self._compact(block_index)
+                return
+            
+            if doc_id in self._pending_set:
+                self._pending_set.discard(doc_id)
+                position = self._pending_ids.index(doc_id)
+                del self._pending_vectors[position]
+                del self._pending_ids[position]
+                del self._pending_owners[position]
+                self._pending_block = None
+    
+    def _seal(self):
+        """Move pending rows into blocks, topping up the last block before starting a new one."""
+        if not self._pending_ids:
+            return
+        
+        matrix, ids, owners, alive = self._pending_matrix()
+        
+        if self._blocks and self._blocks[-1][0].shape[0] + len(ids) <= self.block_size:
+            # Rows keep their positions, so existing locations stay valid
+            block_index = len(self._blocks) - 1
+            last_matrix, last_ids, last_owners, last_alive = self._blocks[-1]
+            offset = last_matrix.shape[0]
+            self._blocks[-1] = (
+                vstack([last_matrix, matrix], format='csr'),
+                np.concatenate([last_ids, ids]),
+                np.concatenate([last_owners, owners]),
+                np.concatenate([last_alive, alive])
+            )
+        else:
+            block_index = len(self._blocks)
+            offset = 0
+            self._blocks.append((matrix, ids, owners, alive))
+        
+        for row, doc_id in enumerate(self._pending_ids):
+            self._locations[doc_id] = (block_index, offset + row)
+        
+        self._pending_vectors = []
+        self._pending_ids = []
+        self._pending_owners = []
+        self._pending_set = set()
+        self._pending_block = None
+    
+    def _pending_matrix(self) -> Tuple[csr_matrix, np.ndarray, np.ndarray, np.ndarray]:
+        """The pending rows in block form, stacked once per change."""
+        if self._pending_block is None:
+            self._pending_block = (
+                vstack(self._pending_vectors, format='csr'),
+                np.array(self._pending_ids, dtype=np.int64),
+                np.array(self._pending_owners, dtype=np.int64),
+                np.ones(len(self._pending_ids), dtype=bool)
+            )
+        return self._pending_block
+    
+    def _compact(self, block_index: int):
+        """Rebuild a block without its dead rows, dropping it if none are left."""
+        matrix, ids, owners, alive = self._blocks[block_index]
+        if alive.any():
+            kept_ids = ids[alive]
+            self._blocks[block_index] = (matrix[alive], kept_ids, owners[alive], np.ones(len(kept_ids), dtype=bool))
+            for row, doc_id in enumerate(kept_ids.tolist()):
+                self._locations[doc_id] = (block_index, row)
+            return
+        
+        del self._blocks[block_index]
+        for later in range(block_index, len(self._blocks)):
+            later_ids, later_alive = self._blocks[later][1], self._blocks[later][3]
+            for row in np.flatnonzero(later_alive).tolist():
+                self._locations[int(later_ids[row])] = (later, row)
+    
+    def search(self, query: csr_matrix, k: int, owner_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Find the k documents most similar to a query vector.
+        
+        Args:
+            query: 1-row L2-normalised sparse vector
+            k: Number of results
+            owner_id: If given, only documents with this owner are considered
+        
+        Returns:
+            List of (doc_id, cosine similarity), best first
+        """
+        with self._lock:
+            query_t = query.T.tocsc()
+            candidates: List[Tuple[float, int]] = []
+            blocks = self._blocks + [self._pending_matrix()] if self._pending_ids else self._blocks
+            
+            for matrix, ids, owners, alive in blocks:
+                scores = np.asarray((matrix @ query_t).todense()).ravel()
+                
+                mask = alive if owner_id is None else alive & (owners == owner_id)
+                scores = np.where(mask, scores, -np.inf)
+                
+                top = min(k, len(scores))
+                if top == 0:
+                    continue
+                best = np.argpartition(-scores, top - 1)[:top]
+                candidates.extend(
+                    (float(scores[row]), int(ids[row]))
+                    for row in best if np.isfinite(scores[row])
+                )
+            
+            return [(doc_id, score) for score, doc_id in heapq.nlargest(k, candidates)]